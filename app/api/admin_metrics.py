@@ -0,0 +1,16 @@
+from fastapi import APIRouter, Depends
+
+from app.core.auth import get_admin_user
+from app.core.db_pool import pool_report
+from app.database import async_engine, engine
+from app.models import User
+
+router = APIRouter(prefix="/admin/metrics", tags=["admin"])
+
+
+@router.get("/db-pool", summary="DB 커넥션 풀 지표 (현재 worker 프로세스 기준)")
+def db_pool_metrics(
+    admin: User = Depends(get_admin_user),
+):
+    # 체크아웃 대기 시간 분포와 포화도. 값은 프로세스별 누적이므로 worker마다 다르다 (pid 참고)
+    return pool_report(engine.pool, async_engine.sync_engine.pool)
@@ -2,12 +2,13 @@ from datetime import datetime, timezone
 from typing import List, Optional, Tuple
 import re
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from pydantic import BaseModel, Field
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
+from app.core.etag import compute_etag, conditional_json
 from app.database import get_db
 from app.models import (
     User,
@@ -22,6 +23,7 @@ from app.models import (
 from app.schemas.analytics import RatingSummary
 from app.services.user_insights import generate_user_insight
 from app.schemas.calendar import CalendarMonthResponse, CalendarDay, CalendarBookItem
+from app.services.version_stamps import library_stamp
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -968,13 +970,20 @@ def upsert_my_insights(
 def calendar_month(
     year: int,
     month: int,
+    request: Request,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     """
     주어진 월에 사용자가 평점을 남긴 책을 캘린더에 표시합니다.
     - 평점 남긴 날짜를 기준으로 책을 표시합니다.
+    - 서재 버전 스탬프가 같으면(If-None-Match) 조회 없이 304를 돌려줍니다.
     """
+    etag = compute_etag("calendar-month", user.id, year, month, *library_stamp(db, user.id))
+    return conditional_json(request, etag, lambda: _calendar_month(db, user, year, month), private=True)
+
+
+def _calendar_month(db: Session, user: User, year: int, month: int) -> CalendarMonthResponse:
     from datetime import date
     from calendar import monthrange
 
@@ -1,13 +1,16 @@
 import re
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from datetime import date
 
 from typing import Optional, List
 from app.core.auth import get_current_user
-from app.database import get_db
+from app.core.etag import compute_etag, conditional_json
+from app.core.response_cache import book_tag, cached_json_response
+from app.database import get_async_db, get_db
 from app.models import Book, Author, BookAuthor, Review, User, BookCategory
 from app.schemas.book import (
     BookCreateRequest,
@@ -19,6 +22,7 @@ from app.schemas.book import (
     GoogleQueryImportRequest,
 )
 from app.services.google_books import get_client, map_volume_to_book_fields
+from app.services.version_stamps import book_stamp
 
 router = APIRouter(prefix="/books", tags=["books"])
 
@@ -123,7 +127,27 @@ def create_book(
 
 
 @router.get("/{book_id}", response_model=BookDetailResponse)
-def get_book_detail(book_id: int, db: Session = Depends(get_db)):
+async def get_book_detail(book_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    return await db.run_sync(_conditional_book_detail, request, book_id)
+
+
+def _conditional_book_detail(db: Session, request: Request, book_id: int):
+    # 버전 스탬프(PK 조회 한 번)로 ETag를 먼저 계산해 변경이 없으면 상세 조회 없이 304
+    stamp = book_stamp(db, book_id)
+    if stamp is None:
+        raise HTTPException(status_code=404, detail="책을 찾을 수 없습니다")
+    etag = compute_etag("book", book_id, *stamp)
+    # 캐시 키에 ETag를 넣어 스탬프와 본문이 어긋나지 않게 한다
+    return conditional_json(
+        request,
+        etag,
+        lambda: cached_json_response(
+            f"books:detail:{book_id}:{etag}", [book_tag(book_id)], lambda: _load_book_detail(db, book_id)
+        ),
+    )
+
+
+def _load_book_detail(db: Session, book_id: int) -> BookDetailResponse:
     book = db.query(Book).filter(Book.id == book_id).first()
     if not book:
         raise HTTPException(status_code=404, detail="책을 찾을 수 없습니다")
@@ -165,11 +189,15 @@ def get_book_detail(book_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/", response_model=BookSearchResponse)
-def search_books(
+async def search_books(
     q: str = Query("", description="제목/저자/출판사 부분검색"),
     limit: int = 20,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
+    return await db.run_sync(_search_books, q, limit)
+
+
+def _search_books(db: Session, q: str, limit: int) -> BookSearchResponse:
     q_like = f"%{q}%"
 
     # 제목/출판사 매칭
@@ -215,6 +243,26 @@ def search_books(
                 google_ratings_count=getattr(b, "google_ratings_count", None),
             )
         )
+    return BookSearchResponse(items=normalized)
+
+
+@router.post("/import/google", response_model=GoogleImportResult, tags=["books"])
+def import_from_google(
+    payload: GoogleImportRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    client = get_client()
+    if payload.mode == "isbn":
+        volumes = client.by_isbn(payload.isbn)
+    else:
+        if not payload.query:
+            raise HTTPException(status_code=400, detail="isbn 또는 query가 필요합니다")
+        volumes = client.by_query(payload.query)
+    created: List[BookResponse] = []
+    updated: List[BookResponse] = []
+    skipped: List[str] = []
+    for v in volumes:
         fields = map_volume_to_book_fields(v)
         isbn = fields.get("isbn")
         if not fields.get("title"):
@@ -6,7 +6,7 @@ from app.database import get_db
 from app.models import Bookmark, User, UserBook
 from app.schemas.bookmark import BookmarkCreateRequest, BookmarkResponse, BookmarkUpdateRequest
 from app.core.utils import to_seoul
-from app.services.badges import evaluate_user_badges
+from app.services.badges import enqueue_badge_evaluation
 from app.services.reading_summary import mark_summary_dirty
 
 router = APIRouter(prefix="/bookmarks", tags=["bookmarks"])
@@ -38,7 +38,7 @@ def create_bookmark(
     db.add(bookmark)
     db.commit()
     db.refresh(bookmark)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, "bookmark")
     mark_summary_dirty(db, current_user.id, payload.book_id)
     # created_date 변환 적용
     bookmark.created_date = to_seoul(bookmark.created_date)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from datetime import datetime
-import re
 from urllib.parse import quote
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -9,6 +8,9 @@ from sqlalchemy import func, or_
 from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user
+from app.core.pagination import decode_cursor, encode_cursor, tuple_after
+from app.core.responses import model_response
+from app.core.text_search import fulltext_match, like_any, uses_fulltext
 from app.database import get_db
 from app.models import (
     Author,
@@ -18,13 +20,13 @@ from app.models import (
     CollectionBook,
     CollectionLike,
     CollectionTag,
-    CollectionTagCategoryType,
     Tag,
-    TagCategory,
     NotificationType,
     User,
 )
+from app.services.counters import add_unique_row, bump_counter
 from app.services.notify import create_notification
+from app.services.tag_catalog import get_tag_catalog, invalidate_tag_catalog, normalize_tag_name
 from app.schemas.collection import (
     CollectionAddBookRequest,
     CollectionBatchAddBookRequest,
@@ -48,15 +50,6 @@ from app.schemas.collection import (
 router = APIRouter(tags=["collections"])
 
 
-SYSTEM_TAGS: list[tuple[str, str, list[str]]] = [
-    ("EMOTION", "감정", ["힐링", "감동", "눈물나는", "위로되는", "여운이남는", "따뜻한", "다정한", "먹먹한", "쓸쓸한", "벅찬", "희망적인", "설레는", "로맨틱한"]),
-    ("MOOD", "분위기", ["잔잔한", "몽환적인", "서늘한", "어두운", "긴장감있는", "몰입감있는", "속도감있는", "유쾌한", "발랄한"]),
-    ("SITUATION", "상황", ["잠들기전에읽는", "주말에읽기좋은", "카페에서읽기좋은", "여행할때읽기좋은", "출퇴근에읽기좋은"]),
-    ("READING_STYLE", "독서 스타일", ["가볍게읽기좋은", "한번에읽는", "천천히읽는", "인생책", "페이지터너", "다시읽고싶은", "곱씹게되는"]),
-    ("DIFFICULTY", "난이도", ["초보추천", "생각이많아지는", "지식이쌓이는", "시야가넓어지는", "통찰을주는", "현실적인", "철학적인", "사회적인"]),
-    ("GENRE", "장르", ["소설", "시", "에세이", "만화", "추리", "스릴러/공포", "SF", "판타지", "로맨스", "액션", "역사", "과학", "인문", "철학", "사회/정치", "경제/경영", "자기계발", "예술", "여행", "취미", "코미디"]),
-]
-
 ALLOWED_COLLECTION_SORTS = {"like", "latest"}
 
 
@@ -64,6 +57,11 @@ def _utcnow() -> datetime:
     return datetime.utcnow()
 
 
+def _bump_collection_counter(db: Session, collection_id: int, column, delta: int) -> None:
+    """Collection 카운터 컬럼을 원자적으로 증감한다. 좋아요는 수정 시각(updated_at)을 바꾸지 않는다."""
+    bump_counter(db, Collection, collection_id, column, delta, preserve=(Collection.updated_at,))
+
+
 def _default_profile_thumbnail(name: str | None) -> str:
     safe_name = quote(name or 'BookStopper')
     return f"https://ui-avatars.com/api/?name={safe_name}&background=EFE4D2&color=5B4636&size=256"
@@ -98,49 +96,9 @@ def _notify_collection_reaction(
     )
 
 
-def _normalize_tag_name(name: str) -> str:
-    s = (name or "").strip()
-    s = s.lstrip("#@").strip()
-    return re.sub(r"\s+", "", s)
-
-
-def _ensure_system_tags(db: Session) -> None:
-    existing_categories = {row.code.value: row for row in db.query(TagCategory).all()}
-    changed = False
-    for code, name, tags in SYSTEM_TAGS:
-        category = existing_categories.get(code)
-        if not category:
-            category = TagCategory(code=CollectionTagCategoryType(code), name=name)
-            db.add(category)
-            db.flush()
-            existing_categories[code] = category
-            changed = True
-        elif category.name != name:
-            category.name = name
-            changed = True
-        for tag_name in tags:
-            normalized = _normalize_tag_name(tag_name).lower()
-            tag = db.query(Tag).filter(Tag.normalized_name == normalized).first()
-            if not tag:
-                db.add(
-                    Tag(
-                        category_id=category.id,
-                        name=tag_name,
-                        normalized_name=normalized,
-                        is_system=True,
-                    )
-                )
-                changed = True
-            elif tag.category_id != category.id or not tag.is_system:
-                tag.category_id = category.id
-                tag.is_system = True
-                changed = True
-    if changed:
-        db.commit()
-
-
 def _touch_collection(collection: Collection) -> None:
-    collection.updated_at = _utcnow()
+    # 초 단위로 맞춰 DB 정밀도와 커서 값이 어긋나지 않게 한다
+    collection.updated_at = _utcnow().replace(microsecond=0)
 
 
 def _get_collection_or_404(db: Session, collection_id: int) -> Collection:
@@ -185,15 +143,15 @@ def _resolve_tag_inputs(db: Session, current_user: User, items) -> list[Tag]:
             if not tag:
                 raise HTTPException(status_code=404, detail=f"태그를 찾을 수 없습니다: {item.tagId}")
         elif item.name:
-            normalized = _normalize_tag_name(item.name).lower()
+            normalized = normalize_tag_name(item.name).lower()
             if not normalized:
                 continue
             tag = db.query(Tag).filter(Tag.normalized_name == normalized).first()
             if not tag:
                 category = None
                 if item.categoryName:
-                    category = db.query(TagCategory).filter(TagCategory.name == item.categoryName.strip()).first()
-                display_name = _normalize_tag_name(item.name)
+                    category = get_tag_catalog(db).category_by_name(item.categoryName.strip())
+                display_name = normalize_tag_name(item.name)
                 tag = Tag(
                     category_id=category.id if category else None,
                     name=display_name,
@@ -203,6 +161,7 @@ def _resolve_tag_inputs(db: Session, current_user: User, items) -> list[Tag]:
                 )
                 db.add(tag)
                 db.flush()
+                invalidate_tag_catalog()
         if tag and tag.id not in seen:
             resolved.append(tag)
             seen.add(tag.id)
@@ -220,10 +179,6 @@ def _sync_collection_tags(db: Session, collection: Collection, tags: list[Tag])
             db.add(CollectionTag(collection_id=collection.id, tag_id=tag.id))
 
 
-def _book_title_matches_query(book: Book, query: str) -> bool:
-    return query.lower() in (book.title or "").lower()
-
-
 def _collection_tag_names(db: Session, collection_id: int) -> list[str]:
     rows = (
         db.query(Tag.name)
@@ -247,44 +202,98 @@ def _collection_thumbnail_covers(db: Session, collection_id: int) -> list[str]:
     return [thumb for (thumb,) in rows if thumb]
 
 
-def _collection_book_count(db: Session, collection_id: int) -> int:
-    return (
-        db.query(func.count(CollectionBook.id))
-        .filter(CollectionBook.collection_id == collection_id)
-        .scalar()
-        or 0
-    )
+def _is_collection_liked(db: Session, collection_id: int, user_id: int) -> bool:
+    return db.query(CollectionLike.id).filter(CollectionLike.collection_id == collection_id, CollectionLike.user_id == user_id).first() is not None
 
 
-def _collection_like_count(db: Session, collection_id: int) -> int:
-    return (
-        db.query(func.count(CollectionLike.id))
-        .filter(CollectionLike.collection_id == collection_id)
-        .scalar()
-        or 0
-    )
+def _serialize_collection_list_items(
+    db: Session,
+    collections: list[Collection],
+    current_user: User,
+    has_book_id: int | None = None,
+) -> list[CollectionListItem]:
+    """컬렉션 목록을 목록 크기와 무관한 고정 횟수의 쿼리로 직렬화한다.
+
+    작성자, 대표 표지(컬렉션별 앞 5권, ROW_NUMBER), 태그, 내 좋아요 여부, (has_book_id가 있으면) 도서 포함 여부를
+    각각 한 번의 IN 쿼리로 조회하고, 도서 수/좋아요 수는 카운터 컬럼을 읽는다.
+    """
+    if not collections:
+        return []
+    collection_ids = [c.id for c in collections]
 
+    user_ids = {c.user_id for c in collections}
+    users = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
 
-def _is_collection_liked(db: Session, collection_id: int, user_id: int) -> bool:
-    return db.query(CollectionLike.id).filter(CollectionLike.collection_id == collection_id, CollectionLike.user_id == user_id).first() is not None
+    row_number = (
+        func.row_number()
+        .over(
+            partition_by=CollectionBook.collection_id,
+            order_by=(CollectionBook.sort_order.asc(), CollectionBook.id.asc()),
+        )
+        .label("rn")
+    )
+    ranked_covers = (
+        db.query(CollectionBook.collection_id.label("collection_id"), Book.thumbnail.label("thumbnail"), row_number)
+        .join(Book, Book.id == CollectionBook.book_id)
+        .filter(CollectionBook.collection_id.in_(collection_ids), Book.thumbnail.isnot(None), Book.thumbnail != "")
+        .subquery()
+    )
+    covers: dict[int, list[str]] = {}
+    for collection_id, thumbnail in (
+        db.query(ranked_covers.c.collection_id, ranked_covers.c.thumbnail)
+        .filter(ranked_covers.c.rn <= 5)
+        .order_by(ranked_covers.c.collection_id.asc(), ranked_covers.c.rn.asc())
+        .all()
+    ):
+        covers.setdefault(collection_id, []).append(thumbnail)
+
+    tag_names: dict[int, list[str]] = {}
+    for collection_id, name in (
+        db.query(CollectionTag.collection_id, Tag.name)
+        .join(Tag, Tag.id == CollectionTag.tag_id)
+        .filter(CollectionTag.collection_id.in_(collection_ids))
+        .order_by(Tag.name.asc())
+        .all()
+    ):
+        tag_names.setdefault(collection_id, []).append(name)
 
+    liked_ids = {
+        row[0]
+        for row in db.query(CollectionLike.collection_id)
+        .filter(CollectionLike.collection_id.in_(collection_ids), CollectionLike.user_id == current_user.id)
+        .all()
+    }
 
-def _serialize_collection_list_item(db: Session, collection: Collection, current_user: User, has_book: bool | None = None) -> CollectionListItem:
-    return CollectionListItem(
-        collectionId=collection.id,
-        title=collection.title,
-        description=collection.description,
-        userName=collection.user.nickname if collection.user else "",
-        profileImageUrl=collection.user.profile_image_url if collection.user else None,
-        thumbnailCovers=_collection_thumbnail_covers(db, collection.id),
-        bookCount=_collection_book_count(db, collection.id),
-        likeCount=_collection_like_count(db, collection.id),
-        tags=_collection_tag_names(db, collection.id),
-        hasBook=has_book,
-        isLiked=_is_collection_liked(db, collection.id, current_user.id),
-        isPrivate=bool(collection.is_private),
-        updatedAt=collection.updated_at,
-    )
+    with_book_ids: set[int] | None = None
+    if has_book_id is not None:
+        with_book_ids = {
+            row[0]
+            for row in db.query(CollectionBook.collection_id)
+            .filter(CollectionBook.collection_id.in_(collection_ids), CollectionBook.book_id == has_book_id)
+            .all()
+        }
+
+    items: list[CollectionListItem] = []
+    for collection in collections:
+        user = users.get(collection.user_id)
+        items.append(
+            CollectionListItem(
+                collectionId=collection.id,
+                title=collection.title,
+                description=collection.description,
+                userName=user.nickname if user else "",
+                profileImageUrl=user.profile_image_url if user else None,
+                thumbnailCovers=covers.get(collection.id, []),
+                bookCount=collection.book_count or 0,
+                likeCount=collection.like_count or 0,
+                tags=tag_names.get(collection.id, []),
+                hasBook=(collection.id in with_book_ids) if with_book_ids is not None else None,
+                isLiked=collection.id in liked_ids,
+                isPrivate=bool(collection.is_private),
+                updatedAt=collection.updated_at,
+            )
+        )
+    return items
 
 
 def _serialize_collection_detail(db: Session, collection: Collection, current_user: User) -> CollectionDetailResponse:
@@ -320,8 +329,8 @@ def _serialize_collection_detail(db: Session, collection: Collection, current_us
         userName=collection.user.nickname if collection.user else "",
         profileImageUrl=collection.user.profile_image_url if collection.user else None,
         thumbnailCovers=_collection_thumbnail_covers(db, collection.id),
-        bookCount=_collection_book_count(db, collection.id),
-        likeCount=_collection_like_count(db, collection.id),
+        bookCount=collection.book_count or 0,
+        likeCount=collection.like_count or 0,
         tags=_collection_tag_names(db, collection.id),
         isMine=collection.user_id == current_user.id,
         isLiked=_is_collection_liked(db, collection.id, current_user.id),
@@ -357,12 +366,14 @@ def _apply_book_ids(db: Session, collection: Collection, book_ids: list[int]) ->
             link.sort_order = idx
         else:
             db.add(CollectionBook(collection_id=collection.id, book_id=book_id, sort_order=idx))
+    collection.book_count = len(unique_ids)
 
 def _insert_book_at_front(db: Session, collection_id: int, book_id: int) -> None:
     links = db.query(CollectionBook).filter(CollectionBook.collection_id == collection_id).all()
     for link in links:
         link.sort_order += 1
     db.add(CollectionBook(collection_id=collection_id, book_id=book_id, sort_order=0))
+    _bump_collection_counter(db, collection_id, Collection.book_count, 1)
 
 
 @router.get("/tags/categories", response_model=TagCategoryListResponse, summary="태그 카테고리 조회")
@@ -370,7 +381,7 @@ def get_tag_categories(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    _ensure_system_tags(db)
+    catalog = get_tag_catalog(db)
     usage_rows = (
         db.query(Tag.category_id, func.count(CollectionTag.id))
         .join(CollectionTag, CollectionTag.tag_id == Tag.id)
@@ -378,13 +389,12 @@ def get_tag_categories(
         .all()
     )
     usage_map = {category_id: count for category_id, count in usage_rows}
-    rows = db.query(TagCategory).all()
-    rows.sort(key=lambda row: (-(usage_map.get(row.id, 0)), row.name))
+    rows = sorted(catalog.categories, key=lambda row: (-(usage_map.get(row.id, 0)), row.name))
     return TagCategoryListResponse(
         categories=[
             TagCategoryItem(
                 categoryId=row.id,
-                code=row.code.value,
+                code=row.code,
                 name=row.name,
                 usageCount=int(usage_map.get(row.id, 0)),
             )
@@ -401,31 +411,69 @@ def get_tags(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    _ensure_system_tags(db)
-    usage_subq = (
-        db.query(CollectionTag.tag_id.label("tag_id"), func.count(CollectionTag.id).label("usage_count"))
-        .group_by(CollectionTag.tag_id)
-        .subquery()
-    )
-    q = db.query(Tag, func.coalesce(usage_subq.c.usage_count, 0)).outerjoin(usage_subq, usage_subq.c.tag_id == Tag.id)
-    if category:
-        q = q.join(TagCategory, TagCategory.id == Tag.category_id).filter(TagCategory.name == category.strip())
-    if query:
-        token = _normalize_tag_name(query)
-        q = q.filter(Tag.name.ilike(f"%{token}%"))
-    rows = q.order_by(func.coalesce(usage_subq.c.usage_count, 0).desc(), Tag.name.asc()).limit(limit).all()
-    return TagListResponse(
-        tags=[
-            TagItem(
-                tagId=tag.id,
-                name=tag.name,
-                categoryId=tag.category_id,
-                categoryName=tag.category.name if tag.category else None,
-                isSystem=bool(tag.is_system),
-                usageCount=int(usage_count or 0),
-            )
-            for tag, usage_count in rows
-        ]
+    catalog = get_tag_catalog(db)
+    category_name = category.strip() if category else None
+    if not normalize_tag_name(query or ""):
+        return TagListResponse(tags=_popular_tags(db, catalog, category_name, limit))
+    # 후보 태그는 프로세스 캐시(접두어 인덱스)에서 고르고, DB에는 후보들의 사용 횟수만 묻는다
+    candidates = catalog.search(query)
+    if category_name:
+        candidates = [tag for tag in candidates if tag.category_name == category_name]
+    if not candidates:
+        return TagListResponse(tags=[])
+    usage_map: dict[int, int] = {}
+    candidate_ids = [tag.id for tag in candidates]
+    for start in range(0, len(candidate_ids), 1000):
+        chunk = candidate_ids[start:start + 1000]
+        usage_map.update(
+            db.query(CollectionTag.tag_id, func.count(CollectionTag.id))
+            .filter(CollectionTag.tag_id.in_(chunk))
+            .group_by(CollectionTag.tag_id)
+            .all()
+        )
+    candidates.sort(key=lambda tag: (-int(usage_map.get(tag.id, 0)), tag.name))
+    return TagListResponse(tags=[_tag_item(tag, usage_map.get(tag.id, 0)) for tag in candidates[:limit]])
+
+
+def _popular_tags(db: Session, catalog, category_name: str | None, limit: int) -> list[TagItem]:
+    """검색어가 없을 때: 사용 횟수 상위 태그를 집계 쿼리 한 번(ORDER BY usage DESC LIMIT)으로 고른다.
+
+    사용된 태그가 limit보다 적으면 사용되지 않은 태그를 이름순으로 채운다 (검색 경로와 같은 정렬).
+    """
+    category_id = None
+    if category_name:
+        entry = catalog.category_by_name(category_name)
+        if entry is None:
+            return []
+        category_id = entry.id
+    usage = func.count(CollectionTag.id).label("usage")
+    q = db.query(CollectionTag.tag_id, usage).join(Tag, Tag.id == CollectionTag.tag_id)
+    if category_id is not None:
+        q = q.filter(Tag.category_id == category_id)
+    rows = q.group_by(CollectionTag.tag_id, Tag.name).order_by(usage.desc(), Tag.name.asc()).limit(limit).all()
+    items = [_tag_item(catalog.by_id[tag_id], count) for tag_id, count in rows if tag_id in catalog.by_id]
+    if len(items) < limit:
+        used = {item.tagId for item in items}
+        unused = sorted(
+            (
+                tag
+                for tag in catalog.tags
+                if tag.id not in used and (category_id is None or tag.category_id == category_id)
+            ),
+            key=lambda tag: tag.name,
+        )
+        items.extend(_tag_item(tag, 0) for tag in unused[: limit - len(items)])
+    return items
+
+
+def _tag_item(tag, usage: int) -> TagItem:
+    return TagItem(
+        tagId=tag.id,
+        name=tag.name,
+        categoryId=tag.category_id,
+        categoryName=tag.category_name,
+        isSystem=tag.is_system,
+        usageCount=int(usage),
     )
 
 
@@ -435,7 +483,6 @@ def create_collection(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    _ensure_system_tags(db)
     title = payload.title.strip()
     if not title:
         raise HTTPException(status_code=400, detail="title은 비어 있을 수 없습니다")
@@ -445,6 +492,7 @@ def create_collection(
         description=payload.description,
         is_private=bool(payload.isPrivate),
     )
+    _touch_collection(collection)
     db.add(collection)
     db.flush()
     tags = _resolve_tag_inputs(db, current_user, payload.tags)
@@ -461,51 +509,64 @@ def list_public_collections(
     tagIds: str | None = Query(None),
     sort: str = Query("like"),
     limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description="이전 응답의 nextCursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    _ensure_system_tags(db)
     if sort not in ALLOWED_COLLECTION_SORTS:
         raise HTTPException(status_code=400, detail="sort는 like 또는 latest만 가능합니다")
     requested_tag_ids = _parse_tag_ids(tagIds)
-    collections = db.query(Collection).filter(Collection.is_private.is_(False)).all()
+    base = db.query(Collection).filter(Collection.is_private.is_(False))
     q = (query or "").strip()
-    tag_query = None
     if q.startswith("@"):
-        tag_query = _normalize_tag_name(q[1:]).lower()
+        tag_query = normalize_tag_name(q[1:]).lower()
+        tagged = (
+            db.query(CollectionTag.collection_id)
+            .join(Tag, Tag.id == CollectionTag.tag_id)
+            .filter(like_any([Tag.normalized_name], tag_query))
+        )
+        base = base.filter(Collection.id.in_(tagged))
     elif q:
-        text_query = q.lower()
-        filtered = []
-        for collection in collections:
-            title_match = text_query in (collection.title or "").lower()
-            book_match = any(_book_title_matches_query(link.book, q) for link in collection.books)
-            if title_match or book_match:
-                filtered.append(collection)
-        collections = filtered
-    if tag_query is not None:
-        filtered = []
-        for collection in collections:
-            names = [_normalize_tag_name(tag).lower() for tag in _collection_tag_names(db, collection.id)]
-            if any(tag_query in name for name in names):
-                filtered.append(collection)
-        collections = filtered
+        if uses_fulltext(db, q):
+            title_match = fulltext_match([Collection.title], q) > 0
+            book_match = fulltext_match([Book.title], q) > 0
+        else:
+            title_match = like_any([Collection.title], q)
+            book_match = like_any([Book.title], q)
+        by_book = (
+            db.query(CollectionBook.collection_id)
+            .join(Book, Book.id == CollectionBook.book_id)
+            .filter(book_match)
+        )
+        base = base.filter(or_(title_match, Collection.id.in_(by_book)))
     if requested_tag_ids:
-        requested = set(requested_tag_ids)
-        filtered = []
-        for collection in collections:
-            current_tag_ids = {row.tag_id for row in db.query(CollectionTag.tag_id).filter(CollectionTag.collection_id == collection.id).all()}
-            if requested.issubset(current_tag_ids):
-                filtered.append(collection)
-        collections = filtered
+        # 요청한 태그를 모두 가진 컬렉션만 (GROUP BY ... HAVING COUNT = n)
+        unique_tag_ids = set(requested_tag_ids)
+        all_tagged = (
+            db.query(CollectionTag.collection_id)
+            .filter(CollectionTag.tag_id.in_(unique_tag_ids))
+            .group_by(CollectionTag.collection_id)
+            .having(func.count(func.distinct(CollectionTag.tag_id)) == len(unique_tag_ids))
+        )
+        base = base.filter(Collection.id.in_(all_tagged))
+
     if sort == "latest":
-        collections.sort(key=lambda row: (row.updated_at, row.id), reverse=True)
+        keys = [Collection.updated_at, Collection.id]
     else:
-        collections.sort(key=lambda row: (_collection_like_count(db, row.id), row.updated_at, row.id), reverse=True)
-    collections = collections[:limit]
-    return CollectionListResponse(
-        totalCount=len(collections),
-        collections=[_serialize_collection_list_item(db, row, current_user) for row in collections],
-    )
+        keys = [Collection.like_count, Collection.updated_at, Collection.id]
+    last = decode_cursor(cursor, len(keys))
+    if last is not None:
+        base = base.filter(tuple_after(keys, last))
+    rows = base.order_by(*[key.desc() for key in keys]).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([getattr(rows[-1], key.key) for key in keys])
+    return model_response(CollectionListResponse(
+        totalCount=len(rows),
+        collections=_serialize_collection_list_items(db, rows, current_user),
+        nextCursor=next_cursor,
+    ))
 
 
 @router.get("/collections/{collection_id}", response_model=CollectionDetailResponse, summary="컬렉션 상세 조회")
@@ -526,7 +587,6 @@ def update_collection(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    _ensure_system_tags(db)
     collection = _get_collection_or_404(db, collection_id)
     _ensure_collection_owner(collection, current_user)
     payload_data = payload.model_dump(exclude_unset=True)
@@ -574,13 +634,8 @@ def my_collections(
         .order_by(Collection.updated_at.desc(), Collection.id.desc())
         .all()
     )
-    items = []
-    for row in rows:
-        has_book = None
-        if bookId is not None:
-            has_book = db.query(CollectionBook.id).filter(CollectionBook.collection_id == row.id, CollectionBook.book_id == bookId).first() is not None
-        items.append(_serialize_collection_list_item(db, row, current_user, has_book=has_book))
-    return CollectionListResponse(totalCount=len(items), collections=items)
+    items = _serialize_collection_list_items(db, rows, current_user, has_book_id=bookId)
+    return model_response(CollectionListResponse(totalCount=len(items), collections=items))
 
 
 @router.get("/users/me/likes/collections", response_model=CollectionListResponse, summary="좋아요한 컬렉션")
@@ -595,10 +650,10 @@ def my_liked_collections(
         .order_by(CollectionLike.created_at.desc(), Collection.id.desc())
         .all()
     )
-    return CollectionListResponse(
+    return model_response(CollectionListResponse(
         totalCount=len(rows),
-        collections=[_serialize_collection_list_item(db, row, current_user) for row in rows],
-    )
+        collections=_serialize_collection_list_items(db, rows, current_user),
+    ))
 
 
 @router.get("/books/{book_id}/collections", response_model=CollectionListResponse, summary="도서가 담긴 공개 컬렉션 목록")
@@ -611,13 +666,13 @@ def collections_by_book(
         db.query(Collection)
         .join(CollectionBook, CollectionBook.collection_id == Collection.id)
         .filter(CollectionBook.book_id == book_id, Collection.is_private.is_(False))
+        .order_by(Collection.like_count.desc(), Collection.updated_at.desc(), Collection.id.desc())
         .all()
     )
-    rows.sort(key=lambda row: (_collection_like_count(db, row.id), row.updated_at, row.id), reverse=True)
-    return CollectionListResponse(
+    return model_response(CollectionListResponse(
         totalCount=len(rows),
-        collections=[_serialize_collection_list_item(db, row, current_user) for row in rows],
-    )
+        collections=_serialize_collection_list_items(db, rows, current_user),
+    ))
 
 
 @router.post("/collections/{collection_id}/books", response_model=CollectionSimpleResponse, summary="컬렉션에 도서 추가")
@@ -662,6 +717,7 @@ def remove_book_from_collection(
     )
     for idx, item in enumerate(remaining):
         item.sort_order = idx
+    collection.book_count = len(remaining)
     _touch_collection(collection)
     db.commit()
     return CollectionSimpleResponse(ok=True, collectionId=collection_id)
@@ -723,10 +779,10 @@ def like_collection(
     collection = _get_collection_or_404(db, collection_id)
     if collection.is_private:
         raise HTTPException(status_code=403, detail="비공개 컬렉션에는 좋아요를 할 수 없습니다")
-    like = db.query(CollectionLike).filter(CollectionLike.collection_id == collection_id, CollectionLike.user_id == current_user.id).first()
-    if not like:
-        db.add(CollectionLike(collection_id=collection_id, user_id=current_user.id))
+    if add_unique_row(db, CollectionLike(collection_id=collection_id, user_id=current_user.id)):
+        _bump_collection_counter(db, collection_id, Collection.like_count, 1)
         db.commit()
+        db.refresh(collection)
 
         _notify_collection_reaction(
             db,
@@ -735,7 +791,7 @@ def like_collection(
             body='내 컬렉션에 좋아요가 추가됐어요.',
             event_kind='COLLECTION_LIKE',
         )
-    return CollectionLikeResponse(ok=True, isLiked=True, likeCount=_collection_like_count(db, collection_id))
+    return CollectionLikeResponse(ok=True, isLiked=True, likeCount=collection.like_count or 0)
 
 
 @router.delete("/collections/{collection_id}/like", response_model=CollectionLikeResponse, summary="컬렉션 좋아요 취소")
@@ -746,9 +802,14 @@ def unlike_collection(
 ):
     collection = _get_collection_or_404(db, collection_id)
     _ensure_collection_readable(collection, current_user)
-    like = db.query(CollectionLike).filter(CollectionLike.collection_id == collection_id, CollectionLike.user_id == current_user.id).first()
-    if like:
-        db.delete(like)
+    deleted = (
+        db.query(CollectionLike)
+        .filter(CollectionLike.collection_id == collection_id, CollectionLike.user_id == current_user.id)
+        .delete(synchronize_session=False)
+    )
+    if deleted:
+        _bump_collection_counter(db, collection_id, Collection.like_count, -deleted)
         db.commit()
-    return CollectionLikeResponse(ok=True, isLiked=False, likeCount=_collection_like_count(db, collection_id))
+        db.refresh(collection)
+    return CollectionLikeResponse(ok=True, isLiked=False, likeCount=collection.like_count or 0)
 
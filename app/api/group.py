@@ -3,7 +3,7 @@ from datetime import datetime
 from urllib.parse import quote
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func, or_
 
 from ..database import get_db
 from ..models import (
@@ -29,7 +29,11 @@ from ..models import (
     NotificationType,
 )
 from ..core.auth import get_current_user
+from ..core.pagination import decode_cursor, encode_cursor
+from ..core.text_search import fulltext_match, like_any, uses_fulltext
 from ..core.security import hash_password, verify_password
+from ..services.counters import add_unique_row, bump_counter
+from ..services.group_activity import bump_group_counter
 from ..services.notify import create_notification
 from ..schemas.group import (
     GroupCreateRequest,
@@ -54,6 +58,7 @@ from ..schemas.group import (
     GroupCommentCreateRequest,
     GroupCommentItem,
     GroupCommentReply,
+    GroupCommentReplyListResponse,
     GroupDiscussionVoteRequest,
     GroupReportReasonItem,
     GroupReportReasonListResponse,
@@ -125,6 +130,7 @@ def create_group(
     )
     db.add(group)
     db.flush()
+    group.member_count = 1
     leader = GroupMember(
         group_id=group.id,
         user_id=current_user.id,
@@ -147,17 +153,40 @@ def create_group(
     )
 
 
-def _progress_percent(db: Session, user_id: int, book_id: int, total_pages: int | None) -> float:
-    max_end_page = (
-        db.query(func.max(ReadingSession.end_page))
-        .filter(ReadingSession.user_id == user_id, ReadingSession.book_id == book_id)
-        .scalar()
-    )
+def _progress_percent_of(max_end_page: int | None, total_pages: int | None) -> float:
     if not max_end_page or not total_pages:
         return 0.0
     return round((float(max_end_page) / float(total_pages)) * 100.0, 2)
 
 
+def _max_end_pages(db: Session, user_ids: list[int], book_ids: list[int]) -> dict[tuple[int, int], int]:
+    """(user_id, book_id)별 최대 end_page를 한 번의 집계 쿼리로 조회한다."""
+    if not user_ids or not book_ids:
+        return {}
+    rows = (
+        db.query(ReadingSession.user_id, ReadingSession.book_id, func.max(ReadingSession.end_page))
+        .filter(ReadingSession.user_id.in_(user_ids), ReadingSession.book_id.in_(book_ids))
+        .group_by(ReadingSession.user_id, ReadingSession.book_id)
+        .all()
+    )
+    return {(user_id, book_id): max_end for user_id, book_id, max_end in rows if max_end is not None}
+
+
+def _book_author_names(db: Session, book_ids: list[int]) -> dict[int, list[str]]:
+    if not book_ids:
+        return {}
+    names: dict[int, list[str]] = {}
+    rows = (
+        db.query(BookAuthor.book_id, Author.name)
+        .join(Author, BookAuthor.author_id == Author.id)
+        .filter(BookAuthor.book_id.in_(book_ids))
+        .all()
+    )
+    for book_id, name in rows:
+        names.setdefault(book_id, []).append(name)
+    return names
+
+
 def _require_member(db: Session, group: Group, user_id: int) -> GroupMember:
     member = (
         db.query(GroupMember)
@@ -405,6 +434,83 @@ def _serialize_discussion(db: Session, post: GroupPost, user_id: int) -> dict |
 _GROUP_REPORT_REASON_CODES = {item["code"] for item in GROUP_REPORT_REASON_OPTIONS}
 
 
+def _batch_post_stats(db: Session, posts: list[GroupPost], user_id: int):
+    """게시글 목록의 내 좋아요 여부/작성자를 게시글 수와 무관한 고정 횟수의 쿼리로 조회한다 (좋아요/댓글 수는 카운터 컬럼)."""
+    post_ids = [p.id for p in posts]
+    if not post_ids:
+        return set(), {}
+    liked_ids = {
+        row[0]
+        for row in db.query(GroupPostLike.post_id)
+        .filter(GroupPostLike.post_id.in_(post_ids), GroupPostLike.user_id == user_id)
+        .all()
+    }
+    author_ids = {p.user_id for p in posts}
+    authors = {u.id: u for u in db.query(User).filter(User.id.in_(author_ids)).all()}
+    return liked_ids, authors
+
+
+def _serialize_post_list(db: Session, group: Group, posts: list[GroupPost], user_id: int, *, with_discussion: bool = False) -> list[GroupPostBase]:
+    liked_ids, authors = _batch_post_stats(db, posts, user_id)
+    results: list[GroupPostBase] = []
+    for post in posts:
+        author = authors.get(post.user_id)
+        results.append(
+            GroupPostBase(
+                postId=post.id,
+                groupId=group.group_id,
+                type=post.post_type.value,
+                title=post.title,
+                content=post.content,
+                bookId=post.book_id,
+                createdAt=post.created_at,
+                isPinned=post.is_pinned,
+                pinnedAt=post.pinned_at,
+                authorId=post.user_id,
+                authorName=author.nickname if author else "",
+                profileImageUrl=author.profile_image_url if author else None,
+                likeCount=post.like_count,
+                commentCount=post.comment_count,
+                isLiked=post.id in liked_ids,
+                records=_serialize_group_post_records(post),
+                discussion=_serialize_discussion(db, post, user_id) if with_discussion else None,
+            )
+        )
+    return results
+
+
+def _comment_context(db: Session, comments: list[GroupComment], user_id: int) -> tuple[dict[int, User], set[int]]:
+    """댓글 목록의 작성자와 내가 좋아요한 댓글 id 집합을 각각 한 번의 IN 쿼리로 조회한다."""
+    if not comments:
+        return {}, set()
+    user_ids = {c.user_id for c in comments}
+    user_map = {u.id: u for u in db.query(User).filter(User.id.in_(user_ids)).all()}
+    liked_ids = {
+        row[0]
+        for row in db.query(GroupCommentLike.comment_id)
+        .filter(
+            GroupCommentLike.comment_id.in_([c.id for c in comments]),
+            GroupCommentLike.user_id == user_id,
+        )
+        .all()
+    }
+    return user_map, liked_ids
+
+
+def _comment_fields(comment: GroupComment, user_map: dict[int, User], liked_ids: set[int]) -> dict:
+    user = user_map.get(comment.user_id)
+    return {
+        "commentId": comment.id,
+        "userId": comment.user_id,
+        "userName": user.nickname if user else "",
+        "profileImageUrl": user.profile_image_url if user else None,
+        "content": comment.content,
+        "createdAt": comment.created_at,
+        "likeCount": comment.like_count or 0,
+        "isLiked": comment.id in liked_ids,
+    }
+
+
 def _validate_report_reason(payload: GroupReportRequest) -> None:
     if payload.reasonCode not in _GROUP_REPORT_REASON_CODES:
         raise HTTPException(status_code=400, detail="Invalid report reason code")
@@ -412,36 +518,63 @@ def _validate_report_reason(payload: GroupReportRequest) -> None:
         raise HTTPException(status_code=400, detail="reasonDetail is required for OTHER")
 
 
+def _group_search_relevance(db: Session, term: str):
+    """(검색 조건, 관련도 식)을 돌려준다.
+
+    MySQL에서는 ngram FULLTEXT 인덱스(ft_groups_name_group_id)로 부분 문자열을 찾고, 그 밖의 DB(테스트용 sqlite)나
+    한 글자 검색어는 인덱스를 탈 수 있는 접두어 LIKE로 찾는다.
+    """
+    columns = [Group.name, Group.group_id]
+    if uses_fulltext(db, term):
+        relevance = fulltext_match(columns, term)
+        return relevance > 0, relevance
+    relevance = case(
+        (or_(Group.name == term, Group.group_id == term), 3),
+        (like_any([Group.name], term, prefix_only=True), 2),
+        else_=1,
+    )
+    return like_any(columns, term, prefix_only=True), relevance
+
+
 @router.get("/search", response_model=GroupSearchResponse, summary="그룹 검색")
 def search_groups(
     query: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=50),
+    cursor: str | None = Query(default=None, description="이전 응답의 nextCursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     term = query.strip()
+    if not term:
+        return GroupSearchResponse(groups=[])
+    last = decode_cursor(cursor, 1)
+    offset = int(last[0]) if last is not None else 0
+
+    condition, relevance = _group_search_relevance(db, term)
     groups = (
         db.query(Group)
-        .filter(
-            Group.name.ilike(f"%{term}%")
-            | Group.group_id.ilike(f"%{term}%")
-        )
+        .filter(condition)
+        .order_by(relevance.desc(), Group.activity_score.desc(), Group.id.desc())
+        .offset(offset)
+        .limit(limit + 1)
         .all()
     )
-    items = []
-    for g in groups:
-        member_count = db.query(GroupMember).filter(GroupMember.group_id == g.id).count()
-        items.append(
-            GroupSearchItem(
-                groupId=g.group_id,
-                name=g.name,
-                backgroundImage=g.background_image,
-                description=g.description,
-                memberCount=member_count,
-                maxMembers=g.max_members,
-            )
+    next_cursor = None
+    if len(groups) > limit:
+        groups = groups[:limit]
+        next_cursor = encode_cursor([offset + limit])
+    items = [
+        GroupSearchItem(
+            groupId=g.group_id,
+            name=g.name,
+            backgroundImage=g.background_image,
+            description=g.description,
+            memberCount=g.member_count,
+            maxMembers=g.max_members,
         )
-    return GroupSearchResponse(groups=items)
-
+        for g in groups
+    ]
+    return GroupSearchResponse(groups=items, nextCursor=next_cursor)
 
 
 @router.get("/report-reasons", response_model=GroupReportReasonListResponse, summary="신고 사유 목록")
@@ -458,25 +591,24 @@ def group_recommendations(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    groups = db.query(Group).filter(Group.is_private == False).all()  # noqa: E712
-    scored = []
-    for g in groups:
-        member_count = db.query(GroupMember).filter(GroupMember.group_id == g.id).count()
-        post_count = db.query(GroupPost).filter(GroupPost.group_id == g.id).count()
-        comment_count = db.query(GroupComment).join(GroupPost, GroupComment.post_id == GroupPost.id).filter(GroupPost.group_id == g.id).count()
-        score = member_count + post_count + comment_count
-        scored.append((score, g, member_count))
-    scored.sort(key=lambda x: x[0], reverse=True)
+    # activity_score는 워커가 주기적으로 재계산하는 시간 감쇠 점수 (ix_groups_public_activity)
+    groups = (
+        db.query(Group)
+        .filter(Group.is_private == False)  # noqa: E712
+        .order_by(Group.activity_score.desc(), Group.id.desc())
+        .limit(limit)
+        .all()
+    )
     items = [
         GroupRecommendationItem(
             groupId=g.group_id,
             name=g.name,
             backgroundImage=g.background_image,
             description=g.description,
-            memberCount=member_count,
+            memberCount=g.member_count,
             maxMembers=g.max_members,
         )
-        for _, g, member_count in scored[:limit]
+        for g in groups
     ]
     return GroupRecommendationResponse(groups=items)
 
@@ -514,10 +646,15 @@ def get_group_detail(
 
     total_pages = current_mission_book.total_pages if current_mission_book else None
 
+    # 멤버 × 미션책 진행률은 집계 쿼리 한 번으로 조회
+    member_user_ids = [user.id for _, user in members]
+    mission_book_ids = list({book.id for _, book in mission_rows})
+    max_pages = _max_end_pages(db, list({*member_user_ids, current_user.id}), mission_book_ids)
+
     for gm, user in members:
         progress = 0.0
         if current_mission_book:
-            progress = _progress_percent(db, user.id, current_mission_book.id, total_pages)
+            progress = _progress_percent_of(max_pages.get((user.id, current_mission_book.id)), total_pages)
         member_infos.append(
             GroupMemberInfo(
                 memberId=user.id,
@@ -531,27 +668,21 @@ def get_group_detail(
     is_joined = any(m.user_id == current_user.id for m, _ in members)
     is_leader = group.leader_user_id == current_user.id
 
+    author_names_by_book = _book_author_names(db, mission_book_ids)
     for index, (_, mission_book) in enumerate(mission_rows):
-        authors = (
-            db.query(Author.name)
-            .join(BookAuthor, BookAuthor.author_id == Author.id)
-            .filter(BookAuthor.book_id == mission_book.id)
-            .all()
-        )
-        author_names = [a[0] for a in authors]
         group_avg = 0.0
-        progress_values = []
-        for _, user in members:
-            progress = _progress_percent(db, user.id, mission_book.id, mission_book.total_pages)
-            progress_values.append(progress)
+        progress_values = [
+            _progress_percent_of(max_pages.get((user_id, mission_book.id)), mission_book.total_pages)
+            for user_id in member_user_ids
+        ]
         if progress_values:
             group_avg = round(sum(progress_values) / len(progress_values), 2)
-        my_progress = _progress_percent(db, current_user.id, mission_book.id, mission_book.total_pages)
+        my_progress = _progress_percent_of(max_pages.get((current_user.id, mission_book.id)), mission_book.total_pages)
         mission_info = GroupMissionBookInfo(
             bookId=mission_book.id,
             isbn13=mission_book.isbn_13,
             title=mission_book.title,
-            authors=author_names,
+            authors=author_names_by_book.get(mission_book.id, []),
             thumbnail=mission_book.thumbnail,
             totalPages=mission_book.total_pages,
             groupAverageProgressPercent=group_avg,
@@ -754,6 +885,7 @@ def get_group_member_profile(
         .order_by(GroupMonthlyBook.created_at.desc(), GroupMonthlyBook.id.desc())
         .all()
     )
+    max_pages = _max_end_pages(db, [user.id], list({book.id for _, book in mission_rows}))
     mission_books = [
         GroupMemberProfileMissionBookItem(
             month=gb.month,
@@ -761,7 +893,7 @@ def get_group_member_profile(
             isbn13=book.isbn_13,
             title=book.title,
             thumbnail=book.thumbnail,
-            progressPercent=_progress_percent(db, user.id, book.id, book.total_pages),
+            progressPercent=_progress_percent_of(max_pages.get((user.id, book.id)), book.total_pages),
             boardBookId=book.id,
         )
         for gb, book in mission_rows
@@ -796,39 +928,7 @@ def list_announcements(
         )
         .all()
     )
-    results: list[GroupPostBase] = []
-    for post in posts:
-        like_count = db.query(GroupPostLike.id).filter(GroupPostLike.post_id == post.id).count()
-        comment_count = db.query(GroupComment.id).filter(GroupComment.post_id == post.id).count()
-        is_liked = (
-            db.query(GroupPostLike.id)
-            .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
-            .first()
-            is not None
-        )
-        author = db.query(User).filter(User.id == post.user_id).first()
-        results.append(
-            GroupPostBase(
-                postId=post.id,
-                groupId=group.group_id,
-                type=post.post_type.value,
-                title=post.title,
-                content=post.content,
-                bookId=post.book_id,
-                createdAt=post.created_at,
-                isPinned=post.is_pinned,
-                pinnedAt=post.pinned_at,
-                authorId=post.user_id,
-                authorName=author.nickname if author else "",
-                profileImageUrl=author.profile_image_url if author else None,
-                likeCount=like_count,
-                commentCount=comment_count,
-                isLiked=is_liked,
-                records=_serialize_group_post_records(post),
-                discussion=_serialize_discussion(db, post, current_user.id),
-            )
-        )
-    return GroupPostListResponse(posts=results)
+    return GroupPostListResponse(posts=_serialize_post_list(db, group, posts, current_user.id, with_discussion=True))
 
 
 @router.post("/{groupId}/announcements", response_model=GroupPostBase, summary="공지사항 작성")
@@ -853,6 +953,7 @@ def create_announcement(
         discussion=_normalize_discussion_payload(payload.discussion),
     )
     db.add(post)
+    bump_group_counter(db, group.id, Group.post_count, 1)
     db.commit()
     db.refresh(post)
 
@@ -910,8 +1011,6 @@ def pin_announcement(
     db.commit()
     db.refresh(post)
 
-    like_count = db.query(GroupPostLike.id).filter(GroupPostLike.post_id == post.id).count()
-    comment_count = db.query(GroupComment.id).filter(GroupComment.post_id == post.id).count()
     is_liked = (
         db.query(GroupPostLike.id)
         .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
@@ -932,8 +1031,8 @@ def pin_announcement(
         authorId=post.user_id,
         authorName=author.nickname if author else "",
         profileImageUrl=author.profile_image_url if author else None,
-        likeCount=like_count,
-        commentCount=comment_count,
+        likeCount=post.like_count,
+        commentCount=post.comment_count,
         isLiked=is_liked,
         discussion=_serialize_discussion(db, post, current_user.id),
         recordId=post.record_id,
@@ -953,8 +1052,6 @@ def get_group_post_detail(
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
 
-    like_count = db.query(GroupPostLike.id).filter(GroupPostLike.post_id == post.id).count()
-    comment_count = db.query(GroupComment.id).filter(GroupComment.post_id == post.id).count()
     is_liked = (
         db.query(GroupPostLike.id)
         .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
@@ -975,8 +1072,8 @@ def get_group_post_detail(
         authorId=post.user_id,
         authorName=author.nickname if author else "",
         profileImageUrl=author.profile_image_url if author else None,
-        likeCount=like_count,
-        commentCount=comment_count,
+        likeCount=post.like_count,
+        commentCount=post.comment_count,
         isLiked=is_liked,
         discussion=_serialize_discussion(db, post, current_user.id),
         recordId=post.record_id,
@@ -1028,8 +1125,6 @@ def update_group_post(
             thumbnail_url=post.book.thumbnail if post.book else None,
         )
 
-    like_count = db.query(GroupPostLike.id).filter(GroupPostLike.post_id == post.id).count()
-    comment_count = db.query(GroupComment.id).filter(GroupComment.post_id == post.id).count()
     is_liked = (
         db.query(GroupPostLike.id)
         .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
@@ -1050,8 +1145,8 @@ def update_group_post(
         authorId=post.user_id,
         authorName=author.nickname if author else "",
         profileImageUrl=author.profile_image_url if author else None,
-        likeCount=like_count,
-        commentCount=comment_count,
+        likeCount=post.like_count,
+        commentCount=post.comment_count,
         isLiked=is_liked,
         discussion=_serialize_discussion(db, post, current_user.id),
         recordId=post.record_id,
@@ -1075,7 +1170,10 @@ def delete_group_post(
             raise HTTPException(status_code=403, detail="Only leader can delete announcements")
     elif post.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Only author can delete post")
+    comment_count = post.comment_count
     db.delete(post)
+    bump_group_counter(db, group.id, Group.post_count, -1)
+    bump_group_counter(db, group.id, Group.comment_count, -comment_count)
     db.commit()
     return {"ok": True}
 
@@ -1085,6 +1183,8 @@ def list_group_posts(
     groupId: str,
     type: str | None = Query(default=None, description="MISSION or FREE"),
     bookId: int | None = Query(default=None, description="미션 게시판용 bookId 필터"),
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 nextCursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -1101,40 +1201,21 @@ def list_group_posts(
         q = q.filter(GroupPost.post_type == GroupPostType[type_upper])
     if bookId is not None:
         q = q.filter(GroupPost.book_id == bookId)
-    posts = q.order_by(GroupPost.created_at.desc(), GroupPost.id.desc()).all()
-
-    results: list[GroupPostBase] = []
-    for post in posts:
-        like_count = db.query(GroupPostLike.id).filter(GroupPostLike.post_id == post.id).count()
-        comment_count = db.query(GroupComment.id).filter(GroupComment.post_id == post.id).count()
-        is_liked = (
-            db.query(GroupPostLike.id)
-            .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
-            .first()
-            is not None
-        )
-        author = db.query(User).filter(User.id == post.user_id).first()
-        results.append(
-            GroupPostBase(
-                postId=post.id,
-                groupId=group.group_id,
-                type=post.post_type.value,
-                title=post.title,
-                content=post.content,
-                bookId=post.book_id,
-                createdAt=post.created_at,
-                isPinned=post.is_pinned,
-                pinnedAt=post.pinned_at,
-                authorId=post.user_id,
-                authorName=author.nickname if author else "",
-                profileImageUrl=author.profile_image_url if author else None,
-                likeCount=like_count,
-                commentCount=comment_count,
-                isLiked=is_liked,
-                records=_serialize_group_post_records(post),
-            )
-        )
-    return GroupPostListResponse(posts=results)
+    # id는 작성 순서대로 증가하므로 (created_at, id) 정렬과 같다. created_at은 초 단위로 저장되어
+    # 커서 비교가 정밀도 차이로 어긋날 수 있어 id만 키로 쓴다.
+    last = decode_cursor(cursor, 1)
+    if last is not None:
+        q = q.filter(GroupPost.id < last[0])
+    posts = q.order_by(GroupPost.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(posts) > limit:
+        posts = posts[:limit]
+        next_cursor = encode_cursor([posts[-1].id])
+    return GroupPostListResponse(
+        posts=_serialize_post_list(db, group, posts, current_user.id),
+        nextCursor=next_cursor,
+    )
 
 
 @router.post("/{groupId}/posts", response_model=GroupPostBase, summary="게시글 작성")
@@ -1174,6 +1255,7 @@ def create_group_post(
         discussion=_normalize_discussion_payload(payload.discussion),
     )
     db.add(post)
+    bump_group_counter(db, group.id, Group.post_count, 1)
     db.commit()
     db.refresh(post)
 
@@ -1254,6 +1336,7 @@ def share_group_post(
         discussion=_normalize_discussion_payload(payload.discussion),
     )
     db.add(post)
+    bump_group_counter(db, group.id, Group.post_count, 1)
     db.commit()
     db.refresh(post)
 
@@ -1404,13 +1487,8 @@ def like_post(
         raise HTTPException(status_code=404, detail="Post not found")
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
-    exists = (
-        db.query(GroupPostLike.id)
-        .filter(GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id)
-        .first()
-    )
-    if not exists:
-        db.add(GroupPostLike(post_id=post.id, user_id=current_user.id))
+    if add_unique_row(db, GroupPostLike(post_id=post.id, user_id=current_user.id)):
+        bump_counter(db, GroupPost, post.id, GroupPost.like_count, 1)
         db.commit()
         _notify_group_post_interaction(
             db,
@@ -1434,9 +1512,10 @@ def unlike_post(
         raise HTTPException(status_code=404, detail="Post not found")
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
-    db.query(GroupPostLike).filter(
+    deleted = db.query(GroupPostLike).filter(
         GroupPostLike.post_id == post.id, GroupPostLike.user_id == current_user.id
-    ).delete()
+    ).delete(synchronize_session=False)
+    bump_counter(db, GroupPost, post.id, GroupPost.like_count, -deleted)
     db.commit()
     return {"ok": True}
 
@@ -1444,6 +1523,9 @@ def unlike_post(
 @router.get("/posts/{postId}/comments", response_model=GroupCommentListResponse, summary="댓글 리스트")
 def list_post_comments(
     postId: int,
+    limit: int = Query(default=20, ge=1, le=100, description="최상위 댓글 개수"),
+    cursor: str | None = Query(default=None, description="이전 응답의 nextCursor"),
+    replyLimit: int = Query(default=3, ge=0, le=50, description="댓글마다 미리 보여줄 답글 개수"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -1453,67 +1535,91 @@ def list_post_comments(
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
 
-    comments = (
-        db.query(GroupComment)
-        .filter(GroupComment.post_id == post.id)
-        .order_by(GroupComment.created_at.asc(), GroupComment.id.asc())
-        .all()
-    )
-    by_parent: dict[int | None, list[GroupComment]] = {}
-    for c in comments:
-        by_parent.setdefault(c.parent_id, []).append(c)
-
-    comment_user_ids = {c.user_id for c in comments}
-    user_map = {
-        u.id: u
-        for u in db.query(User).filter(User.id.in_(comment_user_ids)).all()
-    } if comment_user_ids else {}
-
-    def build_item(c: GroupComment) -> GroupCommentItem:
-        like_count = db.query(GroupCommentLike.id).filter(GroupCommentLike.comment_id == c.id).count()
-        is_liked = (
-            db.query(GroupCommentLike.id)
-            .filter(GroupCommentLike.comment_id == c.id, GroupCommentLike.user_id == current_user.id)
-            .first()
-            is not None
+    # 최상위 댓글은 작성순(id 오름차순)으로 페이지네이션
+    q = db.query(GroupComment).filter(GroupComment.post_id == post.id, GroupComment.parent_id.is_(None))
+    last = decode_cursor(cursor, 1)
+    if last is not None:
+        q = q.filter(GroupComment.id > last[0])
+    comments = q.order_by(GroupComment.id.asc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(comments) > limit:
+        comments = comments[:limit]
+        next_cursor = encode_cursor([comments[-1].id])
+
+    comment_ids = [c.id for c in comments]
+    reply_counts: dict[int, int] = {}
+    previews: dict[int, list[GroupComment]] = {}
+    if comment_ids:
+        reply_counts = dict(
+            db.query(GroupComment.parent_id, func.count(GroupComment.id))
+            .filter(GroupComment.parent_id.in_(comment_ids))
+            .group_by(GroupComment.parent_id)
+            .all()
         )
-        user = user_map.get(c.user_id)
-        replies = []
-        for r in by_parent.get(c.id, []):
-            r_like = db.query(GroupCommentLike.id).filter(GroupCommentLike.comment_id == r.id).count()
-            r_is_liked = (
-                db.query(GroupCommentLike.id)
-                .filter(GroupCommentLike.comment_id == r.id, GroupCommentLike.user_id == current_user.id)
-                .first()
-                is not None
+        if replyLimit:
+            row_number = (
+                func.row_number()
+                .over(partition_by=GroupComment.parent_id, order_by=GroupComment.id.asc())
+                .label("rn")
+            )
+            ranked = (
+                db.query(GroupComment.id.label("reply_id"), row_number)
+                .filter(GroupComment.parent_id.in_(comment_ids))
+                .subquery()
             )
-            r_user = user_map.get(r.user_id)
-            replies.append(
-                GroupCommentReply(
-                    commentId=r.id,
-                    userId=r.user_id,
-                    userName=r_user.nickname if r_user else "",
-                    profileImageUrl=r_user.profile_image_url if r_user else None,
-                    content=r.content,
-                    createdAt=r.created_at,
-                    likeCount=r_like,
-                    isLiked=r_is_liked,
-                )
+            replies = (
+                db.query(GroupComment)
+                .join(ranked, ranked.c.reply_id == GroupComment.id)
+                .filter(ranked.c.rn <= replyLimit)
+                .order_by(GroupComment.id.asc())
+                .all()
             )
-        return GroupCommentItem(
-            commentId=c.id,
-            userId=c.user_id,
-            userName=user.nickname if user else "",
-            profileImageUrl=user.profile_image_url if user else None,
-            content=c.content,
-            createdAt=c.created_at,
-            likeCount=like_count,
-            isLiked=is_liked,
-            replies=replies,
+            for r in replies:
+                previews.setdefault(r.parent_id, []).append(r)
+
+    all_comments = comments + [r for rs in previews.values() for r in rs]
+    user_map, liked_ids = _comment_context(db, all_comments, current_user.id)
+    items = [
+        GroupCommentItem(
+            **_comment_fields(c, user_map, liked_ids),
+            replies=[GroupCommentReply(**_comment_fields(r, user_map, liked_ids)) for r in previews.get(c.id, [])],
+            replyCount=reply_counts.get(c.id, 0),
         )
+        for c in comments
+    ]
+    return GroupCommentListResponse(comments=items, nextCursor=next_cursor)
 
-    items = [build_item(c) for c in by_parent.get(None, [])]
-    return GroupCommentListResponse(comments=items)
+
+@router.get("/comments/{commentId}/replies", response_model=GroupCommentReplyListResponse, summary="답글 리스트")
+def list_comment_replies(
+    commentId: int,
+    limit: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(default=None, description="이전 응답의 nextCursor"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    parent = db.query(GroupComment).filter(GroupComment.id == commentId).first()
+    if not parent:
+        raise HTTPException(status_code=404, detail="Comment not found")
+    post = db.query(GroupPost).filter(GroupPost.id == parent.post_id).first()
+    group = db.query(Group).filter(Group.id == post.group_id).first()
+    _require_member(db, group, current_user.id)
+
+    q = db.query(GroupComment).filter(GroupComment.parent_id == parent.id)
+    last = decode_cursor(cursor, 1)
+    if last is not None:
+        q = q.filter(GroupComment.id > last[0])
+    replies = q.order_by(GroupComment.id.asc()).limit(limit + 1).all()
+    next_cursor = None
+    if len(replies) > limit:
+        replies = replies[:limit]
+        next_cursor = encode_cursor([replies[-1].id])
+
+    user_map, liked_ids = _comment_context(db, replies, current_user.id)
+    return GroupCommentReplyListResponse(
+        replies=[GroupCommentReply(**_comment_fields(r, user_map, liked_ids)) for r in replies],
+        nextCursor=next_cursor,
+    )
 
 
 @router.post("/posts/{postId}/comments", response_model=GroupCommentItem, summary="댓글 작성")
@@ -1531,6 +1637,8 @@ def create_post_comment(
 
     comment = GroupComment(post_id=post.id, user_id=current_user.id, content=payload.content)
     db.add(comment)
+    bump_counter(db, GroupPost, post.id, GroupPost.comment_count, 1)
+    bump_group_counter(db, group.id, Group.comment_count, 1)
     db.commit()
     db.refresh(comment)
 
@@ -1577,6 +1685,8 @@ def create_comment_reply(
         content=payload.content,
     )
     db.add(reply)
+    bump_counter(db, GroupPost, post.id, GroupPost.comment_count, 1)
+    bump_group_counter(db, group.id, Group.comment_count, 1)
     db.commit()
     db.refresh(reply)
 
@@ -1633,6 +1743,7 @@ def join_group(
             raise HTTPException(status_code=403, detail="Invalid password")
 
     db.add(GroupMember(group_id=group.id, user_id=current_user.id, role=GroupRole.MEMBER))
+    bump_group_counter(db, group.id, Group.member_count, 1)
     db.commit()
     member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
 
@@ -1717,6 +1828,7 @@ def leave_group(
         raise HTTPException(status_code=400, detail="Leader cannot leave group")
 
     db.delete(member)
+    bump_group_counter(db, group.id, Group.member_count, -1)
     db.commit()
     member_count = db.query(GroupMember).filter(GroupMember.group_id == group.id).count()
 
@@ -1753,13 +1865,8 @@ def like_comment(
     post = db.query(GroupPost).filter(GroupPost.id == comment.post_id).first()
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
-    exists = (
-        db.query(GroupCommentLike.id)
-        .filter(GroupCommentLike.comment_id == comment.id, GroupCommentLike.user_id == current_user.id)
-        .first()
-    )
-    if not exists:
-        db.add(GroupCommentLike(comment_id=comment.id, user_id=current_user.id))
+    if add_unique_row(db, GroupCommentLike(comment_id=comment.id, user_id=current_user.id)):
+        bump_counter(db, GroupComment, comment.id, GroupComment.like_count, 1)
         db.commit()
         _notify_group_post_interaction(
             db,
@@ -1785,9 +1892,10 @@ def unlike_comment(
     post = db.query(GroupPost).filter(GroupPost.id == comment.post_id).first()
     group = db.query(Group).filter(Group.id == post.group_id).first()
     _require_member(db, group, current_user.id)
-    db.query(GroupCommentLike).filter(
+    deleted = db.query(GroupCommentLike).filter(
         GroupCommentLike.comment_id == comment.id, GroupCommentLike.user_id == current_user.id
-    ).delete()
+    ).delete(synchronize_session=False)
+    bump_counter(db, GroupComment, comment.id, GroupComment.like_count, -deleted)
     db.commit()
     return {"ok": True}
 
@@ -1993,5 +2101,6 @@ def remove_group_member(
         raise HTTPException(status_code=404, detail="Member not found")
 
     db.delete(member)
+    bump_group_counter(db, group.id, Group.member_count, -1)
     db.commit()
     return {"ok": True}
@@ -1,14 +1,17 @@
 import datetime
-from datetime import date
+from collections import defaultdict
 from app.core.utils import to_seoul
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, select
+from sqlalchemy import func, and_, select
 
-from app.core.auth import get_current_user
-from app.database import get_db
+from app.core.auth import get_current_user_async
+from app.core.etag import compute_etag, conditional_json
+from app.core.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+from app.database import get_async_db
 from app.models import (
     User,
     Book,
@@ -16,97 +19,36 @@ from app.models import (
     Review,
     Wishlist,
     BookCategory,
+    BookAuthor,
+    Author,
+    ReadingSession,
     UserPage,
     ReadingStatus,
 )
 from app.schemas.book import BookResponse
 from app.schemas.library import BookLibraryItem, LibraryResponse
+from app.services.version_stamps import library_stamp
 
 router = APIRouter(prefix="/library", tags=["library"])
 
 
-def _apply_auto_complete(db: Session, user_id: int):
-    """
-    READING 상태에서 진행률 >=99%인 책을 COMPLETED로 자동 전환.
-    진행률 계산: max(UserPage.end_page) / Book.total_pages * 100.
-    """
-    # 후보 조회 (total_pages 있을 것, 페이지 기록 존재)
-    rows = (
-        db.query(
-            UserBook.id.label("ub_id"),
-            Book.id.label("book_id"),
-            Book.total_pages.label("total_pages"),
-            func.max(UserPage.end_page).label("max_end"),
-        )
-        .join(Book, Book.id == UserBook.book_id)
-        .outerjoin(UserPage, UserPage.user_book_id == UserBook.id)
-        .filter(
-            UserBook.user_id == user_id,
-            UserBook.status == ReadingStatus.READING,
-            Book.total_pages != None,
-        )
-        .group_by(UserBook.id, Book.id, Book.total_pages)
-        .having(func.max(UserPage.end_page) != None)
-        .all()
-    )
-    changed = False
-    for r in rows:
-        if r.total_pages and r.max_end and r.max_end / r.total_pages >= 0.99:
-            ub = db.query(UserBook).filter(UserBook.id == r.ub_id).first()
-            if ub and ub.status == ReadingStatus.READING:
-                ub.status = ReadingStatus.COMPLETED
-                ub.finished_date = date.today()
-                changed = True
-    if changed:
-        user_ids = {r.user_id for r in rows}
-        db.commit()
-        for user_id in user_ids:
-            evaluate_user_badges(db, user_id)
-
-
-def _get_current_page(db: Session, user_id: int, book_id: int) -> Optional[int]:
-    # 최근 이벤트 기반 페이지 우선
-    from app.models import ReadingSession, ReadingEvent
-    last_event_page = (
-        db.query(ReadingEvent.page)
-        .join(ReadingSession, ReadingEvent.session_id == ReadingSession.id)
-        .filter(
-            ReadingSession.user_id == user_id,
-            ReadingSession.book_id == book_id,
-            ReadingEvent.page.isnot(None),
-        )
-        .order_by(ReadingEvent.occurred_at.desc(), ReadingEvent.id.desc())
-        .limit(1)
-        .scalar()
-    )
-    if last_event_page is not None:
-        return int(last_event_page)
-
-    # 최근 세션 종료 페이지
-    last_session_end = (
-        db.query(ReadingSession.end_page)
-        .filter(ReadingSession.user_id == user_id, ReadingSession.book_id == book_id)
-        .order_by(ReadingSession.id.desc())
-        .limit(1)
-        .scalar()
-    )
-    if last_session_end is not None:
-        return int(last_session_end)
+import logging
 
-    # 없으면 UserPage의 max(end_page)
-    max_userpage = (
-        db.query(func.max(UserPage.end_page))
-        .join(UserBook, UserBook.id == UserPage.user_book_id)
-        .filter(UserBook.user_id == user_id, UserBook.book_id == book_id)
-        .scalar()
-    )
-    return int(max_userpage) if max_userpage is not None else None
+# 출판 연도 구간 → published_date 범위 (인덱스를 탈 수 있도록 YEAR() 대신 날짜 비교)
+YEAR_BUCKET_RANGES = {
+    "2020+": (datetime.date(2020, 1, 1), None),
+    "2010s": (datetime.date(2010, 1, 1), datetime.date(2020, 1, 1)),
+    "2000s": (datetime.date(2000, 1, 1), datetime.date(2010, 1, 1)),
+    "1990s": (datetime.date(1990, 1, 1), datetime.date(2000, 1, 1)),
+    "1980s": (datetime.date(1980, 1, 1), datetime.date(1990, 1, 1)),
+    "1970s": (datetime.date(1970, 1, 1), datetime.date(1980, 1, 1)),
+    "pre1970": (None, datetime.date(1970, 1, 1)),
+}
 
 
-import logging
-
 @router.get("/", response_model=LibraryResponse, summary="도서 보관함 조회")
-def get_library(
+async def get_library(
+    request: Request,
     shelf: str = Query("reading", description="reading|completed|rated|wishlist"),
     sort: str = Query("latest", description="latest|myRating|avgRating|title"),
     my_rating_in: Optional[str] = Query(None, description="예: 5.0,4.5,4.0"),
@@ -116,23 +58,83 @@ def get_library(
     # 언어 필터 제외 요청에 따라 제거
     categories_in: Optional[str] = Query(None, description="카테고리 다중 선택: SF,판타지"),
     limit: int = Query(50, ge=1, le=200),
-    offset: int = Query(0, ge=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (정렬 키 기반 페이지네이션)"),
+    offset: int = Query(0, ge=0, description="(deprecated) cursor 사용 권장. cursor가 있으면 무시"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
+    return await db.run_sync(
+        _conditional_library,
+        request,
+        current_user,
+        shelf=shelf,
+        sort=sort,
+        my_rating_in=my_rating_in,
+        avg_rating_min=avg_rating_min,
+        avg_rating_max=avg_rating_max,
+        year_bucket=year_bucket,
+        categories_in=categories_in,
+        limit=limit,
+        cursor=cursor,
+        offset=offset,
+    )
+
+
+def _conditional_library(db: Session, request: Request, current_user: User, **params) -> LibraryResponse:
+    # 서재 버전 스탬프가 같으면 선반 조회 없이 304
+    etag = compute_etag(
+        "library",
+        current_user.id,
+        sorted(request.query_params.multi_items()),
+        *library_stamp(db, current_user.id),
+    )
+    return conditional_json(request, etag, lambda: _load_library(db, current_user, **params), private=True)
+
+
+def _load_library(
+    db: Session,
+    current_user: User,
+    *,
+    shelf: str,
+    sort: str,
+    my_rating_in: Optional[str],
+    avg_rating_min: Optional[float],
+    avg_rating_max: Optional[float],
+    year_bucket: Optional[str],
+    categories_in: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+    offset: int,
+) -> LibraryResponse:
     try:
-        # 자동 완독 처리 (reading/ completed 관련 상태일 때만 수행)
-        if shelf in ("reading", "completed"):
-            _apply_auto_complete(db, current_user.id)
+        # 자동 완독 처리는 진행 기록 쓰기 경로(app.services.reading_progress)에서 수행 → 조회는 읽기 전용
+
+        # 선반(shelf)에 담긴 책 id 집합: 리뷰 집계를 이 책들로만 제한
+        if shelf == "reading":
+            shelf_book_ids = select(UserBook.book_id).where(
+                UserBook.user_id == current_user.id, UserBook.status == ReadingStatus.READING
+            )
+        elif shelf == "completed":
+            shelf_book_ids = select(UserBook.book_id).where(
+                UserBook.user_id == current_user.id, UserBook.status == ReadingStatus.COMPLETED
+            )
+        elif shelf == "rated":
+            shelf_book_ids = select(Review.book_id).where(
+                Review.user_id == current_user.id, Review.rating.isnot(None)
+            )
+        elif shelf == "wishlist":
+            shelf_book_ids = select(Wishlist.book_id).where(Wishlist.user_id == current_user.id)
+        else:
+            raise HTTPException(status_code=400, detail="잘못된 shelf 값")
 
-        # 기본 쿼리 구성을 위해 필요한 서브쿼리들
-        # 평균 별점 / 리뷰 수
+        # 평균 별점 / 리뷰 수 (선반의 책들만 집계)
         review_agg_subq = (
             db.query(
                 Review.book_id.label("r_book_id"),
                 func.avg(Review.rating).label("avg_rating"),
                 func.count(Review.id).label("review_count"),
             )
+            .filter(Review.book_id.in_(shelf_book_ids))
             .group_by(Review.book_id)
             .subquery()
         )
@@ -163,61 +165,27 @@ def get_library(
         # 연도 필터 조건 구성
         year_conditions = []
         if year_bucket:
-            if year_bucket == "2020+":
-                year_conditions.append(func.year(Book.published_date) >= 2020)
-            elif year_bucket == "2010s":
-                year_conditions.append(func.year(Book.published_date).between(2010, 2019))
-            elif year_bucket == "2000s":
-                year_conditions.append(func.year(Book.published_date).between(2000, 2009))
-            elif year_bucket == "1990s":
-                year_conditions.append(func.year(Book.published_date).between(1990, 1999))
-            elif year_bucket == "1980s":
-                year_conditions.append(func.year(Book.published_date).between(1980, 1989))
-            elif year_bucket == "1970s":
-                year_conditions.append(func.year(Book.published_date).between(1970, 1979))
-            elif year_bucket == "pre1970":
-                year_conditions.append(func.year(Book.published_date) < 1970)
-            else:
+            if year_bucket not in YEAR_BUCKET_RANGES:
                 raise HTTPException(status_code=400, detail="year_bucket 값 오류")
+            start, end = YEAR_BUCKET_RANGES[year_bucket]
+            if start is not None:
+                year_conditions.append(Book.published_date >= start)
+            if end is not None:
+                year_conditions.append(Book.published_date < end)
 
-        # rated shelf에서는 Review.created_date를 안전하게 사용하기 위해 Review를 join/select에 포함
-        if shelf == "rated":
-            base_query = db.query(
-                Book,
-                UserBook.status.label("ub_status"),
-                UserBook.created_at.label("added_at"),
-                UserBook.started_at.label("started_at"),
-                UserBook.completed_at.label("completed_at"),
-                review_agg_subq.c.avg_rating,
-                review_agg_subq.c.review_count,
-                my_rating_subq.c.my_rating,
-                Review.created_date.label("review_created_date"),
-            ).outerjoin(UserBook, and_(UserBook.book_id == Book.id, UserBook.user_id == current_user.id)) \
-                .outerjoin(review_agg_subq, review_agg_subq.c.r_book_id == Book.id) \
-                .outerjoin(my_rating_subq, my_rating_subq.c.mr_book_id == Book.id) \
-                .outerjoin(Review, and_(Review.book_id == Book.id, Review.user_id == current_user.id))
-        else:
-            base_query = db.query(
-                Book,
-                UserBook.status.label("ub_status"),
-                UserBook.created_at.label("added_at"),
-                UserBook.started_at.label("started_at"),
-                UserBook.completed_at.label("completed_at"),
-                review_agg_subq.c.avg_rating,
-                review_agg_subq.c.review_count,
-                my_rating_subq.c.my_rating,
-            ).outerjoin(UserBook, and_(UserBook.book_id == Book.id, UserBook.user_id == current_user.id)) \
-                .outerjoin(review_agg_subq, review_agg_subq.c.r_book_id == Book.id) \
-                .outerjoin(my_rating_subq, my_rating_subq.c.mr_book_id == Book.id)
-
-        # 선반(shelf)에 따른 제한
-        if shelf == "reading":
-            base_query = base_query.filter(UserBook.status == ReadingStatus.READING)
-        elif shelf == "completed":
-            base_query = base_query.filter(UserBook.status == ReadingStatus.COMPLETED)
-        elif shelf == "rated":
-            base_query = base_query.filter(my_rating_subq.c.my_rating != None)
-        elif shelf == "wishlist":
+        columns = [
+            Book,
+            UserBook.status.label("ub_status"),
+            UserBook.created_at.label("added_at"),
+            UserBook.started_at.label("started_at"),
+            UserBook.completed_at.label("completed_at"),
+            review_agg_subq.c.avg_rating.label("avg_rating"),
+            review_agg_subq.c.review_count.label("review_count"),
+            my_rating_subq.c.my_rating.label("my_rating"),
+            UserBook.current_page.label("current_page"),
+        ]
+        wishlist_subq = None
+        if shelf == "wishlist":
             wishlist_subq = (
                 db.query(
                     Wishlist.book_id.label("w_book_id"),
@@ -227,23 +195,30 @@ def get_library(
                 .filter(Wishlist.user_id == current_user.id)
                 .subquery()
             )
-            base_query = db.query(
-                Book,
-                func.coalesce(UserBook.status, "WISHLIST").label("ub_status"),
-                wishlist_subq.c.w_added.label("added_at"),
-                UserBook.started_at.label("started_at"),
-                UserBook.completed_at.label("completed_at"),
-                wishlist_subq.c.wishlist_at.label("wishlist_at"),
-                review_agg_subq.c.avg_rating,
-                review_agg_subq.c.review_count,
-                my_rating_subq.c.my_rating,
-            ).join(wishlist_subq, wishlist_subq.c.w_book_id == Book.id) \
-                .outerjoin(UserBook, and_(UserBook.book_id == Book.id, UserBook.user_id == current_user.id)) \
-                .outerjoin(review_agg_subq, review_agg_subq.c.r_book_id == Book.id) \
-                .outerjoin(my_rating_subq, my_rating_subq.c.mr_book_id == Book.id)
-            # 반드시 wishlist_subq.c.wishlist_at, wishlist_subq.c.w_added만 ORDER BY에 사용
+            columns[1] = func.coalesce(UserBook.status, "WISHLIST").label("ub_status")
+            columns[2] = wishlist_subq.c.w_added.label("added_at")
+            columns.append(wishlist_subq.c.wishlist_at.label("wishlist_at"))
+            base_query = db.query(*columns).join(wishlist_subq, wishlist_subq.c.w_book_id == Book.id)
+        elif shelf == "rated":
+            # rated shelf에서는 Review.created_date를 안전하게 사용하기 위해 Review를 join/select에 포함
+            columns.append(Review.created_date.label("review_created_date"))
+            base_query = db.query(*columns).join(
+                Review, and_(Review.book_id == Book.id, Review.user_id == current_user.id)
+            )
         else:
-            raise HTTPException(status_code=400, detail="잘못된 shelf 값")
+            base_query = db.query(*columns)
+        base_query = base_query \
+            .outerjoin(UserBook, and_(UserBook.book_id == Book.id, UserBook.user_id == current_user.id)) \
+            .outerjoin(review_agg_subq, review_agg_subq.c.r_book_id == Book.id) \
+            .outerjoin(my_rating_subq, my_rating_subq.c.mr_book_id == Book.id)
+
+        # 선반(shelf)에 따른 제한
+        if shelf == "reading":
+            base_query = base_query.filter(UserBook.status == ReadingStatus.READING)
+        elif shelf == "completed":
+            base_query = base_query.filter(UserBook.status == ReadingStatus.COMPLETED)
+        elif shelf == "rated":
+            base_query = base_query.filter(my_rating_subq.c.my_rating != None)
 
         # 필터들 적용
         if my_rating_values:
@@ -252,49 +227,64 @@ def get_library(
             base_query = base_query.filter(review_agg_subq.c.avg_rating >= avg_rating_min)
         if avg_rating_max is not None:
             base_query = base_query.filter(review_agg_subq.c.avg_rating <= avg_rating_max)
-        # ...이하 기존 코드 유지...
-    except Exception as e:
-        logging.exception("도서 보관함 API 예외 발생")
-        raise
-        base_query = base_query.filter(review_agg_subq.c.avg_rating <= avg_rating_max)
-    if year_conditions:
         for cond in year_conditions:
             base_query = base_query.filter(cond)
-    if category_list:
-        cat_subq = (
-            db.query(BookCategory.book_id)
-            .filter(BookCategory.category_name.in_(category_list))
-            .subquery()
-        )
-        base_query = base_query.filter(Book.id.in_(select(cat_subq)))
+        if category_list:
+            cat_subq = (
+                db.query(BookCategory.book_id)
+                .filter(BookCategory.category_name.in_(category_list))
+                .subquery()
+            )
+            base_query = base_query.filter(Book.id.in_(select(cat_subq)))
+    except HTTPException:
+        raise
+    except Exception:
+        logging.exception("도서 보관함 API 예외 발생")
+        raise
 
-    # 정렬
+    # 정렬 키: (key, Book.id) 조합으로 커서 페이지네이션
+    # NULL이 될 수 있는 시각은 created_at으로 보정해 NOT NULL 키로 만들고 `key IS NULL` 정렬 항을 없앤다.
+    # 별점 정렬은 집계 서브쿼리 값이라 NULL을 뒤로 보내는 정렬을 유지한다(인덱스로 정렬 불가).
+    descending = True
+    nullable_key = False
     if sort == "latest":
         if shelf == "reading":
-            base_query = base_query.order_by(UserBook.started_at.is_(None), UserBook.started_at.desc())
+            sort_key = func.coalesce(UserBook.started_at, UserBook.created_at)
         elif shelf == "completed":
-            base_query = base_query.order_by(UserBook.completed_at.is_(None), UserBook.completed_at.desc())
+            sort_key = func.coalesce(UserBook.completed_at, UserBook.created_at)
         elif shelf == "rated":
             # 최근 별점 작성일 기준 정렬(Review.created_date가 select에 포함되어야 함)
-            base_query = base_query.order_by(Review.created_date.is_(None), Review.created_date.desc())
-        elif shelf == "wishlist":
-            base_query = base_query.order_by(
-                func.coalesce(wishlist_subq.c.wishlist_at, wishlist_subq.c.w_added).is_(None),
-                func.coalesce(wishlist_subq.c.wishlist_at, wishlist_subq.c.w_added).desc()
-            )
+            sort_key = Review.created_date
         else:
-            base_query = base_query.order_by(UserBook.created_at.is_(None), UserBook.created_at.desc())
+            sort_key = func.coalesce(wishlist_subq.c.wishlist_at, wishlist_subq.c.w_added)
     elif sort == "myRating":
-        base_query = base_query.order_by(my_rating_subq.c.my_rating.desc().nullslast())
+        sort_key = my_rating_subq.c.my_rating
+        nullable_key = True
     elif sort == "avgRating":
-        base_query = base_query.order_by(review_agg_subq.c.avg_rating.desc().nullslast())
+        sort_key = review_agg_subq.c.avg_rating
+        nullable_key = True
     elif sort == "title":
-        base_query = base_query.order_by(Book.title.asc())
+        sort_key = Book.title
+        descending = False
     else:
         raise HTTPException(status_code=400, detail="sort 값 오류")
 
     total = base_query.count()
-    rows = base_query.offset(offset).limit(limit).all()
+
+    page_query = base_query.add_columns(sort_key.label("sort_key"))
+    last = decode_cursor(cursor, 2)
+    if last is not None:
+        page_query = page_query.filter(
+            keyset_after(sort_key, last[0], Book.id, last[1], descending=descending, nulls_last=nullable_key)
+        )
+    page_query = page_query.order_by(*keyset_order(sort_key, Book.id, descending=descending, nulls_last=nullable_key))
+    if last is None and offset:
+        page_query = page_query.offset(offset)
+    rows = page_query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1].sort_key, rows[-1][0].id])
 
     # 미리 book_id 리스트 추출 (중복 제거)
     book_ids = list(set(r[0].id for r in rows))
@@ -307,65 +297,42 @@ def get_library(
             .group_by(UserBook.book_id).all()
         progress_dict = {bid: (max_end or 0) for bid, max_end in progress_rows}
     # authors 미리 조회
-    authors_dict = {}
+    authors_dict = defaultdict(list)
+    # categories 미리 조회
+    categories_dict = defaultdict(list)
+    # 책별 누적 독서 시간 미리 조회
+    reading_seconds_dict = {}
     if book_ids:
-        from app.models import BookAuthor, Author
         author_rows = db.query(BookAuthor.book_id, Author.name)\
             .join(Author, BookAuthor.author_id == Author.id)\
             .filter(BookAuthor.book_id.in_(book_ids)).all()
-        from collections import defaultdict
-        authors_dict = defaultdict(list)
         for bid, name in author_rows:
             authors_dict[bid].append(name)
-    # categories 미리 조회
-    categories_dict = {}
-    if book_ids:
         cat_rows = db.query(BookCategory.book_id, BookCategory.category_name)\
             .filter(BookCategory.book_id.in_(book_ids)).all()
-        categories_dict = defaultdict(list)
         for bid, cname in cat_rows:
             categories_dict[bid].append(cname)
-    # current_page 미리 조회
-    current_page_dict = {}
-    if book_ids:
-        from app.models import ReadingSession, ReadingEvent
-        # 최근 이벤트 기반 페이지
-        event_rows = db.query(ReadingSession.book_id, func.max(ReadingEvent.page))\
-            .join(ReadingEvent, ReadingEvent.session_id == ReadingSession.id)\
-            .filter(ReadingSession.user_id == current_user.id, ReadingSession.book_id.in_(book_ids), ReadingEvent.page.isnot(None))\
+        seconds_rows = db.query(ReadingSession.book_id, func.coalesce(func.sum(ReadingSession.total_seconds), 0))\
+            .filter(ReadingSession.user_id == current_user.id, ReadingSession.book_id.in_(book_ids))\
             .group_by(ReadingSession.book_id).all()
-        for bid, page in event_rows:
-            if page is not None:
-                current_page_dict[bid] = int(page)
-    # 없으면 UserPage의 max(end_page)
-    if book_ids:
-        up_rows = db.query(UserBook.book_id, func.max(UserPage.end_page))\
-            .join(UserBook, UserBook.id == UserPage.user_book_id)\
-            .filter(UserBook.user_id == current_user.id, UserBook.book_id.in_(book_ids))\
-            .group_by(UserBook.book_id).all()
-        for bid, page in up_rows:
-            if bid not in current_page_dict and page is not None:
-                current_page_dict[bid] = int(page)
+        reading_seconds_dict = {bid: int(seconds or 0) for bid, seconds in seconds_rows}
 
     items: List[BookLibraryItem] = []
     seen_book_ids = set()
-    from pytz import timezone
-    tz = timezone('Asia/Seoul')
     for r in rows:
         book: Book = r[0]
         if shelf in ("reading", "completed"):
             if book.id in seen_book_ids:
                 continue
             seen_book_ids.add(book.id)
-        ub_status = r[1]
-        added_at = r[2]
-        started_at = r[3] if len(r) > 3 else None
-        completed_at = r[4] if len(r) > 4 else None
-        wishlist_at = r[5] if shelf == "wishlist" else None
-        avg_rating = r[6] if shelf == "wishlist" else r[5]
-        review_count = (r[7] if shelf == "wishlist" else r[6]) or 0
-        my_rating = r[8] if shelf == "wishlist" else r[7]
-        review_created_date = r[8] if shelf == "rated" else None
+        ub_status = r.ub_status
+        added_at = r.added_at
+        started_at = r.started_at
+        completed_at = r.completed_at
+        wishlist_at = r.wishlist_at if shelf == "wishlist" else None
+        avg_rating = r.avg_rating
+        review_count = r.review_count or 0
+        my_rating = r.my_rating
         # 진행률
         progress_percent = None
         if ub_status in (ReadingStatus.READING, ReadingStatus.COMPLETED):
@@ -373,16 +340,8 @@ def get_library(
                 max_end = progress_dict.get(book.id)
                 if max_end and book.total_pages:
                     progress_percent = round((max_end / book.total_pages) * 100, 2)
-        # current_page
-        current_page = current_page_dict.get(book.id)
-        # 책별 누적 독서 시간 계산
-        total_reading_seconds = None
-        from app.models import ReadingSession
-        sessions = db.query(ReadingSession).filter(
-            ReadingSession.user_id == current_user.id,
-            ReadingSession.book_id == book.id
-        ).all()
-        total_reading_seconds = sum(s.total_seconds or 0 for s in sessions)
+        # current_page (UserBook에 비정규화된 값)
+        current_page = r.current_page
         items.append(
             BookLibraryItem(
                 book=BookResponse(
@@ -415,7 +374,7 @@ def get_library(
                 review_count=review_count,
                 progress_percent=progress_percent,
                 current_page=current_page,
-                total_reading_seconds=total_reading_seconds,
+                total_reading_seconds=reading_seconds_dict.get(book.id, 0),
             )
         )
-    return LibraryResponse(total=total, items=items)
+    return LibraryResponse(total=total, items=items, next_cursor=next_cursor)
@@ -3,10 +3,12 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.auth import get_current_user
-from app.database import get_db
+from app.core.auth import get_current_user, get_current_user_async
+from app.core.responses import model_response
+from app.database import get_async_db, get_db
 from app.models import FCMToken, Notification, NotificationTabCategory, NotificationType, User
 from app.schemas.notification import (
     DeleteNotificationsResponse,
@@ -186,13 +188,23 @@ def send_test(
 
 
 @router.get('/users/me/notifications', response_model=NotificationListResponse)
-def list_notifications(
+async def list_notifications(
     tab_category: NotificationTabCategory | None = Query(default=None, alias='tabCategory'),
     limit: int = Query(default=20, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
+    return model_response(await db.run_sync(_list_notifications, current_user, tab_category, limit, offset))
+
+
+def _list_notifications(
+    db: Session,
+    current_user: User,
+    tab_category: NotificationTabCategory | None,
+    limit: int,
+    offset: int,
+) -> NotificationListResponse:
     query = db.query(Notification).filter(Notification.user_id == current_user.id)
     if tab_category is not None:
         query = query.filter(Notification.tab_category == tab_category)
@@ -212,10 +224,14 @@ def list_notifications(
 
 
 @router.get('/users/me/notifications/unread-count', response_model=UnreadCountResponse)
-def unread_count(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+async def unread_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
 ):
+    return await db.run_sync(_unread_count, current_user)
+
+
+def _unread_count(db: Session, current_user: User) -> UnreadCountResponse:
     notifications = (
         db.query(Notification)
         .filter(Notification.user_id == current_user.id, Notification.is_read.is_(False))
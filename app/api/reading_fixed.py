@@ -20,6 +20,14 @@ from app.models import (
     User,
 )
 
+from app.services.badges import enqueue_badge_evaluation
+from app.services.reading_progress import (
+    get_user_book,
+    last_session_page,
+    maybe_complete_user_book,
+    record_current_page,
+    set_current_page,
+)
 from app.schemas.reading import (
     ReadingSessionStartRequest,
     ReadingEventCreateRequest,
@@ -77,40 +85,6 @@ class UserReadingSummaryResponse(BaseModel):
     )
 
 
-# -------------------------------
-# 내부용: 최근 페이지 계산 함수
-# -------------------------------
-def _get_last_page_read(db: Session, user_id: int, book_id: int) -> Optional[int]:
-    last_event_page = (
-        db.query(ReadingEvent.page)
-        .join(ReadingSession, ReadingEvent.session_id == ReadingSession.id)
-        .filter(
-            ReadingSession.user_id == user_id,
-            ReadingSession.book_id == book_id,
-            ReadingEvent.page.isnot(None),
-        )
-        .order_by(ReadingEvent.occurred_at.desc(), ReadingEvent.id.desc())
-        .limit(1)
-        .scalar()
-    )
-    if last_event_page is not None:
-        return int(last_event_page)
-
-    last_session = (
-        db.query(ReadingSession)
-        .filter(
-            ReadingSession.user_id == user_id,
-            ReadingSession.book_id == book_id,
-        )
-        .order_by(ReadingSession.id.desc())
-        .first()
-    )
-    if last_session and last_session.end_page is not None:
-        return int(last_session.end_page)
-
-    return None
-
-
 # -------------------------------
 # 세션 시작
 # -------------------------------
@@ -118,23 +92,29 @@ def _get_last_page_read(db: Session, user_id: int, book_id: int) -> Optional[int
     "/sessions",
     response_model=ReadingSessionResponse,
     summary="읽기 세션 시작",
-    description="start_page를 주지 않으면 서버가 최근 읽은 페이지(최근 이벤트→최근 세션 end_page→없으면 1)로 자동 설정합니다.",
+    description="start_page를 주지 않으면 서버가 최근 읽은 페이지(UserBook.current_page, 서재에 없는 책은 최근 세션의 페이지, 없으면 1)로 자동 설정합니다.",
 )
 def start_session(
     payload: ReadingSessionStartRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    # 서재(UserBook)에 없는 책이면 행을 만들지 않고 최근 세션에 남은 페이지에서 이어 읽는다
+    user_book = get_user_book(db, current_user.id, payload.book_id)
     inferred_start_page = payload.start_page
     if inferred_start_page is None:
-        inferred_start_page = _get_last_page_read(db, current_user.id, payload.book_id)
-        if inferred_start_page is None:
-            inferred_start_page = 1
+        if user_book is not None:
+            inferred_start_page = user_book.current_page
+        else:
+            inferred_start_page = last_session_page(db, current_user.id, payload.book_id)
+        inferred_start_page = inferred_start_page or 1
 
+    now = datetime.utcnow()
     session = ReadingSession(
         user_id=current_user.id,
         book_id=payload.book_id,
         start_page=inferred_start_page,
+        start_time=now,
     )
     db.add(session)
     db.flush()
@@ -143,8 +123,11 @@ def start_session(
         session_id=session.id,
         event_type=ReadingEventType.START,
         page=inferred_start_page,
+        occurred_at=now,
     )
     db.add(start_event)
+    if user_book is not None:
+        set_current_page(user_book, inferred_start_page, now)
 
     db.commit()
     db.refresh(session)
@@ -186,8 +169,11 @@ def add_event(
         occurred_at=occurred,
     )
     db.add(event)
+    user_book = record_current_page(db, current_user.id, session.book_id, payload.page, occurred, session)
 
+    completed = False
     if event_type == ReadingEventType.END:
+        completed = maybe_complete_user_book(db, user_book, payload.page)
         if session.end_time is None:
             session.end_time = occurred
         if payload.page is not None:
@@ -201,6 +187,8 @@ def add_event(
                 pass
 
     db.commit()
+    if completed:
+        enqueue_badge_evaluation(db, current_user.id, "reading")
     db.refresh(event)
     db.refresh(session)
     return event
@@ -242,8 +230,12 @@ def end_session(
         occurred_at=now,
     )
     db.add(end_event)
+    user_book = record_current_page(db, current_user.id, session.book_id, payload.end_page, now, session)
+    completed = maybe_complete_user_book(db, user_book, payload.end_page)
 
     db.commit()
+    if completed:
+        enqueue_badge_evaluation(db, current_user.id, "reading")
     db.refresh(session)
     return session
 
@@ -6,7 +6,7 @@ from app.core.auth import get_current_user
 from app.database import get_db
 from app.models import User, UserBook, Book, ReadingSession, Bookmark, Highlight, Note
 from app.models import ReadingStatus
-from app.services.badges import evaluate_user_badges
+from app.services.badges import enqueue_badge_evaluation
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/reading-status", tags=["reading-status"])
@@ -48,7 +48,7 @@ def update_status(payload: StatusUpdate, db: Session = Depends(get_db), user: Us
         ub.completed_at = now
     db.commit()
     if payload.status == ReadingStatus.COMPLETED:
-        evaluate_user_badges(db, user.id)
+        enqueue_badge_evaluation(db, user.id, "reading")
     return {"ok": True, "user_book_id": ub.id, "book_id": ub.book_id, "status": ub.status}
 
 
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
+from app.core.response_cache import REVIEWS_TAG, book_tag, booklist_tag, cached_json_response
 from app.database import get_db
 from app.models import (
     Book,
@@ -54,6 +55,38 @@ def _to_book_response(db: Session, b: Book) -> BookResponse:
     )
 
 
+def _booklist_items(db: Session, list_type: str, limit: int) -> List[BookResponse]:
+    """목록 유형의 최신 날짜 순위대로 책을 돌려준다."""
+    latest_date = (
+        db.query(BookList.list_date)
+        .filter(BookList.list_type == list_type)
+        .order_by(BookList.list_date.desc())
+        .limit(1)
+        .scalar()
+    )
+    if not latest_date:
+        return []
+
+    booklist = (
+        db.query(BookList)
+        .filter(BookList.list_type == list_type, BookList.list_date == latest_date)
+        .order_by(BookList.rank.asc())
+        .limit(limit)
+        .all()
+    )
+
+    books = db.query(Book).filter(Book.isbn_10.in_([b.isbn for b in booklist])).all()
+    isbn_to_book = {b.isbn_10: b for b in books}
+
+    return [_to_book_response(db, isbn_to_book[b.isbn])
+            for b in booklist if b.isbn in isbn_to_book]
+
+
+def _book_tags(items: List[BookResponse]) -> List[str]:
+    # 응답에 담긴 책의 평점/메타데이터가 바뀌면 무효화
+    return [book_tag(item.id) for item in items]
+
+
 # ------------------------
 # (1) 사용자 장르 기반 베스트셀러
 # ------------------------
@@ -200,30 +233,12 @@ def genre_bestseller(
 @router.get("/bestseller", response_model=RecommendResponse, summary="전체 베스트셀러 limit권")
 def bestseller(limit: int = Query(20, ge=1, le=50),
                db: Session = Depends(get_db)):
-    latest_date = (
-        db.query(BookList.list_date)
-        .filter(BookList.list_type == "bestseller_all")
-        .order_by(BookList.list_date.desc())
-        .limit(1)
-        .scalar()
+    return cached_json_response(
+        f"recommend:bestseller:{limit}",
+        [booklist_tag("bestseller_all")],
+        lambda: RecommendResponse(items=_booklist_items(db, "bestseller_all", limit)),
+        extra_tags=lambda resp: _book_tags(resp.items),
     )
-    if not latest_date:
-        return RecommendResponse(items=[])
-
-    booklist = (
-        db.query(BookList)
-        .filter(BookList.list_type == "bestseller_all", BookList.list_date == latest_date)
-        .order_by(BookList.rank.asc())
-        .limit(limit)
-        .all()
-    )
-
-    books = db.query(Book).filter(Book.isbn_10.in_([b.isbn for b in booklist])).all()
-    isbn_to_book = {b.isbn_10: b for b in books}
-
-    items = [_to_book_response(db, isbn_to_book[b.isbn])
-             for b in booklist if b.isbn in isbn_to_book]
-    return RecommendResponse(items=items)
 
 
 # ------------------------
@@ -232,30 +247,12 @@ def bestseller(limit: int = Query(20, ge=1, le=50),
 @router.get("/new", response_model=RecommendResponse, summary="전체 신간 limit권")
 def new_books(limit: int = Query(20, ge=1, le=50),
               db: Session = Depends(get_db)):
-    latest_date = (
-        db.query(BookList.list_date)
-        .filter(BookList.list_type == "new_all")
-        .order_by(BookList.list_date.desc())
-        .limit(1)
-        .scalar()
+    return cached_json_response(
+        f"recommend:new:{limit}",
+        [booklist_tag("new_all")],
+        lambda: RecommendResponse(items=_booklist_items(db, "new_all", limit)),
+        extra_tags=lambda resp: _book_tags(resp.items),
     )
-    if not latest_date:
-        return RecommendResponse(items=[])
-
-    booklist = (
-        db.query(BookList)
-        .filter(BookList.list_type == "new_all", BookList.list_date == latest_date)
-        .order_by(BookList.rank.asc())
-        .limit(limit)
-        .all()
-    )
-
-    books = db.query(Book).filter(Book.isbn_10.in_([b.isbn for b in booklist])).all()
-    isbn_to_book = {b.isbn_10: b for b in books}
-
-    items = [_to_book_response(db, isbn_to_book[b.isbn])
-             for b in booklist if b.isbn in isbn_to_book]
-    return RecommendResponse(items=items)
 
 
 # ------------------------
@@ -268,6 +265,16 @@ def popular(
     limit: int = Query(20, ge=1, le=50),
     db: Session = Depends(get_db),
 ):
+    # 집계 구간은 TTL 동안만 고정되고, 리뷰가 바뀌면 바로 무효화된다
+    return cached_json_response(
+        f"recommend:popular:{days}:{limit}",
+        [REVIEWS_TAG],
+        lambda: _popular(db, days, limit),
+        extra_tags=lambda resp: _book_tags(resp.items),
+    )
+
+
+def _popular(db: Session, days: int, limit: int) -> RecommendResponse:
     since = datetime.utcnow() - timedelta(days=days)
 
     agg = (
@@ -376,38 +383,19 @@ _CURATION_THEMES = [
             summary="테마별 큐레이션 limit권 × themes")
 def curations(limit: int = Query(15, ge=1, le=50),
               db: Session = Depends(get_db)):
-    results: List[CurationItem] = []
-
-    for theme in _CURATION_THEMES:
-        list_type = f"comment_{theme}"
-
-        latest_date = (
-            db.query(BookList.list_date)
-            .filter(BookList.list_type == list_type)
-            .order_by(BookList.list_date.desc())
-            .limit(1)
-            .scalar()
-        )
-        if not latest_date:
-            results.append(CurationItem(title=theme, items=[]))
-            continue
-
-        booklist = (
-            db.query(BookList)
-            .filter(BookList.list_type == list_type, BookList.list_date == latest_date)
-            .order_by(BookList.rank.asc())
-            .limit(limit)
-            .all()
-        )
-
-        books = db.query(Book).filter(Book.isbn_10.in_([b.isbn for b in booklist])).all()
-        isbn_to_book = {b.isbn_10: b for b in books}
-
-        items = [_to_book_response(db, isbn_to_book[b.isbn])
-             for b in booklist if b.isbn in isbn_to_book]
+    return cached_json_response(
+        f"recommend:curations:{limit}",
+        [booklist_tag(f"comment_{theme}") for theme in _CURATION_THEMES],
+        lambda: _curations(db, limit),
+        extra_tags=lambda resp: [tag for item in resp.curations for tag in _book_tags(item.items)],
+    )
 
-        results.append(CurationItem(title=theme, items=items))
 
+def _curations(db: Session, limit: int) -> CurationsResponse:
+    results: List[CurationItem] = [
+        CurationItem(title=theme, items=_booklist_items(db, f"comment_{theme}", limit))
+        for theme in _CURATION_THEMES
+    ]
     return CurationsResponse(curations=results)
 
 
@@ -422,29 +410,9 @@ def curations_by_theme(
     db: Session = Depends(get_db),
 ):
     list_type = f"comment_{theme}"
-
-    latest_date = (
-        db.query(BookList.list_date)
-        .filter(BookList.list_type == list_type)
-        .order_by(BookList.list_date.desc())
-        .limit(1)
-        .scalar()
-    )
-    if not latest_date:
-        return RecommendResponse(items=[])
-
-    booklist = (
-        db.query(BookList)
-        .filter(BookList.list_type == list_type, BookList.list_date == latest_date)
-        .order_by(BookList.rank.asc())
-        .limit(limit)
-        .all()
+    return cached_json_response(
+        f"recommend:curation:{theme}:{limit}",
+        [booklist_tag(list_type)],
+        lambda: RecommendResponse(items=_booklist_items(db, list_type, limit)),
+        extra_tags=lambda resp: _book_tags(resp.items),
     )
-
-    books = db.query(Book).filter(Book.isbn_10.in_([b.isbn for b in booklist])).all()
-    isbn_to_book = {b.isbn_10: b for b in books}
-
-    items = [_to_book_response(db, isbn_to_book[b.isbn])
-             for b in booklist if b.isbn in isbn_to_book]
-
-    return RecommendResponse(items=items)
@@ -1,13 +1,17 @@
 from app.core.utils import to_seoul
 from urllib.parse import quote
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.core.auth import get_current_user
+from app.core.pagination import decode_cursor, encode_cursor, keyset_after, keyset_order
+from app.core.response_cache import book_tag, cached_json_response
 from app.database import get_db
-from app.models import NotificationType, Review, User, UserBook, ReviewLike, ReviewComment
-from app.services.badges import evaluate_user_badges
+from app.models import BookReviewStats, NotificationType, Review, User, UserBook, ReviewLike, ReviewComment
+from app.services.badges import REVIEW_BADGE_CATEGORIES, enqueue_badge_evaluation
+from app.services.counters import add_unique_row, bump_counter
 from app.services.notify import create_notification
 from app.schemas.review import (
     ReviewCreateRequest,
@@ -22,6 +26,13 @@ from app.schemas.review import (
 
 router = APIRouter(prefix="/reviews", tags=["reviews"])
 
+# 정렬 옵션 -> 정렬 키 컬럼. 각각 (book_id, 키, id) 복합 인덱스가 있다
+REVIEW_SORT_KEYS = {
+    "latest": Review.created_date,
+    "like": Review.like_count,
+    "rating": Review.rating,
+}
+
 
 def _default_profile_thumbnail(name: str | None) -> str:
     safe_name = quote(name or 'BookStopper')
@@ -61,6 +72,35 @@ def _notify_review_reaction(
     )
 
 
+def _bump_user_comment_count(db: Session, user_id: int, delta: int) -> None:
+    """작성자의 리뷰 댓글 수. 카운터 변경이 프로필 수정 시각(updated_at)을 바꾸지 않게 한다."""
+    bump_counter(db, User, user_id, User.review_comment_count, delta, preserve=(User.updated_at,))
+
+
+def _bump_comment_counters(db: Session, review: Review, delta: int) -> None:
+    """리뷰 댓글 수와 책 전체 댓글 수(book_review_stats)를 원자적으로 증감한다."""
+    if not delta:
+        return
+    bump_counter(db, Review, review.id, Review.comment_count, delta)
+    stats = db.query(BookReviewStats).filter(BookReviewStats.book_id == review.book_id)
+    if stats.update({BookReviewStats.comment_count: BookReviewStats.comment_count + delta}, synchronize_session=False):
+        return
+    if delta < 0:
+        return
+    try:
+        with db.begin_nested():
+            db.add(BookReviewStats(book_id=review.book_id, comment_count=delta))
+    except IntegrityError:
+        # 동시에 다른 요청이 집계 행을 만든 경우
+        stats.update({BookReviewStats.comment_count: BookReviewStats.comment_count + delta}, synchronize_session=False)
+
+
+def _book_comment_count(db: Session, book_id: int) -> int:
+    return int(
+        db.query(BookReviewStats.comment_count).filter(BookReviewStats.book_id == book_id).scalar() or 0
+    )
+
+
 def _get_or_create_user_book(db: Session, user_id: int, book_id: int) -> UserBook:
     ub = (
         db.query(UserBook)
@@ -103,7 +143,7 @@ def create_review(
     db.add(review)
     db.commit()
     db.refresh(review)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
 
     resp = ReviewResponse.model_validate(review)
     resp.created_date = to_seoul(resp.created_date)
@@ -138,7 +178,7 @@ def upsert_review(
             rv.is_spoiler = payload.is_spoiler
         db.commit()
         db.refresh(rv)
-        evaluate_user_badges(db, current_user.id)
+        enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
         resp = ReviewResponse.model_validate(rv)
         resp.created_date = to_seoul(resp.created_date)
         resp.is_my_review = True
@@ -155,7 +195,7 @@ def upsert_review(
     db.add(review)
     db.commit()
     db.refresh(review)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
     resp = ReviewResponse.model_validate(review)
     resp.created_date = to_seoul(resp.created_date)
     resp.is_my_review = True
@@ -184,7 +224,7 @@ def update_rating_only(
         rv.rating = rating
         db.commit()
         db.refresh(rv)
-        evaluate_user_badges(db, current_user.id)
+        enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
         resp = ReviewResponse.model_validate(rv)
         resp.created_date = to_seoul(resp.created_date)
         resp.is_my_review = True
@@ -201,7 +241,7 @@ def update_rating_only(
     db.add(review)
     db.commit()
     db.refresh(review)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
     resp = ReviewResponse.model_validate(review)
     resp.created_date = to_seoul(resp.created_date)
     resp.is_my_review = True
@@ -237,7 +277,7 @@ def update_review(
 
     db.commit()
     db.refresh(rv)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, *REVIEW_BADGE_CATEGORIES)
     resp = ReviewResponse.model_validate(rv)
     resp.created_date = to_seoul(resp.created_date)
     resp.is_my_review = True
@@ -257,6 +297,19 @@ def delete_review(
     )
     if not rv:
         raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다")
+    # 댓글은 리뷰와 함께 지워지므로 책 전체 댓글 수와 댓글 작성자별 댓글 수에서 미리 뺀다
+    if rv.comment_count:
+        db.query(BookReviewStats).filter(BookReviewStats.book_id == rv.book_id).update(
+            {BookReviewStats.comment_count: BookReviewStats.comment_count - rv.comment_count},
+            synchronize_session=False,
+        )
+        for user_id, count in (
+            db.query(ReviewComment.user_id, func.count(ReviewComment.id))
+            .filter(ReviewComment.review_id == rv.id)
+            .group_by(ReviewComment.user_id)
+            .all()
+        ):
+            _bump_user_comment_count(db, user_id, -count)
     db.delete(rv)
     db.commit()
     return None
@@ -265,19 +318,30 @@ def delete_review(
 @router.get("/books/{book_id}", response_model=list[ReviewResponse], summary="특정 책의 리뷰 목록")
 def list_reviews_for_book(
     book_id: int,
-    limit: int = 50,
-    offset: int = 0,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    offset: int = Query(0, ge=0, description="(deprecated) cursor 사용 권장. cursor가 있으면 무시"),
+    sort: str = Query("latest", description="latest | like | rating"),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    reviews = (
-        db.query(Review)
-        .filter(Review.book_id == book_id)
-        .order_by(Review.created_date.desc(), Review.id.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    sort_key = REVIEW_SORT_KEYS.get(sort)
+    if sort_key is None:
+        raise HTTPException(status_code=400, detail="sort는 latest, like, rating만 가능합니다")
+    # rating만 NULL이 가능하다. MySQL/sqlite 모두 DESC 정렬에서 NULL이 맨 뒤라 ORDER BY에 IS NULL 항은 넣지 않는다
+    nullable_key = sort == "rating"
+    q = db.query(Review).filter(Review.book_id == book_id)
+    last = decode_cursor(cursor, 2)
+    if last is not None:
+        q = q.filter(keyset_after(sort_key, last[0], Review.id, last[1], nulls_last=nullable_key))
+    elif offset:
+        q = q.offset(offset)
+    rows = q.order_by(*keyset_order(sort_key, Review.id, nulls_last=False)).limit(limit + 1).all()
+    reviews = rows[:limit]
+    if len(rows) > limit:
+        last_review = reviews[-1]
+        response.headers["X-Next-Cursor"] = encode_cursor([getattr(last_review, sort_key.key), last_review.id])
 
     review_ids = [rv.id for rv in reviews]
     liked_set: set[int] = set()
@@ -292,32 +356,14 @@ def list_reviews_for_book(
         )
         liked_set = {rid for (rid,) in liked_rows}
 
-    # 책 전체 코멘트 수
-    book_comment_count = (
-        db.query(func.count(ReviewComment.id))
-        .join(Review, Review.id == ReviewComment.review_id)
-        .filter(Review.book_id == book_id)
-        .scalar()
-    ) or 0
+    # 책 전체 코멘트 수 (집계 행)
+    book_comment_count = _book_comment_count(db, book_id)
 
-    # 유저 전체 코멘트 수
+    # 유저 전체 코멘트 수 (users.review_comment_count 카운터)
     user_comment_count = (
-        db.query(func.count(ReviewComment.id))
-        .filter(ReviewComment.user_id == current_user.id)
-        .scalar()
+        db.query(User.review_comment_count).filter(User.id == current_user.id).scalar()
     ) or 0
 
-    # 각 리뷰별 댓글 수
-    comment_counts = {}
-    if review_ids:
-        comment_rows = (
-            db.query(ReviewComment.review_id, func.count(ReviewComment.id))
-            .filter(ReviewComment.review_id.in_(review_ids))
-            .group_by(ReviewComment.review_id)
-            .all()
-        )
-        comment_counts = {rid: cnt for (rid, cnt) in comment_rows}
-
     # 작성자 닉네임
     user_ids = {rv.user_id for rv in reviews}
     user_map = {
@@ -333,7 +379,6 @@ def list_reviews_for_book(
         item.is_liked = rv.id in liked_set
         item.book_comment_count = book_comment_count
         item.user_comment_count = user_comment_count
-        item.comment_count = comment_counts.get(rv.id, 0)
         user_meta = user_map.get(rv.user_id) or {}
         item.nickname = user_meta.get("nickname")
         item.profileImageUrl = user_meta.get("profile_image_url")
@@ -343,6 +388,14 @@ def list_reviews_for_book(
 
 @router.get("/books/{book_id}/summary", response_model=BookRatingSummary)
 def get_book_rating_summary(book_id: int, db: Session = Depends(get_db)):
+    return cached_json_response(
+        f"reviews:summary:{book_id}",
+        [book_tag(book_id)],
+        lambda: _book_rating_summary(db, book_id),
+    )
+
+
+def _book_rating_summary(db: Session, book_id: int) -> BookRatingSummary:
     avg, count = (
         db.query(func.avg(Review.rating), func.count(Review.id))
         .filter(Review.book_id == book_id, Review.rating != None)
@@ -405,13 +458,6 @@ def get_review_detail(
     )
     resp.is_liked = bool(liked)
 
-    comment_count = (
-        db.query(func.count(ReviewComment.id))
-        .filter(ReviewComment.review_id == review_id)
-        .scalar()
-    ) or 0
-    resp.comment_count = int(comment_count)
-
     user = db.query(User).filter(User.id == rv.user_id).first()
     resp.nickname = user.nickname if user else None
     resp.profileImageUrl = user.profile_image_url if user else None
@@ -423,13 +469,7 @@ def get_review_detail(
     ) or 0
     resp.rating_count = int(rating_count)
 
-    book_comment_count = (
-        db.query(func.count(ReviewComment.id))
-        .join(Review, Review.id == ReviewComment.review_id)
-        .filter(Review.book_id == rv.book_id)
-        .scalar()
-    ) or 0
-    resp.book_comment_count = int(book_comment_count)
+    resp.book_comment_count = _book_comment_count(db, rv.book_id)
 
     user_comment_count = (
         db.query(func.count(ReviewComment.id))
@@ -452,21 +492,23 @@ def toggle_like_review(
     if not rv:
         raise HTTPException(status_code=404, detail="리뷰를 찾을 수 없습니다")
 
-    existing = (
+    deleted = (
         db.query(ReviewLike)
         .filter(ReviewLike.review_id == review_id, ReviewLike.user_id == current_user.id)
-        .first()
+        .delete(synchronize_session=False)
     )
-    if existing:
-        db.delete(existing)
-        rv.like_count = max(0, (rv.like_count or 0) - 1)
+    if deleted:
+        bump_counter(db, Review, review_id, Review.like_count, -deleted)
         db.commit()
         db.refresh(rv)
         return {"liked": False, "like_count": rv.like_count}
 
-    like = ReviewLike(review_id=review_id, user_id=current_user.id)
-    db.add(like)
-    rv.like_count = (rv.like_count or 0) + 1
+    if not add_unique_row(db, ReviewLike(review_id=review_id, user_id=current_user.id)):
+        # 동시에 들어온 같은 좋아요 요청이 먼저 반영된 경우
+        db.commit()
+        db.refresh(rv)
+        return {"liked": True, "like_count": rv.like_count}
+    bump_counter(db, Review, review_id, Review.like_count, 1)
     db.commit()
     db.refresh(rv)
 
@@ -524,6 +566,8 @@ def create_review_comment(
         content=payload.content,
     )
     db.add(comment)
+    _bump_comment_counters(db, rv, 1)
+    _bump_user_comment_count(db, current_user.id, 1)
     db.commit()
     db.refresh(comment)
 
@@ -557,6 +601,8 @@ def delete_review_comment(
     )
     if not c:
         raise HTTPException(status_code=404, detail="댓글을 찾을 수 없거나 권한이 없습니다")
+    _bump_comment_counters(db, c.review, -1)
+    _bump_user_comment_count(db, current_user.id, -1)
     db.delete(c)
     db.commit()
     return None
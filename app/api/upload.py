@@ -3,8 +3,6 @@ import uuid
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import boto3
-from botocore.client import Config as BotoConfig
 from fastapi import APIRouter, File, Form, HTTPException, Query, Request, UploadFile
 from fastapi.responses import JSONResponse
 
@@ -95,6 +93,10 @@ def create_presigned_post(
 
     ext = _ext_ok(filename)
     key = f"{resolved_directory}/{uuid.uuid4().hex}{ext}"
+    # boto3/botocore는 import가 무거워 S3를 실제로 쓸 때 불러온다
+    import boto3
+    from botocore.client import Config as BotoConfig
+
     s3 = boto3.client(
         "s3",
         aws_access_key_id=settings.aws_access_key_id,
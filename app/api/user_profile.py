@@ -4,8 +4,6 @@ import os
 import uuid
 from pathlib import Path
 
-import boto3
-from botocore.client import Config as BotoConfig
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -81,6 +79,10 @@ async def _upload_profile_image(request: Request, file: UploadFile) -> str:
         raise HTTPException(status_code=413, detail="File too large")
 
     key = f"{PROFILE_PREFIX}/{uuid.uuid4().hex}{ext}"
+    # boto3/botocore는 import가 무거워 S3를 실제로 쓸 때 불러온다
+    import boto3
+    from botocore.client import Config as BotoConfig
+
     s3 = boto3.client(
         "s3",
         aws_access_key_id=settings.aws_access_key_id,
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.core.auth import get_current_user, get_db
 from app.models import Wishlist, Book, UserBook
-from app.services.badges import evaluate_user_badges
+from app.services.badges import enqueue_badge_evaluation
 from fastapi.responses import JSONResponse
 
 router = APIRouter(prefix="/wishlist", tags=["wishlist"]) 
@@ -63,7 +63,7 @@ def add_to_wishlist(
     db.add(w)
     db.commit()
     db.refresh(w)
-    evaluate_user_badges(db, current_user.id)
+    enqueue_badge_evaluation(db, current_user.id, "wishlist")
     return {"ok": True, "book_id": book_id, "user_book_id": ub.id, "added_at": to_seoul(w.created_at)}
 
 @router.get("/", summary="내 위시리스트 조회")
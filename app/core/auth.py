@@ -1,25 +1,53 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..database import get_async_db, get_db
 from ..models import User
 from .security import decode_token
+from .user_cache import load_cached_user, snapshot_version, store_user_snapshot
 
 bearer_scheme = HTTPBearer(auto_error=True)
 
 
+def _resolve_user(db: Session, request: Request, token: str) -> User:
+    # 한 요청 안에서 다시 해석될 때는 토큰 디코딩/캐시 조회도 생략
+    memo = getattr(request.state, "current_user", None)
+    if memo is not None and memo[0] == token and memo[1] is db:
+        return memo[2]
+    payload = decode_token(token, expected_type="access")
+    user_id = int(payload["sub"])  # type: ignore
+    issued_at = payload.get("iat")
+    version = snapshot_version(user_id)
+    user = load_cached_user(db, user_id, issued_at, version)
+    if user is None:
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+        store_user_snapshot(user, issued_at, version)
+    request.state.current_user = (token, db, user)
+    return user
+
+
 def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
     db: Session = Depends(get_db),
 ) -> User:
-    token = credentials.credentials
-    payload = decode_token(token, expected_type="access")
-    user_id = int(payload["sub"])  # type: ignore
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return user
+    return _resolve_user(db, request, credentials.credentials)
+
+
+async def get_current_user_async(
+    request: Request,
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """get_async_db를 쓰는 async 엔드포인트용. 엔드포인트와 같은 세션에 사용자를 붙이므로 run_sync 안에서 그대로 쓴다.
+
+    동기 get_current_user를 섞으면 인증 때문에 요청마다 동기 세션(커넥션)을 하나 더 잡고 스레드풀을 거친다.
+    """
+    return await db.run_sync(_resolve_user, request, credentials.credentials)
 
 
 def get_admin_user(
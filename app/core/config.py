@@ -69,6 +69,36 @@ class Settings(BaseSettings):
     email_verification_exp_minutes: int = Field(default=10, validation_alias="EMAIL_VERIFICATION_EXP_MINUTES")
     email_verification_resend_seconds: int = Field(default=60, validation_alias="EMAIL_VERIFICATION_RESEND_SECONDS")
 
+    # Reading event compaction (압축 후 원본 이벤트 보관 기간)
+    reading_event_retention_days: int = Field(default=30, validation_alias="READING_EVENT_RETENTION_DAYS")
+    reading_event_compaction_batch_size: int = Field(default=500, validation_alias="READING_EVENT_COMPACTION_BATCH_SIZE")
+
+    # 좋아요/댓글 카운터 재계산 주기 작업
+    counter_reconcile_interval_minutes: int = Field(default=60, validation_alias="COUNTER_RECONCILE_INTERVAL_MINUTES")
+    counter_reconcile_batch_size: int = Field(default=5000, validation_alias="COUNTER_RECONCILE_BATCH_SIZE")
+
+    # DB 커넥션 풀 (비워 두면 worker/스레드 수와 연결 상한으로 크기를 계산)
+    web_concurrency: int = Field(default=1, validation_alias="WEB_CONCURRENCY")  # uvicorn worker 프로세스 수
+    web_threads: int = Field(default=40, validation_alias="WEB_THREADS")  # 프로세스당 동기 엔드포인트 스레드 수
+    db_max_connections: int = Field(default=150, validation_alias="DB_MAX_CONNECTIONS")  # API 전체가 쓸 DB 연결 상한
+    db_pool_size: Optional[int] = Field(default=None, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: Optional[int] = Field(default=None, validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: int = Field(default=10, validation_alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(default=1800, validation_alias="DB_POOL_RECYCLE_SECONDS")  # MySQL wait_timeout보다 짧게
+    db_pool_pre_ping: bool = Field(default=True, validation_alias="DB_POOL_PRE_PING")
+
+    # 인증 사용자 스냅샷 캐시 (프로세스별, 0이면 끔). RESPONSE_CACHE_REDIS_URL이 있으면 무효화가 모든 프로세스에
+    # 바로 전파되고(요청마다 Redis 조회 1회), 없으면 다른 worker에는 이 TTL이 지나야 반영된다
+    auth_user_cache_ttl_seconds: int = Field(default=10, validation_alias="AUTH_USER_CACHE_TTL_SECONDS")
+    auth_user_cache_max_entries: int = Field(default=10000, validation_alias="AUTH_USER_CACHE_MAX_ENTRIES")
+
+    # 공개 조회 응답 캐시 (Redis URL을 주면 프로세스 간에 공유, TTL 0이면 끔)
+    response_cache_ttl_seconds: int = Field(default=300, validation_alias="RESPONSE_CACHE_TTL_SECONDS")
+    response_cache_max_entries: int = Field(default=2000, validation_alias="RESPONSE_CACHE_MAX_ENTRIES")
+    response_cache_redis_url: Optional[str] = Field(default=None, validation_alias="RESPONSE_CACHE_REDIS_URL")
+    # nginx 없이 uvicorn을 직접 노출할 때만 켠다 (이 크기 이상 응답을 gzip, 0이면 끔: 압축은 nginx가 한다)
+    api_gzip_min_bytes: int = Field(default=0, validation_alias="API_GZIP_MIN_BYTES")
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
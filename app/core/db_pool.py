@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from .config import Settings
+
+# 체크아웃 대기 시간 히스토그램 경계(ms). 마지막 버킷은 +Inf
+WAIT_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 대기 시간/포화 지표 (프로세스 단위 누적값)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            # 풀과 overflow가 모두 사용 중이라 반납을 기다려야 했던 체크아웃 수
+            self.saturated_checkouts = 0
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self.peak_checked_out = 0
+
+    def record(self, wait_ms: float, *, saturated: bool, timed_out: bool, checked_out: int) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            if saturated:
+                self.saturated_checkouts += 1
+            self.wait_total_ms += wait_ms
+            self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+            index = next((i for i, bound in enumerate(WAIT_BUCKETS_MS) if wait_ms <= bound), len(WAIT_BUCKETS_MS))
+            self.wait_buckets[index] += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        size = pool.size() if isinstance(pool, QueuePool) else None
+        max_overflow = getattr(pool, "_max_overflow", None)
+        checked_out = pool.checkedout() if isinstance(pool, QueuePool) else None
+        capacity = size + max(max_overflow, 0) if size is not None and max_overflow is not None else None
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "name": self.name,
+                "poolClass": type(pool).__name__,
+                "size": size,
+                "maxOverflow": max_overflow,
+                "checkedOut": checked_out,
+                "saturation": round(checked_out / capacity, 4) if capacity else None,
+                "peakCheckedOut": self.peak_checked_out,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "saturatedCheckouts": self.saturated_checkouts,
+                "waitAvgMs": round(self.wait_total_ms / attempts, 3) if attempts else 0.0,
+                "waitMaxMs": round(self.wait_max_ms, 3),
+                "waitBucketsMs": {
+                    **{f"le_{bound}": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)},
+                    "le_inf": self.wait_buckets[-1],
+                },
+            }
+
+
+class _InstrumentedPoolMixin:
+    # recreate()/dispose() 시 생성자 인자가 그대로 복제되므로 지표는 클래스 속성으로 둔다
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        saturated = self.checkedout() >= self.size() + max(self._max_overflow, 0)
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record(
+                (time.perf_counter() - started) * 1000,
+                saturated=saturated,
+                timed_out=timed_out,
+                checked_out=self.checkedout(),
+            )
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    metrics = PoolMetrics("sync")
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics("async")
+
+
+def pool_sizing(settings: Settings) -> tuple[int, int]:
+    """프로세스당 (pool_size, max_overflow).
+
+    DB 연결 상한을 uvicorn worker 수로 나누고, 그 몫을 동기/비동기 엔진이 절반씩 쓴다.
+    동기 엔드포인트는 스레드 하나가 연결 하나를 잡으므로 pool_size는 스레드 수를 넘지 않는다.
+    """
+    budget = max(2, settings.db_max_connections // max(1, settings.web_concurrency))
+    per_engine = max(1, budget // 2)
+    size = settings.db_pool_size or min(settings.web_threads, per_engine)
+    overflow = settings.db_max_overflow if settings.db_max_overflow is not None else max(0, per_engine - size)
+    return size, overflow
+
+
+def engine_pool_kwargs(settings: Settings, url, *, async_: bool = False) -> dict[str, Any]:
+    """create_engine/create_async_engine에 넘길 풀 옵션. SQLite(로컬/테스트)는 기본 풀을 그대로 쓴다."""
+    if url.get_backend_name() == "sqlite":
+        return {}
+    size, overflow = pool_sizing(settings)
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if async_ else InstrumentedQueuePool,
+        "pool_size": size,
+        "max_overflow": overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        # MySQL wait_timeout보다 먼저 연결을 교체하고, 유휴 후 끊긴 연결은 체크아웃 시 ping으로 걸러낸다
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+def pool_report(*pools: Pool) -> dict[str, Any]:
+    items = []
+    for pool in pools:
+        metrics = getattr(pool, "metrics", None)
+        if metrics is None:
+            metrics = PoolMetrics(type(pool).__name__)
+        items.append(metrics.snapshot(pool))
+    return {"pid": os.getpid(), "pools": items}
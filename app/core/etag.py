@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Callable, Optional
+
+from fastapi import Request, Response
+
+from .response_cache import render_json
+
+# 응답 형식이 바뀌면 올려서 클라이언트가 갖고 있는 ETag를 모두 무효화한다
+ETAG_FORMAT_VERSION = "1"
+
+# 304에 그대로 실어 보내는 헤더 (RFC 9110 15.4.5)
+_NOT_MODIFIED_HEADERS = (b"etag", b"cache-control", b"vary", b"expires", b"content-location", b"date")
+
+
+def compute_etag(*parts: Any) -> str:
+    """버전 스탬프 조각들로 강한 ETag를 만든다. 본문을 직렬화하지 않고 계산할 수 있어야 한다."""
+    digest = hashlib.blake2b(repr((ETAG_FORMAT_VERSION, *parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    # If-None-Match는 약한 비교를 쓴다: W/ 접두어는 무시
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def conditional_json(
+    request: Request,
+    etag: str,
+    build: Callable[[], Any],
+    *,
+    cache_control: str = "no-cache",
+    private: bool = False,
+) -> Response:
+    """If-None-Match가 etag와 맞으면 build를 호출하지 않고 304를 돌려준다.
+
+    build는 Response 또는 JSON으로 직렬화할 값을 돌려준다. private이면 사용자별 응답으로 표시한다.
+    """
+    headers = {"ETag": etag, "Cache-Control": f"private, {cache_control}" if private else cache_control}
+    if private:
+        headers["Vary"] = "Authorization"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    value = build()
+    response = value if isinstance(value, Response) else Response(content=render_json(value), media_type="application/json")
+    response.headers.update(headers)
+    return response
+
+
+class ConditionalGetMiddleware:
+    """ETag를 단 GET 200 응답이 If-None-Match와 맞으면 본문 없이 304로 바꾼다.
+
+    conditional_json을 쓰지 않고 ETag만 붙인 엔드포인트도 조건부 요청에 응답하게 하는 안전망이다
+    (이 경우 본문은 이미 만들어졌으므로 전송량만 줄어든다).
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+                break
+        if if_none_match is None:
+            await self.app(scope, receive, send)
+            return
+
+        suppress_body = False
+
+        async def send_wrapper(message) -> None:
+            nonlocal suppress_body
+            if message["type"] == "http.response.start":
+                headers = message.get("headers") or []
+                etag = next((value.decode("latin-1") for name, value in headers if name == b"etag"), None)
+                if message["status"] == 200 and etag and etag_matches(if_none_match, etag):
+                    suppress_body = True
+                    message = {
+                        "type": "http.response.start",
+                        "status": 304,
+                        "headers": [(name, value) for name, value in headers if name in _NOT_MODIFIED_HEADERS],
+                    }
+            elif message["type"] == "http.response.body" and suppress_body:
+                if message.get("more_body", False):
+                    return
+                message = {"type": "http.response.body", "body": b""}
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from typing import Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+
+from .etag import etag_matches
+from .responses import FastJSONResponse
+
+
+class OpenAPIDocument:
+    """앱의 OpenAPI 문서를 한 번만 만들어 직렬화된 바이트로 들고 있는다.
+
+    FastAPI 기본 /openapi.json은 요청마다 dict를 다시 직렬화하고, 워커의 첫 요청에서 전체 스키마를
+    만든다. 여기서는 기동 시(lifespan) 또는 첫 요청에 한 번 만들고 이후에는 같은 바이트와 ETag를 돌려준다.
+    """
+
+    def __init__(self, app: FastAPI, *, max_age_seconds: int = 300) -> None:
+        self.app = app
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._body: Optional[bytes] = None
+        self._etag: Optional[str] = None
+
+    def build(self) -> bytes:
+        if self._body is None:
+            with self._lock:
+                if self._body is None:
+                    body = FastJSONResponse(content=self.app.openapi()).body
+                    self._etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+                    self._body = body
+        return self._body
+
+    def response(self, request: Request) -> Response:
+        body = self.build()
+        headers = {"ETag": self._etag, "Cache-Control": f"public, max-age={self.max_age_seconds}"}
+        if etag_matches(request.headers.get("if-none-match"), self._etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+def install_openapi(
+    app: FastAPI,
+    *,
+    openapi_url: str = "/openapi.json",
+    docs_url: str = "/docs",
+    redoc_url: str = "/redoc",
+    oauth2_redirect_url: str = "/docs/oauth2-redirect",
+) -> OpenAPIDocument:
+    """FastAPI(openapi_url=None, docs_url=None, redoc_url=None)로 만든 앱에 캐시된 문서와 문서 UI 경로를 붙인다."""
+    document = OpenAPIDocument(app)
+
+    def _spec_url(request: Request) -> str:
+        return request.scope.get("root_path", "").rstrip("/") + openapi_url
+
+    async def openapi(request: Request) -> Response:
+        return document.response(request)
+
+    async def swagger_ui(request: Request) -> Response:
+        return get_swagger_ui_html(
+            openapi_url=_spec_url(request),
+            title=f"{app.title} - Swagger UI",
+            oauth2_redirect_url=request.scope.get("root_path", "").rstrip("/") + oauth2_redirect_url,
+        )
+
+    async def swagger_ui_redirect(request: Request) -> Response:
+        return get_swagger_ui_oauth2_redirect_html()
+
+    async def redoc(request: Request) -> Response:
+        return get_redoc_html(openapi_url=_spec_url(request), title=f"{app.title} - ReDoc")
+
+    app.add_route(openapi_url, openapi, include_in_schema=False)
+    app.add_route(docs_url, swagger_ui, include_in_schema=False)
+    app.add_route(oauth2_redirect_url, swagger_ui_redirect, include_in_schema=False)
+    app.add_route(redoc_url, redoc, include_in_schema=False)
+    return document
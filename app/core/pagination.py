@@ -0,0 +1,90 @@
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+    return value
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록을 불투명한 커서 문자열로 인코딩한다."""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int) -> Optional[List[Any]]:
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError("cursor size mismatch")
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="잘못된 cursor 값")
+
+
+def keyset_after(key, last_value: Any, tiebreak, last_tiebreak: Any, descending: bool = True, nulls_last: bool = True):
+    """(key, tiebreak) 정렬에서 마지막 행 다음에 오는 행들의 조건.
+
+    정렬은 ORDER BY key IS NULL, key DESC|ASC, tiebreak DESC|ASC 를 가정한다 (NULL은 항상 뒤).
+    """
+    if descending:
+        key_after = key < last_value
+        tie_after = tiebreak < last_tiebreak
+    else:
+        key_after = key > last_value
+        tie_after = tiebreak > last_tiebreak
+    if last_value is None:
+        return and_(key.is_(None), tie_after)
+    conditions = [key_after, and_(key == last_value, tie_after)]
+    if nulls_last:
+        conditions.append(key.is_(None))
+    return or_(*conditions)
+
+
+def keyset_order(key, tiebreak, descending: bool = True, nulls_last: bool = True):
+    """keyset_after와 짝을 이루는 ORDER BY.
+
+    NOT NULL 키는 nulls_last=False로 넘겨 `key IS NULL` 항을 빼야 인덱스가 정렬을 대신할 수 있다.
+    """
+    if descending:
+        order = [key.desc(), tiebreak.desc()]
+    else:
+        order = [key.asc(), tiebreak.asc()]
+    if nulls_last:
+        order.insert(0, key.is_(None))
+    return order
+
+
+def tuple_after(keys: list, last_values: List[Any]):
+    """NOT NULL 키 (k1, k2, ..., id) 내림차순 정렬에서 마지막 행 다음에 오는 행들의 조건."""
+    conditions = []
+    for idx, key in enumerate(keys):
+        equal_prefix = [keys[i] == last_values[i] for i in range(idx)]
+        conditions.append(and_(*equal_prefix, key < last_values[idx]))
+    return or_(*conditions)
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models import Book, BookAuthor, BookCategory, BookList, Review
+from .config import get_settings
+from .responses import FastJSONResponse
+from .ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def book_tag(book_id: int) -> str:
+    return f"book:{book_id}"
+
+
+def booklist_tag(list_type: str) -> str:
+    return f"booklist:{list_type}"
+
+
+# 공유 백엔드에서 가져온 항목의 로컬 사본 수명
+LOCAL_COPY_TTL_SECONDS = 30
+
+# 리뷰가 하나라도 바뀌면 무효화되는 집계(인기 추천 등)용 태그
+REVIEWS_TAG = "reviews"
+
+# 공유 백엔드 장애 후 다시 시도하기까지 캐시 없이 응답하는 시간
+BACKEND_RETRY_SECONDS = 5
+
+
+class CacheBackendError(Exception):
+    """공유 백엔드에 접근할 수 없음. ResponseCache는 이 경우 캐시 없이 응답한다."""
+
+
+class MemoryBackend:
+    """공유 백엔드의 로컬 대역. Redis와 같은 인터페이스를 dict로 흉내 낸다 (테스트/단일 프로세스용)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[float, bytes]] = {}
+        self._tags: dict[str, int] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl_seconds, value)
+
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        with self._lock:
+            return [self._tags.get(tag, 0) for tag in tags]
+
+    def bump_tags(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._tags[tag] = self._tags.get(tag, 0) + 1
+
+
+class RedisBackend:
+    """프로세스(API worker, 배치 worker) 간에 캐시와 태그 버전을 공유한다."""
+
+    def __init__(self, url: str, prefix: str = "respcache:", timeout_seconds: float = 0.5) -> None:
+        import redis  # 선택 의존성: RESPONSE_CACHE_REDIS_URL을 설정한 경우에만 필요
+
+        # Redis가 응답하지 않을 때 요청이 오래 묶이지 않도록 짧은 타임아웃을 둔다
+        self._client = redis.Redis.from_url(
+            url, socket_timeout=timeout_seconds, socket_connect_timeout=timeout_seconds
+        )
+        self._errors = redis.RedisError
+        self._prefix = prefix
+
+    def _call(self, fn: Callable[[], Any]) -> Any:
+        try:
+            return fn()
+        except self._errors as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._call(lambda: self._client.get(self._prefix + key))
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._call(lambda: self._client.set(self._prefix + key, value, px=max(1, int(ttl_seconds * 1000))))
+
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        if not tags:
+            return []
+        values = self._call(lambda: self._client.mget([f"{self._prefix}tag:{tag}" for tag in tags]))
+        return [int(value or 0) for value in values]
+
+    def bump_tags(self, tags: Iterable[str]) -> None:
+        def bump() -> None:
+            pipe = self._client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(f"{self._prefix}tag:{tag}")
+            pipe.execute()
+
+        self._call(bump)
+
+
+class ResponseCache:
+    """태그 버전으로 무효화하는 JSON 응답 캐시.
+
+    항목은 렌더링된 JSON 바이트와 저장 시점의 태그 버전을 함께 갖는다. 읽을 때 현재 태그 버전과 다르면
+    버린다. 무효화는 태그 버전을 올리기만 하므로, 백엔드를 공유하면 다른 프로세스의 로컬 사본도 함께
+    무효화된다. 백엔드가 없으면 태그 버전도 이 프로세스 안에서만 관리한다.
+
+    공유 백엔드에 접근할 수 없으면 로그를 남기고 BACKEND_RETRY_SECONDS 동안 캐시 없이 응답한다
+    (태그 버전을 확인할 수 없으므로 로컬 사본도 쓰지 않는다).
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, backend: Optional[Any] = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend
+        self._local = TTLCache(max_entries, ttl_seconds)
+        self._lock = threading.Lock()
+        self._local_tags: dict[str, int] = {}
+        self._backend_down_until = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._local.enabled
+
+    def _backend_call(self, fn: Callable[[], Any]) -> Any:
+        if time.monotonic() < self._backend_down_until:
+            raise CacheBackendError("backend marked unavailable")
+        try:
+            return fn()
+        except CacheBackendError as exc:
+            self._backend_down_until = time.monotonic() + BACKEND_RETRY_SECONDS
+            logger.warning("response cache backend unavailable, serving uncached: %s", exc)
+            raise
+
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        if self.backend is not None:
+            return self._backend_call(lambda: self.backend.tag_versions(tags))
+        with self._lock:
+            return [self._local_tags.get(tag, 0) for tag in tags]
+
+    def invalidate(self, *tags: str) -> None:
+        if not tags:
+            return
+        if self.backend is not None:
+            try:
+                # 무효화는 장애 표시 중에도 시도한다 (놓치면 다른 프로세스가 TTL까지 낡은 응답을 쓴다)
+                self.backend.bump_tags(tags)
+            except CacheBackendError as exc:
+                self._backend_down_until = time.monotonic() + BACKEND_RETRY_SECONDS
+                logger.error("response cache invalidation failed tags=%s: %s", sorted(tags), exc)
+                self._local.clear()
+            return
+        with self._lock:
+            for tag in tags:
+                self._local_tags[tag] = self._local_tags.get(tag, 0) + 1
+
+    def _is_current(self, entry: tuple[tuple, tuple, bytes]) -> bool:
+        tags, versions, _ = entry
+        return tuple(self.tag_versions(tags)) == versions
+
+    def _lookup(self, key: str) -> Optional[tuple[tuple, tuple, bytes]]:
+        entry = self._local.get(key)
+        if entry is not None and self._is_current(entry):
+            return entry
+        if self.backend is None:
+            return None
+        # 로컬 사본이 없거나 낡았으면 다른 프로세스가 새로 채운 공유 항목을 본다
+        raw = self._backend_call(lambda: self.backend.get(key))
+        if raw is None:
+            return None
+        header, _, body = raw.partition(b"\n")
+        meta = json.loads(header)
+        entry = (tuple(meta["tags"]), tuple(meta["versions"]), body)
+        if not self._is_current(entry):
+            return None
+        # 공유 항목은 로컬에 짧게만 복사해 둔다 (유효성은 매번 태그 버전으로 확인)
+        self._local.set(key, entry, ttl_seconds=min(self.ttl_seconds, LOCAL_COPY_TTL_SECONDS))
+        return entry
+
+    def get_or_set(
+        self,
+        key: str,
+        tags: Sequence[str],
+        producer: Callable[[], Any],
+        *,
+        extra_tags: Optional[Callable[[Any], Iterable[str]]] = None,
+    ) -> tuple[bytes, bool]:
+        """(JSON 바이트, 캐시 적중 여부). extra_tags는 결과를 보고 정해지는 태그(포함된 책 등)."""
+        if not self.enabled:
+            return render_json(producer()), False
+        try:
+            entry = self._lookup(key)
+            if entry is not None:
+                return entry[2], True
+            # 계산 중에 무효화되면 다음 조회에서 버전이 어긋나도록 버전을 먼저 읽는다
+            versions = self.tag_versions(tags)
+        except CacheBackendError:
+            return render_json(producer()), False
+
+        value = producer()
+        dynamic = sorted(set(extra_tags(value)) - set(tags)) if extra_tags else []
+        body = render_json(value)
+        try:
+            all_tags = (*tags, *dynamic)
+            all_versions = (*versions, *self.tag_versions(dynamic))
+            self._local.set(key, (all_tags, all_versions, body))
+            if self.backend is not None:
+                header = json.dumps({"tags": all_tags, "versions": all_versions}).encode()
+                self._backend_call(lambda: self.backend.set(key, header + b"\n" + body, self.ttl_seconds))
+        except CacheBackendError:
+            pass
+        return body, False
+
+    def clear_local(self) -> None:
+        self._local.clear()
+
+
+def render_json(value: Any) -> bytes:
+    # FastAPI가 response_model을 직렬화할 때와 같은 출력 (by_alias, 압축 JSON). 모델은 재검증 없이 바로 직렬화
+    if isinstance(value, BaseModel):
+        return value.model_dump_json(by_alias=True).encode()
+    return FastJSONResponse(content=jsonable_encoder(value)).body
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        backend = RedisBackend(settings.response_cache_redis_url) if settings.response_cache_redis_url else None
+        _cache = ResponseCache(settings.response_cache_max_entries, settings.response_cache_ttl_seconds, backend)
+    return _cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    global _cache
+    _cache = cache
+
+
+def cached_json_response(
+    key: str,
+    tags: Sequence[str],
+    producer: Callable[[], Any],
+    *,
+    extra_tags: Optional[Callable[[Any], Iterable[str]]] = None,
+) -> Response:
+    """공개(사용자 무관) 조회 응답을 캐시에서 돌려주거나 producer로 만들어 캐시한다."""
+    body, hit = get_response_cache().get_or_set(key, tags, producer, extra_tags=extra_tags)
+    return Response(content=body, media_type="application/json", headers={"X-Cache": "HIT" if hit else "MISS"})
+
+
+def invalidate_cache_tags(*tags: str) -> None:
+    get_response_cache().invalidate(*tags)
+
+
+def _tags_for(obj: Any) -> list[str]:
+    if isinstance(obj, Book):
+        return [book_tag(obj.id)] if obj.id is not None else []
+    if isinstance(obj, (BookAuthor, BookCategory)):
+        return [book_tag(obj.book_id)] if obj.book_id is not None else []
+    if isinstance(obj, Review):
+        return [book_tag(obj.book_id), REVIEWS_TAG] if obj.book_id is not None else [REVIEWS_TAG]
+    if isinstance(obj, BookList):
+        return [booklist_tag(obj.list_type)] if obj.list_type else []
+    return []
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_cache_tags(session: Session, flush_context) -> None:
+    # ORM으로 책/리뷰/목록을 바꾸는 모든 경로에서 태그를 모았다가 커밋 후에 무효화한다
+    tags = session.info.setdefault("response_cache_tags", set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tags.update(_tags_for(obj))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tags(session: Session) -> None:
+    tags = session.info.pop("response_cache_tags", None)
+    if not tags:
+        return
+    try:
+        invalidate_cache_tags(*tags)
+    except Exception:  # noqa: BLE001
+        # DB 커밋은 이미 끝났으므로 캐시 문제로 성공한 쓰기를 실패로 돌려주지 않는다
+        logger.exception("response cache invalidation failed tags=%s", sorted(tags))
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_collected_tags(session: Session) -> None:
+    session.info.pop("response_cache_tags", None)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json으로 동작
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스. orjson이 설치돼 있으면 orjson으로 직렬화한다 (출력 형식은 JSONResponse와 같다)."""
+
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def model_response(
+    model: BaseModel,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """이미 만든 응답 모델을 pydantic-core로 바로 JSON 바이트로 만든다.
+
+    FastAPI는 반환된 모델을 dict로 풀었다가 response_model로 다시 검증한 뒤 직렬화하므로, 큰 목록
+    응답은 이 함수로 그 과정을 건너뛴다. 라우트의 response_model은 문서용으로 그대로 둔다.
+    """
+    return Response(
+        content=model.model_dump_json(by_alias=True),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
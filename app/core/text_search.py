@@ -0,0 +1,27 @@
+from sqlalchemy import or_
+from sqlalchemy.dialects.mysql import match as mysql_match
+from sqlalchemy.orm import Session
+
+# ngram FULLTEXT 인덱스의 최소 토큰 길이 (MySQL ngram_token_size 기본값)
+FULLTEXT_MIN_TERM_LENGTH = 2
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def uses_fulltext(db: Session, term: str) -> bool:
+    return db.get_bind().dialect.name == "mysql" and len(term) >= FULLTEXT_MIN_TERM_LENGTH
+
+
+def fulltext_match(columns: list, term: str):
+    """ngram FULLTEXT 인덱스에 대한 MATCH ... AGAINST (구문 검색, boolean mode) 식. 값이 관련도 점수다."""
+    phrase = term.replace('"', " ").strip()
+    return mysql_match(*columns, against=f'"{phrase}"').in_boolean_mode()
+
+
+def like_any(columns: list, term: str, *, prefix_only: bool = False):
+    """FULLTEXT를 쓸 수 없을 때(sqlite, 한 글자 검색어)의 LIKE 조건."""
+    escaped = escape_like(term)
+    pattern = f"{escaped}%" if prefix_only else f"%{escaped}%"
+    return or_(*[column.like(pattern, escape="\\") for column in columns])
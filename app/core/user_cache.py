@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..models import User
+from .config import get_settings
+from .response_cache import CacheBackendError, get_response_cache
+from .ttl_cache import TTLCache
+
+# 인증 직후 자주 읽는 컬럼만 담는다. 나머지(password_hash 등)는 접근 시 지연 로딩된다
+SNAPSHOT_COLUMNS = (
+    "id",
+    "email",
+    "login_id",
+    "name",
+    "nickname",
+    "is_admin",
+    "description",
+    "profile_image_url",
+    "profile_visibility",
+    "taste_analyzed",
+    "email_verified",
+    "fcm_token",
+    "created_at",
+    "updated_at",
+)
+
+_cache: Optional[TTLCache] = None
+
+
+def _get_cache() -> TTLCache:
+    global _cache
+    if _cache is None:
+        settings = get_settings()
+        _cache = TTLCache(settings.auth_user_cache_max_entries, settings.auth_user_cache_ttl_seconds)
+    return _cache
+
+
+def _user_tag(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+def snapshot_version(user_id: int) -> Optional[int]:
+    """공유 백엔드(응답 캐시의 Redis)에 있는 사용자 버전.
+
+    백엔드가 없으면 0(프로세스 로컬 무효화만), 백엔드에 접근할 수 없으면 None(이번 요청은 캐시를 쓰지 않는다).
+    DB에서 사용자를 읽기 전에 구해야, 읽는 사이에 올라간 버전으로 옛 값을 저장하지 않는다.
+    """
+    if not _get_cache().enabled:
+        return None
+    cache = get_response_cache()
+    if cache.backend is None:
+        return 0
+    try:
+        return cache.tag_versions([_user_tag(user_id)])[0]
+    except CacheBackendError:
+        return None
+
+
+def load_cached_user(db: Session, user_id: int, issued_at: Any, version: Optional[int]) -> Optional[User]:
+    """(user id, 토큰 iat) 기준 스냅샷으로 User를 세션에 붙여 돌려준다. SELECT 없이 persistent 상태가 된다.
+
+    스냅샷에서 바꾼 속성은 평소처럼 flush되고, 스냅샷에 없는 컬럼과 관계는 접근할 때 로딩된다.
+    version은 snapshot_version 값으로, 저장할 때와 다르면(다른 프로세스에서 무효화) 쓰지 않는다.
+    """
+    if version is None:
+        return None
+    entry = _get_cache().get((user_id, issued_at))
+    if entry is None or entry[0] != version:
+        return None
+    user = User(**entry[1])
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def store_user_snapshot(user: User, issued_at: Any, version: Optional[int]) -> None:
+    if version is None:
+        return
+    _get_cache().set((user.id, issued_at), (version, {column: getattr(user, column) for column in SNAPSHOT_COLUMNS}))
+
+
+def invalidate_user(user_id: int) -> None:
+    """해당 사용자의 스냅샷을 모두 버린다 (프로필/관리자 여부 변경, 탈퇴).
+
+    응답 캐시에 공유 백엔드(Redis)가 있으면 사용자 버전을 올려 다른 프로세스(gunicorn worker, 배치 worker)의
+    스냅샷도 함께 무효화한다. 없으면 다른 프로세스에는 TTL이 지나야 반영된다.
+    """
+    if _cache is not None:
+        _cache.pop_where(lambda key: key[0] == user_id)
+    cache = get_response_cache()
+    if cache.backend is not None:
+        cache.invalidate(_user_tag(user_id))
+
+
+def clear_user_cache() -> None:
+    if _cache is not None:
+        _cache.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_users(session: Session, flush_context) -> None:
+    # 이 프로세스에서 User를 수정/삭제하는 모든 경로를 한 곳에서 잡는다.
+    # 커밋 전에 버리면 다른 요청이 아직 커밋되지 않은 옛 행을 읽어 다시 캐시할 수 있으므로 커밋 후에 버린다
+    user_ids = session.info.setdefault("user_cache_invalidate", set())
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            user_ids.add(obj.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop("user_cache_invalidate", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_collected_users(session: Session) -> None:
+    session.info.pop("user_cache_invalidate", None)
@@ -1,10 +1,16 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 from .core.config import get_settings
+from .core.db_pool import engine_pool_kwargs
+# 세션 훅(인증 사용자/응답 캐시 무효화, ETag 버전 스탬프)을 DB를 쓰는 모든 프로세스(API, worker, 스크립트)에 등록한다
+from .core import response_cache as _response_cache, user_cache as _user_cache  # noqa: F401
+from .services import version_stamps as _version_stamps  # noqa: F401
 
-# 동기 엔진 사용 (초기 단순화). 후에 async 엔진(aiomysql)로 전환 가능.
+# 동기 엔진: 쓰기/대부분의 엔드포인트. 조회가 잦은 엔드포인트는 아래 async 엔진(aiomysql)을 쓴다.
 settings = get_settings()
 DATABASE_URL = settings.database_url
 
@@ -12,10 +18,28 @@ engine = create_engine(
 	DATABASE_URL,
 	echo=(settings.environment == "local"),
 	future=True,
+	**engine_pool_kwargs(settings, make_url(DATABASE_URL)),
 )
 
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
+# 같은 DB를 async 드라이버로 연다 (PyMySQL -> aiomysql, pysqlite -> aiosqlite)
+_ASYNC_DRIVERS = {"mysql": "mysql+aiomysql", "sqlite": "sqlite+aiosqlite"}
+
+
+def to_async_url(url: str):
+	parsed = make_url(url)
+	return parsed.set(drivername=_ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername))
+
+
+async_engine = create_async_engine(
+	to_async_url(DATABASE_URL),
+	echo=(settings.environment == "local"),
+	**engine_pool_kwargs(settings, make_url(DATABASE_URL), async_=True),
+)
+
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 
 def get_db() -> Generator[Session, None, None]:
 	db = SessionLocal()
@@ -24,3 +48,8 @@ def get_db() -> Generator[Session, None, None]:
 	finally:
 		db.close()
 
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+	"""async 엔드포인트용 세션. 기존 동기 쿼리 코드는 `await db.run_sync(fn, ...)`로 이벤트 루프를 막지 않고 실행한다."""
+	async with AsyncSessionLocal() as db:
+		yield db
@@ -7,9 +7,14 @@ from fastapi.exceptions import RequestValidationError
 from fastapi import HTTPException
 from sqlalchemy import text
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.staticfiles import StaticFiles
+from contextlib import asynccontextmanager
+import logging
 import os
 
+import anyio.to_thread
+
 from .core.config import get_settings
 from .api import auth as auth_router
 # from .api import reading as reading_router  # corrupted in workspace, use fixed version
@@ -38,21 +43,66 @@ from .api import badge as badge_router
 from .api import reading_summary as reading_summary_router
 from .api import user_profile as user_profile_router
 from .api import library as library_router
+from .api import admin_metrics as admin_metrics_router
+from .core.etag import ConditionalGetMiddleware
+from .core.openapi_doc import install_openapi
+from .core.responses import FastJSONResponse
 from .schemas.error import ErrorResponse
-from .database import engine
+from .database import SessionLocal, engine
+from .services.tag_catalog import ensure_system_tags, get_tag_catalog
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _seed_tag_catalog() -> None:
+    # 시스템 태그 시드와 카탈로그 예열은 요청 경로가 아닌 기동 시 한 번만 수행한다
+    db = SessionLocal()
+    try:
+        ensure_system_tags(db)
+        get_tag_catalog(db)
+    except Exception:  # noqa: BLE001
+        db.rollback()
+        logger.warning("tag catalog seed skipped at startup", exc_info=True)
+    finally:
+        db.close()
+
 
-app = FastAPI(title="BookStopper API", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 동기 엔드포인트 스레드 수를 풀 크기 계산에 쓴 값과 맞춘다
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.web_threads
+    _seed_tag_catalog()
+    # 스키마 생성(수백 ms)을 트래픽을 받기 전에 끝내 둔다
+    openapi_document.build()
+    yield
+
+
+# /openapi.json, /docs, /redoc은 install_openapi가 미리 만든 문서로 제공한다
+app = FastAPI(
+    title="BookStopper API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None,
+)
 
 origins = [o.strip() for o in settings.cors_origins.split(",") if o.strip()]
 
+# CORS보다 안쪽에 두어 304 응답에도 CORS 헤더가 붙게 한다
+app.add_middleware(ConditionalGetMiddleware)
+if settings.api_gzip_min_bytes > 0:
+    # 압축은 보통 nginx가 맡는다. 프록시 없이 띄울 때만 켜서 두 번 압축하지 않게 한다
+    app.add_middleware(GZipMiddleware, minimum_size=settings.api_gzip_min_bytes, compresslevel=5)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins or ["*"],
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["Authorization", "Content-Type", "Accept", "Origin"],
+    allow_headers=["Authorization", "Content-Type", "Accept", "Origin", "If-None-Match"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
 
 app.include_router(auth_router.router)
@@ -81,6 +131,7 @@ app.include_router(badge_router.router)
 app.include_router(reading_summary_router.router)
 app.include_router(user_profile_router.router)
 app.include_router(user_profile_router.router)
+app.include_router(admin_metrics_router.router)
 
 # Serve uploaded files (customer-service attachments)
 _upload_dir = os.environ.get("UPLOAD_DIR", os.path.abspath(os.path.join(os.getcwd(), "uploads")))
@@ -322,4 +373,7 @@ def _custom_openapi():
         spec["components"] = components
     app.openapi_schema = spec
     return app.openapi_schema
-# app.openapi = _custom_openapi
+
+
+app.openapi = _custom_openapi
+openapi_document = install_openapi(app)
@@ -166,6 +166,11 @@ class User(Base):
     # 취향 분석 완료 여부
     taste_analyzed = Column(Boolean, nullable=False, default=False)
 
+    # 서재(보관함/별점/진행 기록)가 바뀔 때마다 +1 (ETag용)
+    library_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # 이 사용자가 쓴 리뷰 댓글 수 (리뷰 목록 응답의 user_comment_count)
+    review_comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
@@ -253,6 +258,10 @@ class Book(Base):
     google_ratings_count = Column(Integer, nullable=True)
     description = Column(Text, nullable=True)
 
+    # ETag용 버전 스탬프: 메타데이터(저자/카테고리 포함) 변경 시각, 리뷰 평점이 바뀔 때마다 +1
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    rating_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # 관계
     authors = relationship(
         "BookAuthor",
@@ -456,6 +465,10 @@ class UserBook(Base):
     # 전체 누적 독서 시간(초 단위, 선택)
     total_reading_seconds = Column(Integer, nullable=True)
 
+    # 마지막으로 읽은 페이지 (이벤트/세션 종료/페이지 기록 시 갱신되는 비정규화 값)
+    current_page = Column(Integer, nullable=True)
+    current_page_updated_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
@@ -621,6 +634,8 @@ class Review(Base):
 
     # 좋아요 단순 카운트 (per-user isLiked는 제거)
     like_count = Column(Integer, nullable=False, default=0)
+    # 댓글 수 (댓글 작성/삭제 시 원자적으로 갱신)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     is_spoiler = Column(Boolean, nullable=False, default=False)
 
@@ -672,6 +687,15 @@ class ReviewComment(Base):
     review = relationship("Review", back_populates="comments")
 
 
+class BookReviewStats(Base):
+    """책 단위 리뷰 집계 행. 리뷰 목록마다 전체 댓글 수를 다시 세지 않도록 유지한다."""
+
+    __tablename__ = "book_review_stats"
+
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+
 # =========================
 # 그룹 / 모임
 # =========================
@@ -700,6 +724,14 @@ class Group(Base):
 
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
+    # 활동 카운터: 가입/탈퇴/게시글/댓글 경로에서 갱신, 워커가 주기적으로 실제 값과 맞춘다
+    member_count = Column(Integer, nullable=False, default=0, server_default="0")
+    post_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # 시간 감쇠 활동 점수 (워커가 재계산, 추천 그룹 정렬 키)
+    activity_score = Column(Float, nullable=False, default=0, server_default="0")
+    activity_score_updated_at = Column(DateTime, nullable=True)
+
     members = relationship(
         "GroupMember",
         back_populates="group",
@@ -774,6 +806,9 @@ class GroupPost(Base):
     discussion = Column(JSON, nullable=True)
     is_pinned = Column(Boolean, nullable=False, default=False)
     pinned_at = Column(DateTime, nullable=True)
+    # group_post_likes / group_comments 행 수 (같은 트랜잭션에서 원자적으로 갱신)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, nullable=True)
 
@@ -813,6 +848,8 @@ class GroupComment(Base):
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     parent_id = Column(Integer, ForeignKey("group_comments.id", ondelete="CASCADE"), nullable=True)
     content = Column(Text, nullable=False)
+    # group_comment_likes 행 수 (좋아요/취소 시 같은 트랜잭션에서 갱신)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, nullable=True)
 
@@ -1085,6 +1122,13 @@ class ReadingSession(Base):
     end_page = Column(Integer, nullable=True)
     total_seconds = Column(Integer, nullable=True)
 
+    # 이벤트 압축(compaction) 결과: 원본 reading_events 삭제 후에도 남는 요약값
+    page_turn_count = Column(Integer, nullable=True)
+    max_page = Column(Integer, nullable=True)
+    last_page = Column(Integer, nullable=True)
+    last_page_at = Column(DateTime, nullable=True)
+    events_compacted_at = Column(DateTime, nullable=True)
+
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     user = relationship("User")
@@ -1185,6 +1229,37 @@ class UserBadge(Base):
     badge_definition = relationship("BadgeDefinition", back_populates="user_badges")
 
 
+class UserBadgeMetric(Base):
+    """배지 판정용 사용자 지표. 이벤트가 건드린 카테고리의 지표만 다시 집계해 갱신한다."""
+
+    __tablename__ = "user_badge_metrics"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    completed_books = Column(Integer, nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
+    review_count = Column(Integer, nullable=False, default=0, server_default="0")
+    wishlist_count = Column(Integer, nullable=False, default=0, server_default="0")
+    bookmark_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # {장르명: 평점 수}
+    genre_counts = Column(JSON, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class BadgeEvaluationEvent(Base):
+    """워커가 처리할 배지 평가 대기열. (user_id, category)당 한 행만 쌓인다."""
+
+    __tablename__ = "badge_evaluation_events"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    category = Column(String(50), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("user_id", "category", name="uq_badge_evaluation_event"),
+    )
+
+
 # =========================
 # Collection / Tag
 # =========================
@@ -1198,6 +1273,9 @@ class Collection(Base):
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     is_private = Column(Boolean, nullable=False, default=False)
+    # collection_likes / collection_books 행 수 (좋아요·도서 추가/삭제 시 같은 트랜잭션에서 갱신)
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
+    book_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
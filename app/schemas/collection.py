@@ -91,6 +91,7 @@ class CollectionListItem(BaseModel):
 class CollectionListResponse(BaseModel):
     totalCount: int
     collections: list[CollectionListItem]
+    nextCursor: str | None = None
 
 
 class CollectionDetailResponse(BaseModel):
@@ -168,6 +168,7 @@ class GroupPostCreateRequest(BaseModel):
 
 class GroupPostListResponse(BaseModel):
     posts: list[GroupPostBase]
+    nextCursor: str | None = None
 
 
 class GroupPostDetailResponse(GroupPostBase):
@@ -243,6 +244,7 @@ class GroupSearchItem(BaseModel):
 
 class GroupSearchResponse(BaseModel):
     groups: list[GroupSearchItem]
+    nextCursor: str | None = None
 
 
 class GroupCommentReply(BaseModel):
@@ -266,10 +268,17 @@ class GroupCommentItem(BaseModel):
     likeCount: int
     isLiked: bool
     replies: list[GroupCommentReply]
+    replyCount: int = 0
 
 
 class GroupCommentListResponse(BaseModel):
     comments: list[GroupCommentItem]
+    nextCursor: str | None = None
+
+
+class GroupCommentReplyListResponse(BaseModel):
+    replies: list[GroupCommentReply]
+    nextCursor: str | None = None
 
 
 class GroupCommentCreateRequest(BaseModel):
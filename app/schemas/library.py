@@ -18,7 +18,7 @@ class BookLibraryItem(BaseModel):
     progress_percent: Optional[float] = Field(None, description="읽은 페이지 기반 진행률 (0~100)")
     current_page: Optional[int] = Field(
         None,
-        description="현재 페이지(최근 이벤트의 page → 최근 세션 end_page → UserPage.max(end_page) 순으로 추론)",
+        description="현재 페이지 (UserBook.current_page: 이벤트/세션 종료/페이지 기록 시 갱신)",
     )
     total_reading_seconds: Optional[int] = Field(None, description="책별 누적 독서 시간(초)")
 
@@ -26,3 +26,4 @@ class BookLibraryItem(BaseModel):
 class LibraryResponse(BaseModel):
     total: int
     items: List[BookLibraryItem]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
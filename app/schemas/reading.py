@@ -10,7 +10,7 @@ class ReadingSessionStartRequest(BaseModel):
         None,
         description=(
             "시작 페이지 (미제공 시 서버가 최근 읽은 페이지로 자동 설정: "
-            "최근 이벤트 페이지→최근 세션 end_page→없으면 1)"
+            "UserBook.current_page→없으면 1)"
         ),
     )
 
@@ -0,0 +1,32 @@
+import argparse
+
+from app.database import SessionLocal
+from app.services.badges import evaluate_user_badges
+from app.services.reading_progress import complete_finished_user_books
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mark READING user_books as COMPLETED when recorded pages reach the auto-complete ratio")
+    parser.add_argument("--user-id", type=int, default=None, help="Only process a single user")
+    parser.add_argument("--skip-badges", action="store_true", help="Do not evaluate badges for affected users")
+    parser.add_argument("--dry-run", action="store_true", help="Print affected users without writing DB")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        user_ids = complete_finished_user_books(session, user_id=args.user_id)
+        if args.dry_run:
+            session.rollback()
+            print(f"[DRY] users={sorted(user_ids)}")
+            return
+        session.commit()
+        if not args.skip_badges:
+            for user_id in sorted(user_ids):
+                evaluate_user_badges(session, user_id, ("reading",))
+        print(f"[DONE] users_completed={len(user_ids)}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import argparse
+
+from app.database import SessionLocal
+from app.models import UserBook
+from app.services.reading_progress import resolve_current_page
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill UserBook.current_page from reading events/sessions/pages")
+    parser.add_argument("--all", action="store_true", help="Recompute every row instead of only NULL current_page")
+    parser.add_argument("--batch-size", type=int, default=500, help="Commit every N rows")
+    parser.add_argument("--dry-run", action="store_true", help="Print resolved pages without writing DB")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        query = session.query(UserBook).order_by(UserBook.id.asc())
+        if not args.all:
+            query = query.filter(UserBook.current_page.is_(None))
+        user_books = query.all()
+
+        updated = 0
+        for idx, user_book in enumerate(user_books, start=1):
+            page, at = resolve_current_page(session, user_book.user_id, user_book.book_id)
+            if page is None:
+                continue
+            updated += 1
+            if args.dry_run:
+                print(f"[DRY] user_book_id={user_book.id} current_page={page}")
+                continue
+            user_book.current_page = page
+            user_book.current_page_updated_at = at
+            if updated % max(args.batch_size, 1) == 0:
+                session.commit()
+                print(f"[OK] {idx}/{len(user_books)} updated={updated}")
+        if not args.dry_run:
+            session.commit()
+        print(f"[DONE] processed={len(user_books)} updated={updated} dry_run={args.dry_run}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
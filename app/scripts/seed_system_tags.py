@@ -0,0 +1,22 @@
+import argparse
+
+from app.database import SessionLocal
+from app.services.tag_catalog import SYSTEM_TAGS, ensure_system_tags, get_tag_catalog
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed system tag categories/tags (normally done once at API startup)")
+    parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        ensure_system_tags(session)
+        catalog = get_tag_catalog(session)
+        expected = sum(len(tags) for _, _, tags in SYSTEM_TAGS)
+        print(f"[DONE] categories={len(catalog.categories)} tags={len(catalog.tags)} system_tags_expected={expected}")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,11 @@ from datetime import date, datetime
 import re
 import time
 
-import requests
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.response_cache import booklist_tag, invalidate_cache_tags
 from app.models import Author, Book, BookAuthor, BookCategory
 
 
@@ -280,6 +280,8 @@ def _fetch_item_list(query_type: str, *, category_id: int | None = None, max_res
     }
     if category_id:
         params["CategoryId"] = category_id
+    import requests  # 동기화 때만 쓰므로 API/worker 기동 시에는 불러오지 않는다
+
     response = requests.get(ALADIN_ITEM_LIST_URL, params=params, timeout=20)
     response.raise_for_status()
     return response.json().get("item", []) or []
@@ -294,6 +296,8 @@ def _fetch_item_lookup(isbn13: str | None, isbn10: str | None) -> dict | None:
         candidates.append(("ISBN13", isbn13))
     if isbn10:
         candidates.append(("ISBN", isbn10))
+    import requests
+
     for id_type, item_id in candidates:
         params = {
             "ttbkey": key,
@@ -470,6 +474,8 @@ def _sync_one_list(
             },
         )
     db.commit()
+    # book_lists는 raw SQL로 바꾸므로 ORM 훅 대신 직접 무효화한다 (책 upsert는 커밋 시 자동 무효화)
+    invalidate_cache_tags(booklist_tag(list_type))
     return len(synced_isbns)
 
 
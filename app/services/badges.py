@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-from typing import Any
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func
 
 from app.models import (
     BadgeDefinition,
+    BadgeEvaluationEvent,
     Book,
     BookCategory,
     Bookmark,
@@ -14,12 +18,16 @@ from app.models import (
     ReadingStatus,
     Review,
     UserBadge,
+    UserBadgeMetric,
     UserBook,
     Wishlist,
 )
+from app.services.counters import add_unique_row
 from app.services.genre_mapping import get_korean_genres
 from app.services.notify import create_notification
 
+logger = logging.getLogger(__name__)
+
 BADGE_DEFINITIONS = [
     {"code": "reading.beginner_5", "category": "reading", "level_code": "beginner_5", "title": "독서 비기너", "description": "완독한 책이 5권 이상이에요.", "threshold": 5},
     {"code": "reading.pro_10", "category": "reading", "level_code": "pro_10", "title": "독서 프로", "description": "완독한 책이 10권 이상이에요.", "threshold": 10},
@@ -39,109 +47,184 @@ BADGE_DEFINITIONS = [
 ]
 
 
+BADGE_CATEGORIES = ("reading", "rating", "review", "genre", "wishlist", "bookmark")
+# 카테고리 -> 판정에 쓰는 지표 (genre는 장르별 평점 수/장르 수)
+CATEGORY_METRIC = {
+    "reading": "completed_books",
+    "rating": "rating_count",
+    "review": "review_count",
+    "genre": "genre_variety",
+    "wishlist": "wishlist_count",
+    "bookmark": "bookmark_count",
+}
+# 리뷰/별점 쓰기는 세 카테고리에 모두 영향을 준다
+REVIEW_BADGE_CATEGORIES = ("rating", "review", "genre")
+
+_DEFINITION_FIELDS = ("category", "level_code", "title", "description", "threshold", "icon_url", "context_type", "is_repeatable")
+
+
 def sync_badge_definitions(db: Session) -> dict[str, BadgeDefinition]:
+    """BADGE_DEFINITIONS를 DB에 반영한다. 실제로 달라진 값이 있을 때만 커밋한다."""
     existing = {item.code: item for item in db.query(BadgeDefinition).all()}
     changed = False
     for definition in BADGE_DEFINITIONS:
+        values = {
+            "category": definition["category"],
+            "level_code": definition["level_code"],
+            "title": definition["title"],
+            "description": definition.get("description"),
+            "threshold": definition["threshold"],
+            "icon_url": definition.get("icon_url"),
+            "context_type": definition.get("context_type"),
+            "is_repeatable": definition.get("is_repeatable", False),
+        }
         item = existing.get(definition["code"])
         if item is None:
-            item = BadgeDefinition(
-                code=definition["code"],
-                category=definition["category"],
-                level_code=definition["level_code"],
-                title=definition["title"],
-                description=definition.get("description"),
-                threshold=definition["threshold"],
-                icon_url=definition.get("icon_url"),
-                context_type=definition.get("context_type"),
-                is_repeatable=definition.get("is_repeatable", False),
-            )
+            item = BadgeDefinition(code=definition["code"], **values)
             db.add(item)
             existing[item.code] = item
             changed = True
-        else:
-            item.category = definition["category"]
-            item.level_code = definition["level_code"]
-            item.title = definition["title"]
-            item.description = definition.get("description")
-            item.threshold = definition["threshold"]
-            item.icon_url = definition.get("icon_url")
-            item.context_type = definition.get("context_type")
-            item.is_repeatable = definition.get("is_repeatable", False)
-            db.add(item)
-            changed = True
+            continue
+        for field in _DEFINITION_FIELDS:
+            if getattr(item, field) != values[field]:
+                setattr(item, field, values[field])
+                changed = True
     if changed:
         db.commit()
-    for item in existing.values():
-        db.refresh(item)
     return existing
 
 
-def _book_genres(db: Session, book: Book) -> list[str]:
-    rows = db.query(BookCategory.category_name).filter(BookCategory.book_id == book.id).all()
-    if rows:
-        result: list[str] = []
-        for (name,) in rows:
-            for genre in get_korean_genres(name):
-                if genre not in result:
-                    result.append(genre)
-        if result:
-            return result
-    fallback = []
-    for genre in get_korean_genres(book.category or ""):
-        if genre not in fallback:
-            fallback.append(genre)
-    return fallback
-
-
-def _user_metrics(db: Session, user_id: int) -> dict[str, Any]:
-    completed_books = (
-        db.query(func.count(UserBook.id))
-        .filter(UserBook.user_id == user_id, UserBook.status == ReadingStatus.COMPLETED)
-        .scalar()
-        or 0
-    )
-    rating_reviews = (
-        db.query(Review)
+@dataclass(frozen=True)
+class BadgeDefinitionEntry:
+    id: int
+    code: str
+    category: str
+    level_code: str
+    title: str
+    description: Optional[str]
+    threshold: int
+    context_type: Optional[str]
+
+
+_definitions_lock = threading.Lock()
+_definitions: Optional[dict[str, BadgeDefinitionEntry]] = None
+
+
+def get_badge_definitions(db: Session) -> Mapping[str, BadgeDefinitionEntry]:
+    """배지 정의는 코드에 고정돼 있으므로 프로세스당 한 번만 동기화하고 캐시한다."""
+    global _definitions
+    if _definitions is not None:
+        return _definitions
+    with _definitions_lock:
+        if _definitions is None:
+            rows = sync_badge_definitions(db)
+            _definitions = {
+                code: BadgeDefinitionEntry(
+                    id=row.id,
+                    code=row.code,
+                    category=row.category,
+                    level_code=row.level_code,
+                    title=row.title,
+                    description=row.description,
+                    threshold=row.threshold,
+                    context_type=row.context_type,
+                )
+                for code, row in rows.items()
+            }
+        return _definitions
+
+
+def invalidate_badge_definitions() -> None:
+    global _definitions
+    with _definitions_lock:
+        _definitions = None
+
+
+def _genre_counts(db: Session, user_id: int) -> dict[str, int]:
+    """평점을 남긴 책들의 장르별 개수. 책/카테고리를 한 번의 조인 쿼리로 읽는다."""
+    rows = (
+        db.query(Review.book_id, Book.category, BookCategory.category_name)
         .join(Book, Book.id == Review.book_id)
+        .outerjoin(BookCategory, BookCategory.book_id == Book.id)
         .filter(Review.user_id == user_id, Review.rating.isnot(None))
         .all()
     )
-    rating_count = len(rating_reviews)
-    review_count = sum(1 for review in rating_reviews if (review.content or '').strip())
-    wishlist_count = db.query(func.count(Wishlist.id)).filter(Wishlist.user_id == user_id).scalar() or 0
-    bookmark_count = (
-        db.query(func.count(Bookmark.id))
-        .join(UserBook, UserBook.id == Bookmark.user_book_id)
-        .filter(UserBook.user_id == user_id)
-        .scalar()
-        or 0
-    )
+    books: dict[int, tuple[Optional[str], list[str]]] = {}
+    for book_id, book_category, category_name in rows:
+        _, names = books.setdefault(book_id, (book_category, []))
+        if category_name:
+            names.append(category_name)
 
     genre_counts: dict[str, int] = {}
-    for review in rating_reviews:
-        book = db.query(Book).filter(Book.id == review.book_id).first()
-        if not book:
-            continue
-        for genre in _book_genres(db, book):
+    for book_category, names in books.values():
+        genres: list[str] = []
+        for name in names:
+            for genre in get_korean_genres(name):
+                if genre not in genres:
+                    genres.append(genre)
+        if not genres:
+            for genre in get_korean_genres(book_category or ""):
+                if genre not in genres:
+                    genres.append(genre)
+        for genre in genres:
             genre_counts[genre] = genre_counts.get(genre, 0) + 1
+    return genre_counts
 
-    return {
-        "completed_books": int(completed_books),
-        "rating_count": int(rating_count),
-        "review_count": int(review_count),
-        "wishlist_count": int(wishlist_count),
-        "bookmark_count": int(bookmark_count),
-        "genre_counts": genre_counts,
-        "genre_variety": len(genre_counts),
-    }
+
+def _refresh_metrics(db: Session, user_id: int, categories: Iterable[str]) -> UserBadgeMetric:
+    """주어진 카테고리에 필요한 지표만 집계 쿼리로 다시 계산해 user_badge_metrics에 저장한다."""
+    categories = set(categories)
+    metric = db.get(UserBadgeMetric, user_id)
+    if metric is None:
+        metric = UserBadgeMetric(user_id=user_id)
+        db.add(metric)
+    if "reading" in categories:
+        metric.completed_books = int(
+            db.query(func.count(UserBook.id))
+            .filter(UserBook.user_id == user_id, UserBook.status == ReadingStatus.COMPLETED)
+            .scalar()
+            or 0
+        )
+    if categories & {"rating", "review"}:
+        rating_count, review_count = (
+            db.query(
+                func.count(Review.id),
+                func.sum(case((func.trim(func.coalesce(Review.content, "")) != "", 1), else_=0)),
+            )
+            .filter(Review.user_id == user_id, Review.rating.isnot(None))
+            .one()
+        )
+        metric.rating_count = int(rating_count or 0)
+        metric.review_count = int(review_count or 0)
+    if "genre" in categories:
+        metric.genre_counts = _genre_counts(db, user_id)
+    if "wishlist" in categories:
+        metric.wishlist_count = int(
+            db.query(func.count(Wishlist.id)).filter(Wishlist.user_id == user_id).scalar() or 0
+        )
+    if "bookmark" in categories:
+        metric.bookmark_count = int(
+            db.query(func.count(Bookmark.id))
+            .join(UserBook, UserBook.id == Bookmark.user_book_id)
+            .filter(UserBook.user_id == user_id)
+            .scalar()
+            or 0
+        )
+    db.commit()
+    return metric
+
+
+def _metric_value(metric: UserBadgeMetric, category: str) -> int:
+    if category == "genre":
+        return len(metric.genre_counts or {})
+    return int(getattr(metric, CATEGORY_METRIC[category]) or 0)
 
 
 def _award_badge(
     db: Session,
     *,
     user_id: int,
-    definition: BadgeDefinition,
+    definition: BadgeDefinitionEntry,
     progress_snapshot: dict[str, Any],
     context_value: str | None = None,
 ) -> bool:
@@ -187,50 +270,87 @@ def _award_badge(
     return True
 
 
-def evaluate_user_badges(db: Session, user_id: int) -> int:
-    definitions = sync_badge_definitions(db)
-    metrics = _user_metrics(db, user_id)
+def evaluate_user_badges(db: Session, user_id: int, categories: Optional[Iterable[str]] = None) -> int:
+    """영향받은 카테고리의 배지만 판정한다. categories가 없으면 전체 재계산."""
+    categories = set(categories or BADGE_CATEGORIES)
+    definitions = get_badge_definitions(db)
+    metric = _refresh_metrics(db, user_id, categories)
+    earned = {
+        (definition_id, context_value)
+        for definition_id, context_value in db.query(UserBadge.badge_definition_id, UserBadge.context_value)
+        .filter(UserBadge.user_id == user_id)
+        .all()
+    }
     awarded = 0
 
-    threshold_codes = [
-        ("reading.beginner_5", metrics["completed_books"]),
-        ("reading.pro_10", metrics["completed_books"]),
-        ("reading.master_20", metrics["completed_books"]),
-        ("reading.library_50", metrics["completed_books"]),
-        ("rating.fairy_10", metrics["rating_count"]),
-        ("rating.craft_30", metrics["rating_count"]),
-        ("rating.restaurant_100", metrics["rating_count"]),
-        ("review.poem_5", metrics["review_count"]),
-        ("review.short_15", metrics["review_count"]),
-        ("review.author_30", metrics["review_count"]),
-        ("genre.omnireader_10genres", metrics["genre_variety"]),
-        ("wishlist.desire_30", metrics["wishlist_count"]),
-        ("bookmark.collector_10", metrics["bookmark_count"]),
-        ("bookmark.lover_50", metrics["bookmark_count"]),
-    ]
-    for code, value in threshold_codes:
-        definition = definitions[code]
-        if value >= definition.threshold:
-            awarded += int(_award_badge(db, user_id=user_id, definition=definition, progress_snapshot={"value": value}))
-
-    lover_definition = definitions["genre.lover_10"]
-    for genre_name, count in metrics["genre_counts"].items():
-        if count >= lover_definition.threshold:
-            awarded += int(
-                _award_badge(
-                    db,
-                    user_id=user_id,
-                    definition=lover_definition,
-                    context_value=genre_name,
-                    progress_snapshot={"value": count, "genre": genre_name},
+    for definition in definitions.values():
+        if definition.category not in categories:
+            continue
+        if definition.context_type == "genre":
+            for genre_name, count in (metric.genre_counts or {}).items():
+                if count < definition.threshold or (definition.id, genre_name) in earned:
+                    continue
+                awarded += int(
+                    _award_badge(
+                        db,
+                        user_id=user_id,
+                        definition=definition,
+                        context_value=genre_name,
+                        progress_snapshot={"value": count, "genre": genre_name},
+                    )
                 )
-            )
+            continue
+        value = _metric_value(metric, definition.category)
+        if value >= definition.threshold and (definition.id, None) not in earned:
+            awarded += int(_award_badge(db, user_id=user_id, definition=definition, progress_snapshot={"value": value}))
 
     return awarded
 
 
+def enqueue_badge_evaluation(db: Session, user_id: int, *categories: str) -> None:
+    """배지 평가를 워커 대기열에 넣는다. 같은 (user, category)가 이미 대기 중이면 합쳐진다."""
+    for category in categories:
+        add_unique_row(db, BadgeEvaluationEvent(user_id=user_id, category=category))
+    db.commit()
+
+
+def process_badge_evaluation_queue(db: Session, batch_size: int = 500) -> int:
+    """대기열을 사용자별로 묶어 해당 카테고리만 평가한다. 평가에 성공한 사용자 수를 반환.
+
+    평가가 실패한 사용자의 카테고리는 대기열에 다시 넣는다.
+    """
+    events = (
+        db.query(BadgeEvaluationEvent)
+        .order_by(BadgeEvaluationEvent.id.asc())
+        .limit(batch_size)
+        .all()
+    )
+    if not events:
+        return 0
+    pending: dict[int, set[str]] = {}
+    for event in events:
+        pending.setdefault(event.user_id, set()).add(event.category)
+    # 먼저 대기열에서 꺼내 커밋해야 평가 중 들어온 이벤트가 유실되지 않는다
+    db.query(BadgeEvaluationEvent).filter(
+        BadgeEvaluationEvent.id.in_([event.id for event in events])
+    ).delete(synchronize_session=False)
+    db.commit()
+    processed = 0
+    for user_id, categories in pending.items():
+        try:
+            evaluate_user_badges(db, user_id, categories)
+        except Exception:  # noqa: BLE001
+            # 한 사용자의 실패가 배치의 나머지를 막지 않게 하고, 이 사용자는 다음 주기에 다시 평가한다
+            logger.exception("badge evaluation failed user_id=%s categories=%s", user_id, sorted(categories))
+            db.rollback()
+            enqueue_badge_evaluation(db, user_id, *sorted(categories))
+            continue
+        processed += 1
+    return processed
+
+
 def list_user_badges(db: Session, user_id: int) -> list[UserBadge]:
-    sync_badge_definitions(db)
+    get_badge_definitions(db)
     return (
         db.query(UserBadge)
         .join(BadgeDefinition, BadgeDefinition.id == UserBadge.badge_definition_id)
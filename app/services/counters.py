@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.models import (
+    BookReviewStats,
+    Collection,
+    CollectionLike,
+    Group,
+    GroupComment,
+    GroupCommentLike,
+    GroupMember,
+    GroupPost,
+    GroupPostLike,
+    Review,
+    ReviewComment,
+    ReviewLike,
+    User,
+)
+
+
+def bump_counter(db: Session, model, row_id: int, column, delta: int, *, preserve: Iterable[Any] = ()) -> None:
+    """카운터 컬럼을 원자적으로 증감한다 (UPDATE ... SET n = n + delta). 커밋은 호출자가 담당한다.
+
+    preserve에는 ON UPDATE가 걸린 컬럼(updated_at 등)을 넘겨 카운터 변경으로 값이 바뀌지 않게 한다.
+    """
+    if not delta:
+        return
+    values = {column: column + delta}
+    for col in preserve:
+        values[col] = col
+    db.query(model).filter(model.id == row_id).update(values, synchronize_session=False)
+
+
+def add_unique_row(db: Session, row) -> bool:
+    """유니크 제약이 있는 행(좋아요 등)을 추가한다. 이미 있으면 False를 돌려주므로 카운터는 새로 들어간 경우에만 올린다."""
+    try:
+        with db.begin_nested():
+            db.add(row)
+    except IntegrityError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class CounterSpec:
+    name: str
+    model: Any
+    column: Any
+    key: Any
+    # 실제 값을 구하는 상관 서브쿼리 (바깥 model 행 기준)
+    actual: Callable[[], Any]
+    preserve: tuple = ()
+
+
+def _count_where(condition) -> Any:
+    return select(func.count()).where(condition).scalar_subquery()
+
+
+COUNTERS: tuple[CounterSpec, ...] = (
+    CounterSpec(
+        "reviews.like_count",
+        Review,
+        Review.like_count,
+        Review.id,
+        lambda: _count_where(ReviewLike.review_id == Review.id),
+    ),
+    CounterSpec(
+        "reviews.comment_count",
+        Review,
+        Review.comment_count,
+        Review.id,
+        lambda: _count_where(ReviewComment.review_id == Review.id),
+    ),
+    CounterSpec(
+        "book_review_stats.comment_count",
+        BookReviewStats,
+        BookReviewStats.comment_count,
+        BookReviewStats.book_id,
+        lambda: select(func.count(ReviewComment.id))
+        .join(Review, Review.id == ReviewComment.review_id)
+        .where(Review.book_id == BookReviewStats.book_id)
+        .scalar_subquery(),
+    ),
+    CounterSpec(
+        "users.review_comment_count",
+        User,
+        User.review_comment_count,
+        User.id,
+        lambda: _count_where(ReviewComment.user_id == User.id),
+        preserve=(User.updated_at,),
+    ),
+    CounterSpec(
+        "group_posts.like_count",
+        GroupPost,
+        GroupPost.like_count,
+        GroupPost.id,
+        lambda: _count_where(GroupPostLike.post_id == GroupPost.id),
+    ),
+    CounterSpec(
+        "group_posts.comment_count",
+        GroupPost,
+        GroupPost.comment_count,
+        GroupPost.id,
+        lambda: _count_where(GroupComment.post_id == GroupPost.id),
+    ),
+    CounterSpec(
+        "group_comments.like_count",
+        GroupComment,
+        GroupComment.like_count,
+        GroupComment.id,
+        lambda: _count_where(GroupCommentLike.comment_id == GroupComment.id),
+    ),
+    CounterSpec(
+        "groups.member_count",
+        Group,
+        Group.member_count,
+        Group.id,
+        lambda: _count_where(GroupMember.group_id == Group.id),
+    ),
+    CounterSpec(
+        "groups.post_count",
+        Group,
+        Group.post_count,
+        Group.id,
+        lambda: _count_where(GroupPost.group_id == Group.id),
+    ),
+    CounterSpec(
+        "groups.comment_count",
+        Group,
+        Group.comment_count,
+        Group.id,
+        lambda: select(func.count(GroupComment.id))
+        .join(GroupPost, GroupPost.id == GroupComment.post_id)
+        .where(GroupPost.group_id == Group.id)
+        .scalar_subquery(),
+    ),
+    CounterSpec(
+        "collections.like_count",
+        Collection,
+        Collection.like_count,
+        Collection.id,
+        lambda: _count_where(CollectionLike.collection_id == Collection.id),
+        preserve=(Collection.updated_at,),
+    ),
+)
+
+
+def reconcile_counters(
+    db: Session,
+    specs: Optional[Iterable[CounterSpec]] = None,
+    batch_size: Optional[int] = None,
+) -> dict[str, int]:
+    """카운터 컬럼을 실제 행 수와 비교해 어긋난 행만 고친다.
+
+    회원 탈퇴 등 FK CASCADE로 좋아요/댓글이 지워지면 카운터가 따라가지 못하므로 주기 작업에서 호출한다.
+    PK 구간별로 커밋해 긴 잠금을 피한다. 카운터별로 고친 행 수를 반환.
+    """
+    batch_size = batch_size or get_settings().counter_reconcile_batch_size
+    fixed: dict[str, int] = {}
+    for spec in specs if specs is not None else COUNTERS:
+        max_key = db.query(func.max(spec.key)).scalar() or 0
+        total = 0
+        for start in range(0, max_key + 1, batch_size):
+            actual = spec.actual()
+            values = {spec.column: actual}
+            for col in spec.preserve:
+                values[col] = col
+            total += (
+                db.query(spec.model)
+                .filter(spec.key >= start, spec.key < start + batch_size, spec.column != actual)
+                .update(values, synchronize_session=False)
+            )
+            db.commit()
+        if total:
+            fixed[spec.name] = total
+    return fixed
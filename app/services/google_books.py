@@ -1,7 +1,6 @@
 import os
 import re
 from typing import Any, Dict, List, Optional
-import httpx
 from datetime import date
 
 from app.core.config import get_settings
@@ -52,6 +51,8 @@ class GoogleBooksClient:
     def _request(self, params: Dict[str, Any]) -> Dict[str, Any]:
         if self.api_key:
             params["key"] = self.api_key
+        import httpx  # 외부 조회 때만 불러온다 (기동 시간 단축)
+
         with httpx.Client(timeout=10.0) as client:
             r = client.get(self.BASE_URL, params=params)
             r.raise_for_status()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import bindparam, func, select, union, update
+from sqlalchemy.orm import Session
+
+from app.models import Group, GroupComment, GroupPost
+from app.services.counters import bump_counter
+
+# 게시글/댓글 활동은 반감기마다 가중치가 절반으로 줄어든다
+ACTIVITY_HALF_LIFE_DAYS = 7
+# 이 기간보다 오래된 활동은 점수에 반영하지 않는다
+ACTIVITY_WINDOW_DAYS = 60
+MEMBER_WEIGHT = 1.0
+POST_WEIGHT = 2.0
+COMMENT_WEIGHT = 1.0
+# 활동이 기간 밖으로 빠진 그룹을 한 번 더 갱신하기 위한 여유 (워커가 잠시 멈춰도 놓치지 않도록)
+ACTIVITY_CANDIDATE_MARGIN_DAYS = 2
+ACTIVITY_REFRESH_BATCH_SIZE = 500
+
+
+def utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def bump_group_counter(db: Session, group_id: int, column, delta: int) -> None:
+    """Group 카운터 컬럼을 원자적으로 증감한다 (UPDATE ... SET n = n + delta). 커밋은 호출자가 담당한다.
+
+    멤버 수는 활동 점수의 기본값이므로 같은 UPDATE에서 activity_score도 함께 옮긴다.
+    최근 활동이 없는 그룹은 refresh_group_activity가 다시 계산하지 않기 때문이다.
+    """
+    if column.key == "member_count" and delta:
+        db.query(Group).filter(Group.id == group_id).update(
+            {column: column + delta, Group.activity_score: Group.activity_score + MEMBER_WEIGHT * delta},
+            synchronize_session=False,
+        )
+        return
+    bump_counter(db, Group, group_id, column, delta)
+
+
+def _decay(day: date, today: date) -> float:
+    age_days = max((today - day).days, 0)
+    return 0.5 ** (age_days / ACTIVITY_HALF_LIFE_DAYS)
+
+
+def _as_date(value) -> date:
+    # sqlite의 DATE()는 문자열을 돌려준다
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _recent_activity(db: Session, group_ids: list[int], since: datetime, today: date) -> dict[int, float]:
+    recent: dict[int, float] = {}
+    post_day = func.date(GroupPost.created_at)
+    for group_id, day, count in (
+        db.query(GroupPost.group_id, post_day, func.count(GroupPost.id))
+        .filter(GroupPost.group_id.in_(group_ids), GroupPost.created_at >= since)
+        .group_by(GroupPost.group_id, post_day)
+        .all()
+    ):
+        recent[group_id] = recent.get(group_id, 0.0) + POST_WEIGHT * count * _decay(_as_date(day), today)
+    comment_day = func.date(GroupComment.created_at)
+    for group_id, day, count in (
+        db.query(GroupPost.group_id, comment_day, func.count(GroupComment.id))
+        .join(GroupComment, GroupComment.post_id == GroupPost.id)
+        .filter(GroupPost.group_id.in_(group_ids), GroupComment.created_at >= since)
+        .group_by(GroupPost.group_id, comment_day)
+        .all()
+    ):
+        recent[group_id] = recent.get(group_id, 0.0) + COMMENT_WEIGHT * count * _decay(_as_date(day), today)
+    return recent
+
+
+def refresh_group_activity(
+    db: Session,
+    now: datetime | None = None,
+    batch_size: int = ACTIVITY_REFRESH_BATCH_SIZE,
+) -> int:
+    """최근 활동이 있는 그룹만 골라 시간 감쇠 활동 점수를 다시 계산한다.
+
+    활동이 기간 밖으로 막 빠진 그룹도 점수를 멤버 수 기준으로 되돌리도록 ACTIVITY_CANDIDATE_MARGIN_DAYS만큼
+    더 넓게 고른다. 멤버 수는 컬럼 값을 SQL에서 그대로 읽으므로 동시에 들어온 증감을 덮어쓰지 않는다.
+    카운터 컬럼 자체는 건드리지 않는다 (reconcile_counters 담당). 배치마다 커밋하고 갱신한 그룹 수를 반환.
+    """
+    now = now or utcnow()
+    today = now.date()
+    since = now - timedelta(days=ACTIVITY_WINDOW_DAYS)
+    candidate_since = since - timedelta(days=ACTIVITY_CANDIDATE_MARGIN_DAYS)
+
+    active_posts = select(GroupPost.group_id).where(GroupPost.created_at >= candidate_since)
+    active_comments = (
+        select(GroupPost.group_id)
+        .join(GroupComment, GroupComment.post_id == GroupPost.id)
+        .where(GroupComment.created_at >= candidate_since)
+    )
+    group_ids = sorted(db.execute(union(active_posts, active_comments)).scalars())
+
+    groups = Group.__table__
+    stmt = (
+        update(groups)
+        .where(groups.c.id == bindparam("b_group_id"))
+        .values(
+            activity_score=func.round(MEMBER_WEIGHT * groups.c.member_count + bindparam("b_recent"), 4),
+            activity_score_updated_at=now,
+        )
+    )
+    for start in range(0, len(group_ids), batch_size):
+        chunk = group_ids[start : start + batch_size]
+        recent = _recent_activity(db, chunk, since, today)
+        db.execute(stmt, [{"b_group_id": group_id, "b_recent": recent.get(group_id, 0.0)} for group_id in chunk])
+        db.commit()
+    return len(group_ids)
@@ -1,34 +1,43 @@
 from __future__ import annotations
 
-from typing import Optional
-
-import firebase_admin
-from firebase_admin import credentials, messaging
+from typing import TYPE_CHECKING, Optional
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from firebase_admin import messaging
+
+# firebase_admin(google-auth, grpc 등)은 import가 무거워 실제로 푸시를 보낼 때 불러온다
+
 _initialized = False
 
 
-def _ensure_initialized() -> None:
+def _ensure_initialized() -> bool:
+    """FCM이 설정돼 있으면 firebase 앱을 초기화하고 True를 돌려준다."""
     global _initialized
     if _initialized:
-        return
+        return True
     settings = get_settings()
     sa_path: Optional[str] = settings.fcm_service_account_json_path
     if not sa_path:
         # Allow running without FCM configured
-        return
+        return False
+    import firebase_admin
+    from firebase_admin import credentials
+
     if not firebase_admin._apps:  # type: ignore[attr-defined]
         cred = credentials.Certificate(sa_path)
         firebase_admin.initialize_app(cred)
     _initialized = True
+    return True
 
 
 ANDROID_CHANNEL_ID = "high_importance_channel"
 
 
 def _android_config() -> messaging.AndroidConfig:
+    from firebase_admin import messaging
+
     return messaging.AndroidConfig(
         priority="high",
         notification=messaging.AndroidNotification(
@@ -39,9 +48,10 @@ def _android_config() -> messaging.AndroidConfig:
 
 def send_to_token(token: str, title: str, body: str, data: Optional[dict] = None) -> Optional[str]:
     """Send a notification to a single FCM token. Returns message ID or None if FCM not configured."""
-    _ensure_initialized()
-    if not firebase_admin._apps:  # type: ignore[attr-defined]
+    if not _ensure_initialized():
         return None
+    from firebase_admin import messaging
+
     message = messaging.Message(
         token=token,
         notification=messaging.Notification(title=title, body=body),
@@ -52,9 +62,10 @@ def send_to_token(token: str, title: str, body: str, data: Optional[dict] = None
 
 
 def send_to_topic(topic: str, title: str, body: str, data: Optional[dict] = None) -> Optional[str]:
-    _ensure_initialized()
-    if not firebase_admin._apps:  # type: ignore[attr-defined]
+    if not _ensure_initialized():
         return None
+    from firebase_admin import messaging
+
     message = messaging.Message(
         topic=topic,
         notification=messaging.Notification(title=title, body=body),
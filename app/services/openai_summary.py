@@ -3,8 +3,6 @@ from __future__ import annotations
 import json
 from typing import Any
 
-import httpx
-
 from app.core.config import get_settings
 
 OPENAI_MODEL = "gpt-4.1-mini"
@@ -86,6 +84,8 @@ def generate_reading_summary(payload: dict[str, Any]) -> dict[str, Any]:
         "Authorization": f"Bearer {settings.openai_api_key}",
         "Content-Type": "application/json",
     }
+    import httpx  # 요약 작업 때만 불러온다 (기동 시간 단축)
+
     with httpx.Client(timeout=60.0) as client:
         response = client.post(OPENAI_URL, headers=headers, json=body)
         response.raise_for_status()
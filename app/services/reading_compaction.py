@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.utils import to_seoul
+from app.models import ReadingEvent, ReadingEventType, ReadingSession, UserBook, UserPage
+from app.services.badges import evaluate_user_badges
+from app.services.reading_progress import maybe_complete_user_book, set_current_page
+
+
+def utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _reading_date(value: datetime) -> date:
+    # UserPage.reading_date는 KST 기준 날짜
+    return to_seoul(value).date()
+
+
+def _fold_events(session: ReadingSession, events: list[ReadingEvent]) -> dict[date, dict[str, Any]]:
+    """세션 이벤트를 KST 날짜별 페이지 구간으로 접는다."""
+    spans: dict[date, dict[str, Any]] = {}
+    for event in events:
+        if event.page is None:
+            continue
+        day = _reading_date(event.occurred_at)
+        span = spans.get(day)
+        if span is None:
+            spans[day] = {
+                "start_page": event.page,
+                "end_page": event.page,
+                "start_time": event.occurred_at,
+                "end_time": event.occurred_at,
+            }
+            continue
+        span["start_page"] = min(span["start_page"], event.page)
+        span["end_page"] = max(span["end_page"], event.page)
+        span["start_time"] = min(span["start_time"], event.occurred_at)
+        span["end_time"] = max(span["end_time"], event.occurred_at)
+
+    if not spans and session.end_time is not None:
+        start_page = session.start_page or session.end_page
+        end_page = session.end_page or session.start_page
+        if start_page is not None and end_page is not None:
+            spans[_reading_date(session.end_time)] = {
+                "start_page": min(start_page, end_page),
+                "end_page": max(start_page, end_page),
+                "start_time": session.start_time,
+                "end_time": session.end_time,
+            }
+    return spans
+
+
+def _merge_user_page(db: Session, user_book_id: int, day: date, span: dict[str, Any], reading_seconds: int) -> None:
+    user_page = db.query(UserPage).filter(
+        UserPage.user_book_id == user_book_id,
+        UserPage.reading_date == day,
+    ).first()
+    if user_page is None:
+        db.add(UserPage(
+            user_book_id=user_book_id,
+            reading_date=day,
+            start_page=span["start_page"],
+            end_page=span["end_page"],
+            start_time=span["start_time"],
+            end_time=span["end_time"],
+            reading_seconds=reading_seconds,
+        ))
+        return
+    user_page.start_page = min(user_page.start_page, span["start_page"])
+    user_page.end_page = max(user_page.end_page, span["end_page"])
+    if span["start_time"] is not None:
+        user_page.start_time = min(user_page.start_time, span["start_time"]) if user_page.start_time else span["start_time"]
+    if span["end_time"] is not None:
+        user_page.end_time = max(user_page.end_time, span["end_time"]) if user_page.end_time else span["end_time"]
+    user_page.reading_seconds = (user_page.reading_seconds or 0) + reading_seconds
+
+
+def compact_session(db: Session, session: ReadingSession) -> bool:
+    """종료된 세션의 이벤트를 ReadingSession 요약 필드와 UserPage 일별 구간으로 접는다.
+
+    원본 이벤트는 삭제하지 않는다(보관 기간이 지난 뒤 purge_compacted_events가 정리).
+    페이지 기록으로 자동 완독 처리된 경우 True를 반환. 커밋은 호출자가 담당한다.
+    """
+    if session.end_time is None or session.events_compacted_at is not None:
+        return False
+
+    events = (
+        db.query(ReadingEvent)
+        .filter(ReadingEvent.session_id == session.id)
+        .order_by(ReadingEvent.occurred_at.asc(), ReadingEvent.id.asc())
+        .all()
+    )
+    paged = [e for e in events if e.page is not None]
+    session.page_turn_count = sum(1 for e in events if e.event_type == ReadingEventType.PAGE_TURN)
+    if paged:
+        session.max_page = max(e.page for e in paged)
+        session.last_page = paged[-1].page
+        session.last_page_at = paged[-1].occurred_at
+    else:
+        session.max_page = session.end_page
+        session.last_page = session.end_page
+        session.last_page_at = session.end_time if session.end_page is not None else None
+
+    user_book = db.query(UserBook).filter(
+        UserBook.user_id == session.user_id,
+        UserBook.book_id == session.book_id,
+    ).first()
+    completed = False
+    if user_book is not None:
+        spans = _fold_events(session, events)
+        # 총 독서 시간은 세션 종료일에 귀속 (기존 end_session의 UserPage upsert와 동일한 규칙)
+        end_day = _reading_date(session.end_time)
+        for day, span in spans.items():
+            seconds = (session.total_seconds or 0) if day == end_day else 0
+            _merge_user_page(db, user_book.id, day, span, seconds)
+        set_current_page(user_book, session.last_page, session.last_page_at)
+        if spans:
+            completed = maybe_complete_user_book(db, user_book, max(span["end_page"] for span in spans.values()))
+        db.flush()
+
+    session.events_compacted_at = utcnow()
+    return completed
+
+
+def close_stale_sessions(db: Session, retention_days: int | None = None, batch_size: int | None = None) -> int:
+    """종료 요청(/end) 없이 방치된 세션을 마지막 활동 시각에 종료된 것으로 처리한다.
+
+    마지막 이벤트(없으면 시작 시각)가 보관 기간보다 오래된 열린 세션이 대상이다.
+    이렇게 닫힌 세션은 이후 compact_closed_sessions / purge_compacted_events의 대상이 된다.
+    처리한 세션 수를 반환.
+    """
+    settings = get_settings()
+    days = settings.reading_event_retention_days if retention_days is None else retention_days
+    limit = batch_size or settings.reading_event_compaction_batch_size
+    if days < 0:
+        return 0
+    cutoff = utcnow() - timedelta(days=days)
+    last_activity = func.coalesce(func.max(ReadingEvent.occurred_at), ReadingSession.start_time)
+    rows = (
+        db.query(ReadingSession.id, last_activity.label("last_at"))
+        .outerjoin(ReadingEvent, ReadingEvent.session_id == ReadingSession.id)
+        .filter(
+            ReadingSession.end_time.is_(None),
+            ReadingSession.start_time < cutoff,
+        )
+        .group_by(ReadingSession.id, ReadingSession.start_time)
+        .having(last_activity < cutoff)
+        .order_by(ReadingSession.id.asc())
+        .limit(limit)
+        .all()
+    )
+    if not rows:
+        return 0
+    last_at_by_id = {r.id: r.last_at for r in rows}
+    for session in db.query(ReadingSession).filter(ReadingSession.id.in_(last_at_by_id)).all():
+        last_paged = (
+            db.query(ReadingEvent.page)
+            .filter(ReadingEvent.session_id == session.id, ReadingEvent.page.isnot(None))
+            .order_by(ReadingEvent.occurred_at.desc(), ReadingEvent.id.desc())
+            .first()
+        )
+        session.end_time = last_at_by_id[session.id]
+        session.end_page = last_paged[0] if last_paged else session.start_page
+        # 클라이언트가 보고한 독서 시간이 없으므로 total_seconds는 비워 둔다
+    db.commit()
+    return len(rows)
+
+
+def compact_closed_sessions(db: Session, batch_size: int | None = None) -> int:
+    """아직 압축되지 않은 종료 세션을 배치 단위로 압축한다. 처리한 세션 수를 반환."""
+    settings = get_settings()
+    limit = batch_size or settings.reading_event_compaction_batch_size
+    sessions = (
+        db.query(ReadingSession)
+        .filter(
+            ReadingSession.end_time.isnot(None),
+            ReadingSession.events_compacted_at.is_(None),
+        )
+        .order_by(ReadingSession.id.asc())
+        .limit(limit)
+        .all()
+    )
+    completed_user_ids: set[int] = set()
+    for session in sessions:
+        if compact_session(db, session):
+            completed_user_ids.add(session.user_id)
+    if sessions:
+        db.commit()
+    for user_id in completed_user_ids:
+        evaluate_user_badges(db, user_id, ("reading",))
+    return len(sessions)
+
+
+def purge_compacted_events(db: Session, retention_days: int | None = None, batch_size: int | None = None) -> int:
+    """압축이 끝나고 보관 기간이 지난 세션의 원본 이벤트를 삭제한다. 삭제한 행 수를 반환.
+
+    한 번의 큰 DELETE가 락을 오래 잡지 않도록 batch_size 행씩 나눠 지우고 배치마다 커밋한다.
+    """
+    settings = get_settings()
+    days = settings.reading_event_retention_days if retention_days is None else retention_days
+    limit = batch_size or settings.reading_event_compaction_batch_size
+    if days < 0:
+        return 0
+    cutoff = utcnow() - timedelta(days=days)
+    expired_session_ids = (
+        db.query(ReadingSession.id)
+        .filter(
+            ReadingSession.events_compacted_at.isnot(None),
+            ReadingSession.end_time < cutoff,
+        )
+        .scalar_subquery()
+    )
+    total = 0
+    while True:
+        event_ids = [
+            row[0]
+            for row in db.query(ReadingEvent.id)
+            .filter(ReadingEvent.session_id.in_(expired_session_ids))
+            .order_by(ReadingEvent.id.asc())
+            .limit(limit)
+            .all()
+        ]
+        if not event_ids:
+            break
+        deleted = (
+            db.query(ReadingEvent)
+            .filter(ReadingEvent.id.in_(event_ids))
+            .delete(synchronize_session=False)
+        )
+        db.commit()
+        total += int(deleted or 0)
+        if len(event_ids) < limit:
+            break
+    return total
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import Book, ReadingEvent, ReadingSession, ReadingStatus, UserBook, UserPage
+
+# 진행률이 이 비율 이상이면 READING → COMPLETED 자동 전환
+AUTO_COMPLETE_RATIO = 0.99
+
+
+def utcnow() -> datetime:
+    return datetime.utcnow()
+
+
+def _as_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def get_user_book(db: Session, user_id: int, book_id: int) -> Optional[UserBook]:
+    return db.query(UserBook).filter(UserBook.user_id == user_id, UserBook.book_id == book_id).first()
+
+
+def set_current_page(user_book: UserBook, page: Optional[int], at: Optional[datetime] = None) -> bool:
+    """UserBook.current_page를 갱신한다. 더 오래된 기록이 최신 값을 덮어쓰지 않도록 시각을 비교한다."""
+    if page is None:
+        return False
+    at = _as_naive_utc(at or utcnow())
+    if user_book.current_page_updated_at is not None and at < user_book.current_page_updated_at:
+        return False
+    user_book.current_page = int(page)
+    user_book.current_page_updated_at = at
+    return True
+
+
+def record_current_page(
+    db: Session,
+    user_id: int,
+    book_id: int,
+    page: Optional[int],
+    at: Optional[datetime] = None,
+    session: Optional[ReadingSession] = None,
+) -> Optional[UserBook]:
+    """현재 페이지를 기록한다. 서재(UserBook)에 없는 책이면 세션의 last_page에 남겨 이어 읽기에 쓴다."""
+    if page is None:
+        return None
+    user_book = get_user_book(db, user_id, book_id)
+    if user_book is None:
+        if session is not None:
+            at = _as_naive_utc(at or utcnow())
+            if session.last_page_at is None or at >= session.last_page_at:
+                session.last_page = int(page)
+                session.last_page_at = at
+        return None
+    set_current_page(user_book, page, at)
+    return user_book
+
+
+def last_session_page(db: Session, user_id: int, book_id: int) -> Optional[int]:
+    """서재(UserBook)에 없는 책의 이어 읽기 페이지: 가장 최근 세션의 end_page → last_page → start_page."""
+    page = (
+        db.query(func.coalesce(ReadingSession.end_page, ReadingSession.last_page, ReadingSession.start_page))
+        .filter(ReadingSession.user_id == user_id, ReadingSession.book_id == book_id)
+        .order_by(ReadingSession.id.desc())
+        .limit(1)
+        .scalar()
+    )
+    return int(page) if page is not None else None
+
+
+def maybe_complete_user_book(db: Session, user_book: Optional[UserBook], page: Optional[int]) -> bool:
+    """진행 기록(페이지 기록/세션 종료/END 이벤트) 시점에 자동 완독 여부를 판단한다.
+
+    READING 상태이고 page / Book.total_pages >= AUTO_COMPLETE_RATIO 이면 COMPLETED로 전환하고 True를 반환.
+    커밋과 배지 평가는 호출자가 담당한다.
+    """
+    if user_book is None or page is None or user_book.status != ReadingStatus.READING:
+        return False
+    total_pages = db.query(Book.total_pages).filter(Book.id == user_book.book_id).scalar()
+    if not total_pages or page / total_pages < AUTO_COMPLETE_RATIO:
+        return False
+    user_book.status = ReadingStatus.COMPLETED
+    user_book.finished_date = date.today()
+    user_book.completed_at = utcnow()
+    return True
+
+
+def complete_finished_user_books(db: Session, user_id: Optional[int] = None) -> set[int]:
+    """UserPage 기록 기준으로 자동 완독 조건을 만족하는 READING 책을 일괄 전환한다 (backfill용).
+
+    전환된 사용자 id 집합을 반환한다. 커밋은 호출자가 담당한다.
+    """
+    query = (
+        db.query(
+            UserBook.id.label("ub_id"),
+            Book.total_pages.label("total_pages"),
+            func.max(UserPage.end_page).label("max_end"),
+        )
+        .join(Book, Book.id == UserBook.book_id)
+        .join(UserPage, UserPage.user_book_id == UserBook.id)
+        .filter(
+            UserBook.status == ReadingStatus.READING,
+            Book.total_pages.isnot(None),
+        )
+        .group_by(UserBook.id, Book.total_pages)
+    )
+    if user_id is not None:
+        query = query.filter(UserBook.user_id == user_id)
+
+    finished_ids = [
+        r.ub_id for r in query.all()
+        if r.total_pages and r.max_end and r.max_end / r.total_pages >= AUTO_COMPLETE_RATIO
+    ]
+    completed_user_ids: set[int] = set()
+    if not finished_ids:
+        return completed_user_ids
+    now = utcnow()
+    for user_book in db.query(UserBook).filter(UserBook.id.in_(finished_ids)).all():
+        user_book.status = ReadingStatus.COMPLETED
+        user_book.finished_date = date.today()
+        user_book.completed_at = user_book.completed_at or now
+        completed_user_ids.add(user_book.user_id)
+    return completed_user_ids
+
+
+def resolve_current_page(db: Session, user_id: int, book_id: int) -> tuple[Optional[int], Optional[datetime]]:
+    """비정규화 이전 방식의 현재 페이지 추론 (최근 이벤트 → 최근 세션 종료 페이지 → UserPage 최대 end_page).
+
+    요청 경로에서는 사용하지 않고 backfill 스크립트에서만 사용한다.
+    """
+    last_event = (
+        db.query(ReadingEvent.page, ReadingEvent.occurred_at)
+        .join(ReadingSession, ReadingEvent.session_id == ReadingSession.id)
+        .filter(
+            ReadingSession.user_id == user_id,
+            ReadingSession.book_id == book_id,
+            ReadingEvent.page.isnot(None),
+        )
+        .order_by(ReadingEvent.occurred_at.desc(), ReadingEvent.id.desc())
+        .first()
+    )
+    if last_event is not None:
+        return int(last_event.page), last_event.occurred_at
+
+    last_session = (
+        db.query(ReadingSession)
+        .filter(ReadingSession.user_id == user_id, ReadingSession.book_id == book_id)
+        .order_by(ReadingSession.id.desc())
+        .first()
+    )
+    if last_session:
+        last_page = last_session.end_page if last_session.end_page is not None else last_session.last_page
+        if last_page is not None:
+            return int(last_page), last_session.end_time or last_session.start_time
+
+    max_userpage = (
+        db.query(func.max(UserPage.end_page), func.max(UserPage.end_time))
+        .join(UserBook, UserBook.id == UserPage.user_book_id)
+        .filter(UserBook.user_id == user_id, UserBook.book_id == book_id)
+        .first()
+    )
+    if max_userpage and max_userpage[0] is not None:
+        return int(max_userpage[0]), max_userpage[1]
+    return None, None
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import re
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models import CollectionTagCategoryType, Tag, TagCategory
+
+
+SYSTEM_TAGS: list[tuple[str, str, list[str]]] = [
+    ("EMOTION", "감정", ["힐링", "감동", "눈물나는", "위로되는", "여운이남는", "따뜻한", "다정한", "먹먹한", "쓸쓸한", "벅찬", "희망적인", "설레는", "로맨틱한"]),
+    ("MOOD", "분위기", ["잔잔한", "몽환적인", "서늘한", "어두운", "긴장감있는", "몰입감있는", "속도감있는", "유쾌한", "발랄한"]),
+    ("SITUATION", "상황", ["잠들기전에읽는", "주말에읽기좋은", "카페에서읽기좋은", "여행할때읽기좋은", "출퇴근에읽기좋은"]),
+    ("READING_STYLE", "독서 스타일", ["가볍게읽기좋은", "한번에읽는", "천천히읽는", "인생책", "페이지터너", "다시읽고싶은", "곱씹게되는"]),
+    ("DIFFICULTY", "난이도", ["초보추천", "생각이많아지는", "지식이쌓이는", "시야가넓어지는", "통찰을주는", "현실적인", "철학적인", "사회적인"]),
+    ("GENRE", "장르", ["소설", "시", "에세이", "만화", "추리", "스릴러/공포", "SF", "판타지", "로맨스", "액션", "역사", "과학", "인문", "철학", "사회/정치", "경제/경영", "자기계발", "예술", "여행", "취미", "코미디"]),
+]
+
+
+def normalize_tag_name(name: str) -> str:
+    s = (name or "").strip()
+    s = s.lstrip("#@").strip()
+    return re.sub(r"\s+", "", s)
+
+
+def ensure_system_tags(db: Session) -> None:
+    """시스템 태그 카테고리/태그를 시드한다. 앱 시작 시와 seed 스크립트에서만 호출한다 (요청 경로에서는 호출하지 않음)."""
+    existing_categories = {row.code.value: row for row in db.query(TagCategory).all()}
+    existing_tags = {row.normalized_name: row for row in db.query(Tag).all()}
+    changed = False
+    for code, name, tags in SYSTEM_TAGS:
+        category = existing_categories.get(code)
+        if not category:
+            category = TagCategory(code=CollectionTagCategoryType(code), name=name)
+            db.add(category)
+            db.flush()
+            existing_categories[code] = category
+            changed = True
+        elif category.name != name:
+            category.name = name
+            changed = True
+        for tag_name in tags:
+            normalized = normalize_tag_name(tag_name).lower()
+            tag = existing_tags.get(normalized)
+            if not tag:
+                tag = Tag(
+                    category_id=category.id,
+                    name=tag_name,
+                    normalized_name=normalized,
+                    is_system=True,
+                )
+                db.add(tag)
+                existing_tags[normalized] = tag
+                changed = True
+            elif tag.category_id != category.id or not tag.is_system:
+                tag.category_id = category.id
+                tag.is_system = True
+                changed = True
+    if changed:
+        db.commit()
+        invalidate_tag_catalog()
+
+
+@dataclass(frozen=True)
+class TagCategoryEntry:
+    id: int
+    code: str
+    name: str
+
+
+@dataclass(frozen=True)
+class TagEntry:
+    id: int
+    name: str
+    normalized_name: str
+    category_id: Optional[int]
+    category_name: Optional[str]
+    is_system: bool
+
+
+@dataclass(frozen=True)
+class TagCatalog:
+    """태그 카테고리/태그 전체의 불변 스냅샷. 프로세스마다 한 번 만들고 버전이 바뀌면 새로 만든다."""
+
+    version: int
+    categories: tuple[TagCategoryEntry, ...]
+    tags: tuple[TagEntry, ...]
+    by_id: Mapping[int, TagEntry]
+    by_normalized: Mapping[str, TagEntry]
+    # (소문자 정규화 이름, tag id) 정렬 목록 — 접두어 자동완성용
+    _prefix_index: tuple[tuple[str, int], ...]
+
+    def category_by_name(self, name: str) -> Optional[TagCategoryEntry]:
+        for category in self.categories:
+            if category.name == name:
+                return category
+        return None
+
+    def search(self, token: str) -> list[TagEntry]:
+        """접두어 일치를 먼저, 그 뒤에 부분 문자열 일치를 돌려준다."""
+        key = normalize_tag_name(token).lower()
+        if not key:
+            return list(self.tags)
+        start = bisect_left(self._prefix_index, (key, -1))
+        prefix_ids: list[int] = []
+        for normalized, tag_id in self._prefix_index[start:]:
+            if not normalized.startswith(key):
+                break
+            prefix_ids.append(tag_id)
+        seen = set(prefix_ids)
+        contains_ids = [tag.id for tag in self.tags if tag.id not in seen and key in tag.normalized_name]
+        return [self.by_id[tag_id] for tag_id in prefix_ids + contains_ids]
+
+
+_lock = threading.Lock()
+_catalog: Optional[TagCatalog] = None
+
+
+def _current_version(db: Session) -> int:
+    # 태그는 추가만 되므로 PK 최댓값이 곧 버전 (인덱스로 O(1) 조회)
+    return int(db.query(func.max(Tag.id)).scalar() or 0)
+
+
+def _load_catalog(db: Session, version: int) -> TagCatalog:
+    categories = tuple(
+        TagCategoryEntry(id=row.id, code=row.code.value, name=row.name)
+        for row in db.query(TagCategory).order_by(TagCategory.id.asc()).all()
+    )
+    category_names = {c.id: c.name for c in categories}
+    tags = tuple(
+        TagEntry(
+            id=row.id,
+            name=row.name,
+            normalized_name=row.normalized_name,
+            category_id=row.category_id,
+            category_name=category_names.get(row.category_id),
+            is_system=bool(row.is_system),
+        )
+        for row in db.query(Tag).order_by(Tag.id.asc()).all()
+    )
+    return TagCatalog(
+        version=version,
+        categories=categories,
+        tags=tags,
+        by_id=MappingProxyType({t.id: t for t in tags}),
+        by_normalized=MappingProxyType({t.normalized_name: t for t in tags}),
+        _prefix_index=tuple(sorted((t.normalized_name.lower(), t.id) for t in tags)),
+    )
+
+
+def get_tag_catalog(db: Session) -> TagCatalog:
+    """프로세스 캐시된 태그 카탈로그. 다른 프로세스에서 태그가 추가되면 버전(max tag id) 비교로 다시 읽는다."""
+    global _catalog
+    version = _current_version(db)
+    catalog = _catalog
+    if catalog is not None and catalog.version == version:
+        return catalog
+    with _lock:
+        if _catalog is None or _catalog.version != version:
+            _catalog = _load_catalog(db, version)
+        return _catalog
+
+
+def invalidate_tag_catalog() -> None:
+    global _catalog
+    with _lock:
+        _catalog = None
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from sqlalchemy import event, func, inspect, select, union_all, update
+from sqlalchemy.orm import Session
+
+from app.models import (
+    Book,
+    BookAuthor,
+    BookCategory,
+    ReadingSession,
+    Review,
+    User,
+    UserBook,
+    UserPage,
+    Wishlist,
+)
+
+# user_id를 직접 가진, 서재/캘린더 응답에 나오는 모델
+_LIBRARY_MODELS = (UserBook, Review, Wishlist, ReadingSession)
+
+
+def book_stamp(db: Session, book_id: int) -> Optional[tuple[Any, int]]:
+    """책 상세의 버전 스탬프 (메타데이터 변경 시각, 평점 버전). 책이 없으면 None."""
+    row = db.query(Book.updated_at, Book.rating_version).filter(Book.id == book_id).first()
+    return tuple(row) if row else None
+
+
+def library_stamp(db: Session, user_id: int) -> tuple[Any, ...]:
+    """서재/캘린더의 버전 스탬프.
+
+    내 서재 버전에 더해, 서재에 담긴 책들의 평점 버전 합과 최신 메타데이터 시각을 함께 본다
+    (다른 사람의 리뷰로 평균 별점이 바뀌는 경우).
+    """
+    book_ids = union_all(
+        select(UserBook.book_id).where(UserBook.user_id == user_id),
+        select(Wishlist.book_id).where(Wishlist.user_id == user_id),
+    ).subquery()
+    library_version = db.query(User.library_version).filter(User.id == user_id).scalar()
+    rating_sum, meta_max = (
+        db.query(func.coalesce(func.sum(Book.rating_version), 0), func.max(Book.updated_at))
+        .filter(Book.id.in_(select(book_ids.c.book_id)))
+        .one()
+    )
+    return library_version, int(rating_sum or 0), meta_max
+
+
+def _rating_changed(obj: Review) -> bool:
+    return inspect(obj).attrs.rating.history.has_changes()
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_version_stamps(session: Session, flush_context) -> None:
+    # 쓰기 경로마다 호출하지 않도록 flush된 행을 보고 같은 트랜잭션 안에서 버전을 올린다
+    user_ids: set[int] = set()
+    user_book_ids: set[int] = set()
+    rated_book_ids: set[int] = set()
+    touched_book_ids: set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, _LIBRARY_MODELS) and obj.user_id is not None:
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, UserPage) and obj.user_book_id is not None:
+            user_book_ids.add(obj.user_book_id)
+        if isinstance(obj, Review) and obj.book_id is not None:
+            if obj in session.dirty and not _rating_changed(obj):
+                continue
+            rated_book_ids.add(obj.book_id)
+        elif isinstance(obj, (BookAuthor, BookCategory)) and obj.book_id is not None:
+            touched_book_ids.add(obj.book_id)
+    if not (user_ids or user_book_ids or rated_book_ids or touched_book_ids):
+        return
+
+    conn = session.connection()
+    users = User.__table__
+    books = Book.__table__
+    if user_book_ids:
+        user_ids.update(
+            conn.execute(select(UserBook.user_id).where(UserBook.id.in_(user_book_ids))).scalars()
+        )
+    if user_ids:
+        conn.execute(
+            update(users)
+            .where(users.c.id.in_(user_ids))
+            # 프로필 수정 시각은 그대로 둔다
+            .values(library_version=users.c.library_version + 1, updated_at=users.c.updated_at)
+        )
+    if rated_book_ids:
+        conn.execute(
+            update(books).where(books.c.id.in_(rated_book_ids)).values(rating_version=books.c.rating_version + 1)
+        )
+    touched_book_ids -= rated_book_ids
+    if touched_book_ids:
+        conn.execute(update(books).where(books.c.id.in_(touched_book_ids)).values(updated_at=func.now()))
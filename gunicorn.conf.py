@@ -0,0 +1,40 @@
+"""API 멀티 프로세스 실행 설정 (start-api.sh에서 API_SERVER=gunicorn일 때 사용).
+
+gunicorn master가 앱을 한 번 import(preload)한 뒤 uvicorn worker를 fork한다.
+- WEB_CONCURRENCY: worker 프로세스 수. 지정하지 않거나 0이면 CPU 코어 수.
+  앱을 불러오기 전에 환경 변수로 확정해 두므로 DB 풀 크기(app.core.db_pool.pool_sizing)도 이 값으로 나눠 잡힌다.
+- WEB_THREADS: worker마다의 동기 엔드포인트 스레드 수 (lifespan에서 적용).
+- 재시작: SIGHUP이면 새 worker를 띄우고 기존 worker는 처리 중인 요청을 끝낸 뒤 내린다.
+  preload이므로 코드 배포는 컨테이너 교체로 한다.
+  GUNICORN_MAX_REQUESTS마다 worker를 순서대로 교체해 메모리 증가를 막는다.
+"""
+import multiprocessing
+import os
+
+workers = int(os.environ.get("WEB_CONCURRENCY") or 0) or multiprocessing.cpu_count()
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+bind = os.environ.get("API_BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# 응답이 없는 worker를 죽이기까지의 시간과, 종료/재시작 때 처리 중인 요청을 기다리는 시간
+timeout = int(os.environ.get("GUNICORN_TIMEOUT_SECONDS", "60"))
+graceful_timeout = int(os.environ.get("GUNICORN_GRACEFUL_TIMEOUT_SECONDS", "30"))
+keepalive = 75  # 프록시(nginx)와의 연결을 uvicorn 기본값(5초)보다 오래 재사용
+
+max_requests = int(os.environ.get("GUNICORN_MAX_REQUESTS", "0"))
+max_requests_jitter = max_requests // 10
+
+# nginx가 붙여 주는 X-Forwarded-* 를 신뢰한다 (같은 docker 네트워크)
+forwarded_allow_ips = os.environ.get("FORWARDED_ALLOW_IPS", "*")
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-") or None  # 빈 값이면 끔 (부하 테스트 등)
+errorlog = "-"
+
+
+def post_fork(server, worker):
+    # master에서 preload하며 만든 커넥션을 worker가 물려받아 공유하지 않도록 풀만 새로 시작한다
+    from app.database import async_engine, engine
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
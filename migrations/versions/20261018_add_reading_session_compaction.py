@@ -0,0 +1,33 @@
+"""add reading session compaction fields
+
+Revision ID: 20261018_add_reading_session_compaction
+Revises: 20260604_add_user_profile_image
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261018_add_reading_session_compaction"
+down_revision = "20260604_add_user_profile_image"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reading_sessions", sa.Column("page_turn_count", sa.Integer(), nullable=True))
+    op.add_column("reading_sessions", sa.Column("max_page", sa.Integer(), nullable=True))
+    op.add_column("reading_sessions", sa.Column("last_page", sa.Integer(), nullable=True))
+    op.add_column("reading_sessions", sa.Column("last_page_at", sa.DateTime(), nullable=True))
+    op.add_column("reading_sessions", sa.Column("events_compacted_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_reading_sessions_compaction", "reading_sessions", ["events_compacted_at", "end_time"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reading_sessions_compaction", table_name="reading_sessions")
+    op.drop_column("reading_sessions", "events_compacted_at")
+    op.drop_column("reading_sessions", "last_page_at")
+    op.drop_column("reading_sessions", "last_page")
+    op.drop_column("reading_sessions", "max_page")
+    op.drop_column("reading_sessions", "page_turn_count")
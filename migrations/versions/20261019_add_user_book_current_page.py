@@ -0,0 +1,26 @@
+"""add user book current page
+
+Revision ID: 20261019_add_user_book_current_page
+Revises: 20261018_add_reading_session_compaction
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_add_user_book_current_page"
+down_revision = "20261018_add_reading_session_compaction"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("user_books", sa.Column("current_page", sa.Integer(), nullable=True))
+    op.add_column("user_books", sa.Column("current_page_updated_at", sa.DateTime(), nullable=True))
+    # 기존 데이터는 python -m app.scripts.backfill_user_book_current_page 로 채운다
+
+
+def downgrade() -> None:
+    op.drop_column("user_books", "current_page_updated_at")
+    op.drop_column("user_books", "current_page")
@@ -0,0 +1,24 @@
+"""add library indexes
+
+Revision ID: 20261020_add_library_indexes
+Revises: 20261019_add_user_book_current_page
+Create Date: 2026-10-20
+"""
+
+from alembic import op
+
+
+revision = "20261020_add_library_indexes"
+down_revision = "20261019_add_user_book_current_page"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_books_published_date", "books", ["published_date"], unique=False)
+    op.create_index("ix_user_books_user_status", "user_books", ["user_id", "status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_books_user_status", table_name="user_books")
+    op.drop_index("ix_books_published_date", table_name="books")
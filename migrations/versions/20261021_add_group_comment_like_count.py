@@ -0,0 +1,34 @@
+"""add group comment like count
+
+Revision ID: 20261021_add_group_comment_like_count
+Revises: 20261020_add_library_indexes
+Create Date: 2026-10-21
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261021_add_group_comment_like_count"
+down_revision = "20261020_add_library_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "group_comments",
+        sa.Column("like_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        """
+        UPDATE group_comments c
+        SET like_count = (
+            SELECT COUNT(*) FROM group_comment_likes l WHERE l.comment_id = c.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("group_comments", "like_count")
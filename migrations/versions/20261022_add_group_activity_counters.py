@@ -0,0 +1,47 @@
+"""add group activity counters
+
+Revision ID: 20261022_add_group_activity_counters
+Revises: 20261021_add_group_comment_like_count
+Create Date: 2026-10-22
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261022_add_group_activity_counters"
+down_revision = "20261021_add_group_comment_like_count"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("groups", sa.Column("member_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("groups", sa.Column("post_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("groups", sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("groups", sa.Column("activity_score", sa.Float(), nullable=False, server_default="0"))
+    op.add_column("groups", sa.Column("activity_score_updated_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_groups_public_activity", "groups", ["is_private", "activity_score"], unique=False)
+    # 카운터 초기값. activity_score는 워커의 refresh_group_activity가 채운다
+    op.execute(
+        """
+        UPDATE `groups` g
+        SET member_count = (SELECT COUNT(*) FROM group_members m WHERE m.group_id = g.id),
+            post_count = (SELECT COUNT(*) FROM group_posts p WHERE p.group_id = g.id),
+            comment_count = (
+                SELECT COUNT(*) FROM group_comments c
+                JOIN group_posts p ON c.post_id = p.id
+                WHERE p.group_id = g.id
+            )
+        """
+    )
+    op.execute("UPDATE `groups` SET activity_score = member_count + post_count + comment_count")
+
+
+def downgrade() -> None:
+    op.drop_index("ix_groups_public_activity", table_name="groups")
+    op.drop_column("groups", "activity_score_updated_at")
+    op.drop_column("groups", "activity_score")
+    op.drop_column("groups", "comment_count")
+    op.drop_column("groups", "post_count")
+    op.drop_column("groups", "member_count")
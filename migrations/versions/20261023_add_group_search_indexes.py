@@ -0,0 +1,26 @@
+"""add group search indexes
+
+Revision ID: 20261023_add_group_search_indexes
+Revises: 20261022_add_group_activity_counters
+Create Date: 2026-10-23
+"""
+
+from alembic import op
+
+
+revision = "20261023_add_group_search_indexes"
+down_revision = "20261022_add_group_activity_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 부분 문자열 검색용 ngram FULLTEXT (한글 그룹명 대응)
+    op.execute("CREATE FULLTEXT INDEX ft_groups_name_group_id ON `groups` (name, group_id) WITH PARSER ngram")
+    # 한 글자 검색어의 접두어 LIKE 용
+    op.create_index("ix_groups_name", "groups", ["name"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_groups_name", table_name="groups")
+    op.execute("DROP INDEX ft_groups_name_group_id ON `groups`")
@@ -0,0 +1,52 @@
+"""add collection counters and listing indexes
+
+Revision ID: 20261024_add_collection_counters
+Revises: 20261023_add_group_search_indexes
+Create Date: 2026-10-24
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261024_add_collection_counters"
+down_revision = "20261023_add_group_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("collections", sa.Column("like_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("collections", sa.Column("book_count", sa.Integer(), nullable=False, server_default="0"))
+    # updated_at은 ON UPDATE 대상이므로 자기 자신으로 고정해 백필이 수정 시각을 바꾸지 않게 한다
+    op.execute(
+        """
+        UPDATE collections c
+        SET like_count = (SELECT COUNT(*) FROM collection_likes l WHERE l.collection_id = c.id),
+            book_count = (SELECT COUNT(*) FROM collection_books b WHERE b.collection_id = c.id),
+            updated_at = c.updated_at
+        """
+    )
+    op.create_index(
+        "ix_collections_public_like",
+        "collections",
+        ["is_private", "like_count", "updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_collections_public_updated",
+        "collections",
+        ["is_private", "updated_at", "id"],
+        unique=False,
+    )
+    op.execute("CREATE FULLTEXT INDEX ft_collections_title ON collections (title) WITH PARSER ngram")
+    op.execute("CREATE FULLTEXT INDEX ft_books_title ON books (title) WITH PARSER ngram")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX ft_books_title ON books")
+    op.execute("DROP INDEX ft_collections_title ON collections")
+    op.drop_index("ix_collections_public_updated", table_name="collections")
+    op.drop_index("ix_collections_public_like", table_name="collections")
+    op.drop_column("collections", "book_count")
+    op.drop_column("collections", "like_count")
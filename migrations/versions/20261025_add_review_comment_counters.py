@@ -0,0 +1,54 @@
+"""add review comment counters and review list indexes
+
+Revision ID: 20261025_add_review_comment_counters
+Revises: 20261024_add_collection_counters
+Create Date: 2026-10-25
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261025_add_review_comment_counters"
+down_revision = "20261024_add_collection_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reviews", sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        """
+        UPDATE reviews r
+        SET comment_count = (SELECT COUNT(*) FROM review_comments c WHERE c.review_id = r.id)
+        """
+    )
+    op.create_table(
+        "book_review_stats",
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["book_id"], ["books.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("book_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO book_review_stats (book_id, comment_count)
+        SELECT r.book_id, SUM(r.comment_count)
+        FROM reviews r
+        GROUP BY r.book_id
+        """
+    )
+    # 리뷰 목록 정렬(latest / like / rating)별 (book_id, 정렬키, id) 인덱스
+    op.create_index("ix_reviews_book_created", "reviews", ["book_id", "created_date", "id"], unique=False)
+    op.create_index("ix_reviews_book_likes", "reviews", ["book_id", "like_count", "id"], unique=False)
+    op.create_index("ix_reviews_book_rating", "reviews", ["book_id", "rating", "id"], unique=False)
+
+
+def downgrade() -> None:
+    # MySQL은 위 복합 인덱스가 생기면 book_id FK용 자동 인덱스를 제거하므로, 복합 인덱스를 지우기 전에 되돌려 둔다
+    op.create_index("ix_reviews_book_id", "reviews", ["book_id"], unique=False)
+    op.drop_index("ix_reviews_book_rating", table_name="reviews")
+    op.drop_index("ix_reviews_book_likes", table_name="reviews")
+    op.drop_index("ix_reviews_book_created", table_name="reviews")
+    op.drop_table("book_review_stats")
+    op.drop_column("reviews", "comment_count")
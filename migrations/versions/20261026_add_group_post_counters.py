@@ -0,0 +1,39 @@
+"""add group post like/comment counters
+
+Revision ID: 20261026_add_group_post_counters
+Revises: 20261025_add_review_comment_counters
+Create Date: 2026-10-26
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261026_add_group_post_counters"
+down_revision = "20261025_add_review_comment_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("group_posts", sa.Column("like_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("group_posts", sa.Column("comment_count", sa.Integer(), nullable=False, server_default="0"))
+    op.execute(
+        """
+        UPDATE group_posts p
+        SET like_count = (SELECT COUNT(*) FROM group_post_likes l WHERE l.post_id = p.id),
+            comment_count = (SELECT COUNT(*) FROM group_comments c WHERE c.post_id = p.id)
+        """
+    )
+    # 기존 ORM read-modify-write로 어긋났을 수 있는 리뷰 좋아요 수도 함께 맞춘다
+    op.execute(
+        """
+        UPDATE reviews r
+        SET like_count = (SELECT COUNT(*) FROM review_likes l WHERE l.review_id = r.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("group_posts", "comment_count")
+    op.drop_column("group_posts", "like_count")
@@ -0,0 +1,47 @@
+"""add user badge metrics and badge evaluation queue
+
+Revision ID: 20261027_add_badge_metrics_and_queue
+Revises: 20261026_add_group_post_counters
+Create Date: 2026-10-27
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "20261027_add_badge_metrics_and_queue"
+down_revision = "20261026_add_group_post_counters"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_badge_metrics",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("completed_books", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("rating_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("review_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("wishlist_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("bookmark_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("genre_counts", mysql.JSON(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_table(
+        "badge_evaluation_events",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("category", sa.String(length=50), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", "category", name="uq_badge_evaluation_event"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("badge_evaluation_events")
+    op.drop_table("user_badge_metrics")
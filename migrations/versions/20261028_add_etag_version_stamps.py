@@ -0,0 +1,27 @@
+"""add version stamps for conditional GET (books.updated_at/rating_version, users.library_version)
+
+Revision ID: 20261028_add_etag_version_stamps
+Revises: 20261027_add_badge_metrics_and_queue
+Create Date: 2026-10-28
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261028_add_etag_version_stamps"
+down_revision = "20261027_add_badge_metrics_and_queue"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("books", sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False))
+    op.add_column("books", sa.Column("rating_version", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("users", sa.Column("library_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "library_version")
+    op.drop_column("books", "rating_version")
+    op.drop_column("books", "updated_at")
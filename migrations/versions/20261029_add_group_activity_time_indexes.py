@@ -0,0 +1,25 @@
+"""add created_at indexes for group activity refresh
+
+Revision ID: 20261029_add_group_activity_time_indexes
+Revises: 20261028_add_etag_version_stamps
+Create Date: 2026-10-29
+"""
+
+from alembic import op
+
+
+revision = "20261029_add_group_activity_time_indexes"
+down_revision = "20261028_add_etag_version_stamps"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 최근 활동이 있는 그룹만 고르는 범위 조건 (refresh_group_activity)
+    op.create_index("ix_group_posts_created_at", "group_posts", ["created_at", "group_id"], unique=False)
+    op.create_index("ix_group_comments_created_at", "group_comments", ["created_at", "post_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_group_comments_created_at", table_name="group_comments")
+    op.drop_index("ix_group_posts_created_at", table_name="group_posts")
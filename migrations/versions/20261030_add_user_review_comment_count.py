@@ -0,0 +1,31 @@
+"""add users.review_comment_count
+
+Revision ID: 20261030_add_user_review_comment_count
+Revises: 20261029_add_group_activity_time_indexes
+Create Date: 2026-10-30
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261030_add_user_review_comment_count"
+down_revision = "20261029_add_group_activity_time_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("review_comment_count", sa.Integer(), nullable=False, server_default="0"))
+    # 카운터 초기값 (updated_at은 그대로 둔다)
+    op.execute(
+        """
+        UPDATE users u
+        SET review_comment_count = (SELECT COUNT(*) FROM review_comments c WHERE c.user_id = u.id),
+            updated_at = u.updated_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "review_comment_count")
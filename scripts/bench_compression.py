@@ -0,0 +1,185 @@
+"""JSON 응답 압축 벤치마크.
+
+서재(200권), 큐레이션, 알림 목록 응답을 gzip(레벨별)과 brotli(설치돼 있으면)로 압축해
+크기, 압축/해제 시간, 주어진 대역폭에서의 예상 전송 시간을 비교한다.
+nginx gzip_comp_level / gzip_min_length 값을 정할 때 쓴다.
+
+기본은 스키마로 만든 대표 페이로드를 쓰고, --base-url/--token을 주면 실행 중인 서버의 실제 응답을 받아 쓴다.
+
+예)
+  python scripts/bench_compression.py --mbps 5
+  python scripts/bench_compression.py --base-url http://localhost:8000 --token "$TOKEN"
+"""
+import argparse
+import datetime
+import gzip
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from app.core.responses import model_response  # noqa: E402
+from app.schemas.book import BookResponse  # noqa: E402
+from app.schemas.library import BookLibraryItem, LibraryResponse  # noqa: E402
+from app.schemas.notification import NotificationItemResponse, NotificationListResponse  # noqa: E402
+from app.schemas.recommend import CurationItem, CurationsResponse  # noqa: E402
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 비교
+    brotli = None
+
+LIVE_PATHS = {
+    "library": "/library/?limit=200",
+    "curations": "/recommend/curations",
+    "notifications": "/users/me/notifications?limit=50",
+}
+
+DESCRIPTION = (
+    "한 사람의 일생을 따라가며 가족과 시대, 기억과 상실을 섬세하게 그려 낸 장편소설. "
+    "작가 특유의 담담한 문장으로 평범한 하루 속에 숨은 이야기를 길어 올린다. "
+)
+
+
+def _book(i: int) -> BookResponse:
+    return BookResponse(
+        id=i,
+        isbn=f"97889{i:08d}",
+        title=f"도서 제목 {i}: 부제가 붙은 조금 긴 제목",
+        publisher="문학출판사",
+        published_date="2023-05-10",
+        language="ko",
+        category="소설/시/희곡",
+        total_pages=300 + i % 200,
+        thumbnail=f"https://image.aladin.co.kr/product/{i}/cover500/{i}.jpg",
+        small_thumbnail=f"https://image.aladin.co.kr/product/{i}/coversum/{i}.jpg",
+        description=DESCRIPTION * 3,
+        average_rating=round(3 + (i % 20) / 10, 1),
+        review_count=i % 50,
+        authors=[f"저자{i % 37}", "옮긴이"],
+        categories=["소설", "한국소설"],
+    )
+
+
+def sample_payloads() -> dict[str, bytes]:
+    library = LibraryResponse(
+        total=200,
+        items=[
+            BookLibraryItem(
+                book=_book(i),
+                status="READING" if i % 3 else "COMPLETED",
+                added_at="2024-03-01T12:00:00",
+                started_at="2024-03-02T09:30:00",
+                my_rating=4.5,
+                avg_rating=4.1,
+                review_count=i % 50,
+                progress_percent=round(i % 100 + 0.5, 1),
+                current_page=i % 300,
+                total_reading_seconds=60 * i,
+            )
+            for i in range(200)
+        ],
+    )
+    curations = CurationsResponse(
+        curations=[
+            CurationItem(title=f"테마 {t}", items=[_book(t * 100 + i) for i in range(15)]) for t in range(4)
+        ]
+    )
+    now = datetime.datetime(2024, 6, 1, 12, 0, 0)
+    notifications = NotificationListResponse(
+        notifications=[
+            NotificationItemResponse(
+                notificationId=f"n{i}",
+                tabCategory="SOCIAL",
+                type="REVIEW_LIKE",
+                title="내 리뷰에 좋아요",
+                message=f"독자{i}님이 회원님의 리뷰를 좋아합니다.",
+                thumbnailUrl=f"https://cdn.example.com/profile/{i}.jpg",
+                senderName=f"독자{i}",
+                isRead=bool(i % 2),
+                createdAt=now - datetime.timedelta(minutes=i),
+                targetInfo={"reviewId": i, "bookId": i * 7},
+            )
+            for i in range(50)
+        ],
+        limit=50,
+        offset=0,
+        hasNext=True,
+    )
+    return {
+        "library": model_response(library).body,
+        "curations": model_response(curations).body,
+        "notifications": model_response(notifications).body,
+    }
+
+
+def live_payloads(base_url: str, token: str) -> dict[str, bytes]:
+    import httpx
+
+    headers = {"Accept-Encoding": "identity"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+        payloads = {}
+        for name, path in LIVE_PATHS.items():
+            res = client.get(path)
+            res.raise_for_status()
+            payloads[name] = res.content
+        return payloads
+
+
+def codecs() -> list[tuple[str, callable, callable]]:
+    result = [
+        (f"gzip-{level}", lambda data, level=level: gzip.compress(data, compresslevel=level), gzip.decompress)
+        for level in (1, 5, 9)
+    ]
+    if brotli is not None:
+        result += [
+            (f"br-{quality}", lambda data, quality=quality: brotli.compress(data, quality=quality), brotli.decompress)
+            for quality in (4, 6, 11)
+        ]
+    return result
+
+
+def timed_ms(fn, data: bytes, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn(data)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=None, help="주면 실행 중인 서버의 실제 응답을 쓴다")
+    parser.add_argument("--token", default="", help="인증이 필요한 경로(서재, 알림)용 Bearer 토큰")
+    parser.add_argument("--mbps", type=float, default=5.0, help="예상 전송 시간 계산에 쓸 대역폭 (모바일 기준)")
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    payloads = live_payloads(args.base_url, args.token) if args.base_url else sample_payloads()
+    if brotli is None:
+        print("brotli 미설치: gzip만 비교한다")
+    bytes_per_ms = args.mbps * 1_000_000 / 8 / 1000
+
+    for name, raw in payloads.items():
+        plain_ms = len(raw) / bytes_per_ms
+        print(f"\n[{name}] {len(raw)} bytes, 무압축 전송 {plain_ms:.1f}ms @ {args.mbps}Mbps")
+        print(f"  {'codec':8s} {'bytes':>8s} {'ratio':>6s} {'comp':>8s} {'decomp':>8s} {'transfer':>9s} {'total':>8s}")
+        for codec, compress, decompress in codecs():
+            packed = compress(raw)
+            comp_ms = timed_ms(compress, raw, args.rounds)
+            decomp_ms = timed_ms(decompress, packed, args.rounds)
+            transfer_ms = len(packed) / bytes_per_ms
+            total_ms = comp_ms + transfer_ms + decomp_ms
+            print(
+                f"  {codec:8s} {len(packed):8d} {len(raw) / len(packed):5.1f}x {comp_ms:7.2f}ms {decomp_ms:7.2f}ms "
+                f"{transfer_ms:8.1f}ms {total_ms:7.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
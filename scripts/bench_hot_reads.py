@@ -0,0 +1,100 @@
+"""핫 읽기 엔드포인트 동시성 벤치마크.
+
+실행 중인 API 서버에 동시 요청을 보내 처리량(req/s)과 지연 분포를 출력한다.
+동기 세션 버전(이전 커밋)과 비동기 세션 버전을 같은 옵션으로 돌려 비교한다.
+
+예)
+  python scripts/bench_hot_reads.py --base-url http://localhost:8000 \
+      --token "$TOKEN" --concurrency 200 --requests 5000 \
+      --path /library/ --path /users/me/notifications/unread-count --path /books/1
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+DEFAULT_PATHS = [
+    "/library/",
+    "/users/me/notifications",
+    "/users/me/notifications/unread-count",
+    "/books/?q=소설",
+]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run_path(client: httpx.AsyncClient, path: str, total: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+    lock = asyncio.Lock()
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        while True:
+            async with lock:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            started = time.perf_counter()
+            try:
+                res = await client.get(path)
+                if res.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "path": path,
+        "requests": total,
+        "errors": errors,
+        "rps": total / elapsed if elapsed else 0.0,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout) as client:
+        paths = args.path or DEFAULT_PATHS
+        if args.warmup:
+            for path in paths:
+                await run_path(client, path, args.warmup, min(args.concurrency, args.warmup))
+        print(f"{'path':40} {'req':>6} {'err':>5} {'req/s':>9} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8}")
+        for path in paths:
+            r = await run_path(client, path, args.requests, args.concurrency)
+            print(
+                f"{r['path'][:40]:40} {r['requests']:>6} {r['errors']:>5} {r['rps']:>9.1f} "
+                f"{r['p50']:>8.1f} {r['p95']:>8.1f} {r['p99']:>8.1f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent throughput benchmark for hot read endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--token", default=None, help="Bearer access token (인증 필요한 엔드포인트용)")
+    parser.add_argument("--path", action="append", help="측정할 경로 (여러 번 지정 가능)")
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000, help="경로별 요청 수")
+    parser.add_argument("--warmup", type=int, default=50, help="경로별 워밍업 요청 수 (0이면 생략)")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""응답 직렬화 마이크로 벤치마크.
+
+200권짜리 서재 응답(LibraryResponse)을 다음 경로로 직렬화하는 시간을 비교한다.
+  - fastapi-default : 모델을 반환했을 때의 FastAPI 경로 (response_model 재검증 + jsonable_encoder + json.dumps)
+  - fastapi-orjson  : 같은 경로에서 렌더링만 FastJSONResponse(orjson)로 바꾼 경우 (앱 기본 응답 클래스)
+  - model-dump-json : 이미 만든 모델을 model_response로 바로 직렬화 (재검증 없음)
+
+예)
+  python scripts/bench_json_serialization.py --items 200 --rounds 500
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from app.core.responses import FastJSONResponse, model_response, orjson  # noqa: E402
+from app.schemas.book import BookResponse  # noqa: E402
+from app.schemas.library import BookLibraryItem, LibraryResponse  # noqa: E402
+
+
+def build_payload(count: int) -> LibraryResponse:
+    items = [
+        BookLibraryItem(
+            book=BookResponse(
+                id=i,
+                isbn=f"97889{i:08d}",
+                title=f"테스트 도서 {i}",
+                publisher="출판사",
+                published_date="2024-01-01",
+                language="ko",
+                category="소설",
+                total_pages=320,
+                thumbnail=f"https://example.com/covers/{i}.jpg",
+                small_thumbnail=f"https://example.com/covers/{i}_s.jpg",
+                description="책 소개 " * 20,
+                average_rating=4.2,
+                review_count=17,
+                authors=["저자 A", "저자 B"],
+                categories=["소설", "한국소설"],
+            ),
+            status="READING",
+            added_at="2024-03-01T12:00:00",
+            started_at="2024-03-02T09:30:00",
+            my_rating=4.5,
+            avg_rating=4.2,
+            review_count=17,
+            progress_percent=42.5,
+            current_page=136,
+            total_reading_seconds=7200,
+        )
+        for i in range(count)
+    ]
+    return LibraryResponse(total=count, items=items, next_cursor="eyJpZCI6IDIwMH0")
+
+
+def measure(fn, rounds: int) -> list[float]:
+    fn()  # 워밍업
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=500)
+    args = parser.parse_args()
+
+    payload = build_payload(args.items)
+    field = create_model_field(name="Response_get_library", type_=LibraryResponse, mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def fastapi_path(response_class):
+        def run():
+            content = loop.run_until_complete(
+                serialize_response(field=field, response_content=payload, is_coroutine=True)
+            )
+            return response_class(content=content).body
+
+        return run
+
+    cases = {
+        "fastapi-default": fastapi_path(JSONResponse),
+        "fastapi-orjson": fastapi_path(FastJSONResponse),
+        "model-dump-json": lambda: model_response(payload).body,
+    }
+    if orjson is None:
+        print("orjson 미설치: fastapi-orjson은 표준 json으로 렌더링된다")
+
+    sizes = {name: len(fn()) for name, fn in cases.items()}
+    baseline = None
+    print(f"items={args.items} rounds={args.rounds}")
+    for name, fn in cases.items():
+        samples = measure(fn, args.rounds)
+        median = statistics.median(samples)
+        baseline = baseline or median
+        print(
+            f"{name:16s} median={median:7.3f}ms mean={statistics.fmean(samples):7.3f}ms "
+            f"bytes={sizes[name]} speedup={baseline / median:5.2f}x"
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""worker 프로세스 수에 따른 처리량 부하 테스트.
+
+--workers로 준 각 N마다 gunicorn.conf.py 설정(WEB_CONCURRENCY=N, preload)으로 API를 띄우고,
+bench_hot_reads의 부하 생성기로 같은 요청을 보낸 뒤 req/s와 지연을 N=1 대비 배율로 출력한다.
+DB가 필요한 경로는 .env의 DATABASE_URL이 가리키는 DB를 그대로 쓴다.
+CPU를 쓰는 경로(/auth/login 같은 비밀번호 해시)는 --login으로 측정한다.
+
+예)
+  python scripts/bench_worker_scaling.py --workers 1,2,4 --path /health --path /openapi.json
+  python scripts/bench_worker_scaling.py --workers 1,2,4 --login myid:password --requests 300
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+sys.path.append(os.path.dirname(__file__))
+
+from bench_hot_reads import run_path  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        WEB_CONCURRENCY=str(workers),
+        API_BIND=f"127.0.0.1:{port}",
+        GUNICORN_ACCESS_LOG="",
+    )
+    return subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(base_url: str, workers: int, timeout: float) -> None:
+    # 모든 worker가 lifespan을 마칠 때까지 /health가 연속으로 성공해야 준비된 것으로 본다
+    deadline = time.monotonic() + timeout
+    streak = 0
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health", timeout=2).status_code == 200:
+                streak += 1
+                if streak >= workers * 4:
+                    return
+                continue
+        except httpx.HTTPError:
+            pass
+        streak = 0
+        time.sleep(0.2)
+    raise RuntimeError(f"{base_url} did not become ready in {timeout}s")
+
+
+class LoginClient:
+    """run_path에 넘길 클라이언트 대역: GET 대신 로그인 POST를 보낸다."""
+
+    def __init__(self, client: httpx.AsyncClient, login_id: str, password: str) -> None:
+        self._client = client
+        self._body = {"login_id": login_id, "password": password}
+
+    async def get(self, path: str) -> httpx.Response:
+        return await self._client.post(path, json=self._body)
+
+
+async def measure(base_url: str, args: argparse.Namespace) -> list[dict]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+        targets = [(client, path) for path in args.path or ([] if args.login else ["/health"])]
+        if args.login:
+            login_id, _, password = args.login.partition(":")
+            targets.append((LoginClient(client, login_id, password), "/auth/login"))
+        results = []
+        for target, path in targets:
+            if args.warmup:
+                await run_path(target, path, args.warmup, min(args.concurrency, args.warmup))
+            results.append(await run_path(target, path, args.requests, args.concurrency))
+        return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", default=f"1,2,{os.cpu_count() or 4}", help="비교할 worker 수 목록 (쉼표 구분)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", action="append", help="GET으로 측정할 경로 (여러 번 지정 가능, 기본 /health)")
+    parser.add_argument("--login", default=None, help="login_id:password - /auth/login 처리량도 측정")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=3000, help="경로별 요청 수")
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    counts = sorted({int(n) for n in args.workers.split(",") if n.strip()})
+    base_url = f"http://127.0.0.1:{args.port}"
+    baseline: dict[str, float] = {}
+    print(f"cpu={os.cpu_count()} concurrency={args.concurrency} requests/path={args.requests}")
+    print(f"{'workers':>7} {'path':32} {'err':>5} {'req/s':>9} {'scale':>6} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8}")
+    for count in counts:
+        server = start_server(count, args.port)
+        try:
+            wait_ready(base_url, count, args.startup_timeout)
+            for r in asyncio.run(measure(base_url, args)):
+                baseline.setdefault(r["path"], r["rps"])
+                scale = r["rps"] / baseline[r["path"]] if baseline[r["path"]] else 0.0
+                print(
+                    f"{count:>7} {r['path'][:32]:32} {r['errors']:>5} {r['rps']:>9.1f} {scale:>5.2f}x "
+                    f"{r['p50']:>8.1f} {r['p95']:>8.1f} {r['p99']:>8.1f}"
+                )
+        finally:
+            # SIGTERM: gunicorn graceful shutdown
+            server.terminate()
+            server.wait(timeout=60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""API/worker 기동 시 import 시간 분석.
+
+`python -X importtime`으로 대상 모듈을 새 프로세스에서 여러 번 import해 중앙값 기준으로
+전체 시간, 누적 시간이 큰 모듈, app 내부 모듈별 시간, 무거운 SDK가 기동 시 로딩되는지를 출력한다.
+첫 실행은 .pyc 생성과 디스크 캐시 영향이 있어 --runs 번 중 중앙값을 쓴다.
+
+예)
+  python scripts/profile_imports.py
+  python scripts/profile_imports.py --module app.main --module worker.worker --runs 5 --top 30
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 기동 시에는 불러오지 않아야 하는 SDK (처음 쓰는 시점에 지연 로딩)
+LAZY_SDKS = ("firebase_admin", "boto3", "botocore", "requests", "httpx", "redis")
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$")
+
+
+def import_profile(module: str) -> tuple[float, dict[str, tuple[int, int, int]]]:
+    """(벽시계 ms, {모듈: (self us, cumulative us, depth)})"""
+    code = f"import time; t = time.perf_counter(); import {module}; print((time.perf_counter() - t) * 1000)"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            modules[name] = (int(self_us), int(cumulative_us), (len(indent) - 1) // 2)
+    return float(proc.stdout.strip().splitlines()[-1]), modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", action="append", help="분석할 모듈 (여러 번 지정 가능, 기본: app.main, worker.worker)")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    for module in args.module or ["app.main", "worker.worker"]:
+        walls: list[float] = []
+        samples: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for _ in range(args.runs):
+            wall_ms, modules = import_profile(module)
+            walls.append(wall_ms)
+            for name, values in modules.items():
+                samples[name].append(values)
+
+        def median(name: str, index: int) -> float:
+            return statistics.median(values[index] for values in samples[name]) / 1000
+
+        print(f"\n== {module}: import {statistics.median(walls):.0f}ms (중앙값, {args.runs}회), 모듈 {len(samples)}개")
+
+        print(f"-- {module}가 직접 import하는 모듈의 누적 시간 상위 {args.top}")
+        top_level = [name for name, values in samples.items() if values[0][2] == 1]
+        for name in sorted(top_level, key=lambda n: median(n, 1), reverse=True)[: args.top]:
+            print(f"  {median(name, 1):8.1f}ms  {name}")
+
+        print("-- app 모듈 자체 시간 상위 (라우터 등록, 모델 정의 등)")
+        own = [name for name in samples if name.split(".")[0] in ("app", "worker")]
+        for name in sorted(own, key=lambda n: median(n, 0), reverse=True)[: args.top]:
+            print(f"  {median(name, 0):8.1f}ms  {name}")
+
+        loaded = [sdk for sdk in LAZY_SDKS if sdk in samples]
+        print(f"-- 기동 시 로딩된 지연 대상 SDK: {', '.join(loaded) if loaded else '없음'}")
+        for sdk in loaded:
+            print(f"  {median(sdk, 1):8.1f}ms  {sdk}")
+
+
+if __name__ == "__main__":
+    main()
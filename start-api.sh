@@ -7,4 +7,10 @@ if [ -f ./alembic.ini ]; then
 else
 	echo "[WARN] alembic.ini not found; skipping migrations"
 fi
+
+# API_SERVER=gunicorn: WEB_CONCURRENCY개 worker 프로세스 + preload (gunicorn.conf.py)
+# 그 외: 단일 uvicorn 프로세스 (개발/소규모)
+if [ "${API_SERVER:-uvicorn}" = "gunicorn" ]; then
+	exec gunicorn -c gunicorn.conf.py app.main:app
+fi
 exec uvicorn app.main:app --host 0.0.0.0 --port 8000
@@ -0,0 +1,42 @@
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, User
+
+# 서비스 단위 테스트용 메모리 DB (API 테스트는 모듈마다 자체 DB와 의존성 오버라이드를 쓴다)
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+
+@pytest.fixture
+def db():
+    """테이블을 새로 만든 세션."""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = TestingSessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_user(db):
+    """make_user() -> flush된 새 User."""
+
+    def make():
+        suffix = uuid.uuid4().hex[:8]
+        user = User(email=f"u_{suffix}@example.com", login_id=f"u_{suffix}", password_hash="x", name="U", nickname="U")
+        db.add(user)
+        db.flush()
+        return user
+
+    return make
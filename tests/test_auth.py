@@ -1,22 +1,31 @@
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
 from app.api import auth as auth_api
 from app.core.config import get_settings
-from app.database import get_db
-from app.models import Base
+from app.core.response_cache import MemoryBackend, ResponseCache, set_response_cache
+from app.database import get_async_db, get_db
+from app.models import Base, User
 
 # In-memory SQLite for tests (shared across threads/connections)
+# async 엔드포인트(get_async_db)도 같은 메모리 DB를 보도록 이름 있는 shared-cache DB를 쓴다
+DB_URI = f"file:{__name__}?mode=memory&cache=shared&uri=true"
 test_engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{DB_URI}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(bind=test_engine, autoflush=False, autocommit=False, future=True)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=create_async_engine(f"sqlite+aiosqlite:///{DB_URI}", poolclass=NullPool),
+    expire_on_commit=False,
+)
 
 # Ensure all tables are created before tests run
 Base.metadata.create_all(bind=test_engine)
@@ -36,6 +45,13 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = override_get_async_db
 client = TestClient(app)
 
 @pytest.fixture
@@ -74,6 +90,85 @@ def test_login_and_me_flow(registered_user):
     assert new_tokens["access_token"] != tokens["access_token"]
 
 
+def test_me_uses_user_snapshot_cache_and_invalidates_on_change():
+    payload = {"email": "cache@example.com", "login_id": "cache_user", "password": "secretpw", "name": "C", "nickname": "before"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    tokens = client.post("/auth/login", json={"login_id": payload["login_id"], "password": payload["password"]}).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    user_selects = []
+
+    def count_user_selects(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            user_selects.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", count_user_selects)
+    try:
+        assert client.get("/auth/me", headers=headers).json()["nickname"] == "before"
+        assert user_selects == []
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_user_selects)
+
+    # 프로필 수정은 스냅샷을 무효화한다
+    assert client.patch("/auth/me", json={"nickname": "after"}, headers=headers).status_code == 200
+    assert client.get("/auth/me", headers=headers).json()["nickname"] == "after"
+
+    # 다른 세션에서 바꾼 값(관리자 여부 등)도 이 프로세스의 커밋이라면 바로 반영된다
+    db = next(app.dependency_overrides[get_db]())
+    user = db.query(User).filter(User.login_id == payload["login_id"]).one()
+    user.name = "Renamed"
+    db.flush()
+    # 커밋 전에는 스냅샷을 그대로 두어, 그 사이에 옛 행이 다시 캐시되지 않게 한다
+    assert client.get("/auth/me", headers=headers).json()["name"] == "C"
+    db.commit()
+    db.close()
+    assert client.get("/auth/me", headers=headers).json()["name"] == "Renamed"
+
+
+def test_user_snapshot_invalidation_reaches_other_workers_through_shared_backend():
+    backend = MemoryBackend()
+    set_response_cache(ResponseCache(100, 60, backend))
+    try:
+        payload = {"email": "shared@example.com", "login_id": "shared_user", "password": "secretpw", "name": "S", "nickname": "S"}
+        assert client.post("/auth/register", json=payload).status_code == 201
+        tokens = client.post("/auth/login", json={"login_id": payload["login_id"], "password": payload["password"]}).json()
+        headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+        assert client.get("/auth/me", headers=headers).json()["name"] == "S"
+
+        # 다른 worker가 이름을 바꾸고 무효화했다: 공유 버전만 올라가고 이 프로세스의 스냅샷은 남아 있다
+        db = next(app.dependency_overrides[get_db]())
+        db.query(User).filter(User.login_id == payload["login_id"]).update({User.name: "OtherWorker"})
+        db.commit()
+        user_id = db.query(User.id).filter(User.login_id == payload["login_id"]).scalar()
+        db.close()
+        ResponseCache(100, 60, backend).invalidate(f"user:{user_id}")
+
+        assert client.get("/auth/me", headers=headers).json()["name"] == "OtherWorker"
+    finally:
+        set_response_cache(None)
+
+
+def test_async_endpoints_authenticate_without_sync_session():
+    payload = {"email": "async@example.com", "login_id": "async_user", "password": "secretpw", "name": "A", "nickname": "a"}
+    assert client.post("/auth/register", json=payload).status_code == 201
+    tokens = client.post("/auth/login", json={"login_id": payload["login_id"], "password": payload["password"]}).json()
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+
+    def no_sync_db():
+        raise AssertionError("async endpoint opened a sync session")
+        yield
+
+    previous = app.dependency_overrides[get_db]
+    app.dependency_overrides[get_db] = no_sync_db
+    try:
+        assert client.get("/users/me/notifications/unread-count", headers=headers).json() == {"unreadCount": 0}
+        assert client.get("/library/", headers=headers).status_code == 200
+        assert client.get("/users/me/notifications", headers={"Authorization": "Bearer bad"}).status_code == 401
+    finally:
+        app.dependency_overrides[get_db] = previous
+
+
 def test_me_unauthorized():
     r = client.get("/auth/me")
     assert r.status_code == 403 or r.status_code == 401  # HTTPBearer auto_error True gives 403
@@ -0,0 +1,110 @@
+import pytest
+
+import app.services.badges as badges_service
+
+from app.models import (
+    BadgeEvaluationEvent,
+    Book,
+    BookCategory,
+    ReadingStatus,
+    Review,
+    UserBadge,
+    UserBadgeMetric,
+    UserBook,
+)
+from app.services.badges import (
+    REVIEW_BADGE_CATEGORIES,
+    enqueue_badge_evaluation,
+    evaluate_user_badges,
+    invalidate_badge_definitions,
+    process_badge_evaluation_queue,
+)
+
+
+@pytest.fixture
+def db(db):
+    # 정의 id는 DB마다 다르므로 프로세스 캐시를 비운다
+    invalidate_badge_definitions()
+    return db
+
+
+def seed_rated_books(db, user, count, category_name, *, with_content=False, status=None):
+    for _ in range(count):
+        book = Book(title="BadgeBook")
+        db.add(book)
+        db.flush()
+        db.add(BookCategory(book_id=book.id, category_name=category_name))
+        user_book = UserBook(user_id=user.id, book_id=book.id, status=status)
+        db.add(user_book)
+        db.flush()
+        db.add(Review(
+            user_book_id=user_book.id,
+            user_id=user.id,
+            book_id=book.id,
+            rating=4.0,
+            content="좋아요" if with_content else None,
+        ))
+    db.commit()
+
+
+def earned_codes(db, user_id):
+    return sorted(badge.badge_definition.code + (f":{badge.context_value}" if badge.context_value else "")
+                  for badge in db.query(UserBadge).filter(UserBadge.user_id == user_id).all())
+
+
+def test_queue_evaluates_only_enqueued_categories_once_per_user(db, make_user):
+    user = make_user()
+    seed_rated_books(db, user, 6, "에세이", with_content=True, status=ReadingStatus.COMPLETED)
+    seed_rated_books(db, user, 4, "한국시")
+
+    enqueue_badge_evaluation(db, user.id, *REVIEW_BADGE_CATEGORIES)
+    enqueue_badge_evaluation(db, user.id, "rating")
+    assert db.query(BadgeEvaluationEvent).count() == 3
+
+    assert process_badge_evaluation_queue(db) == 1
+    assert db.query(BadgeEvaluationEvent).count() == 0
+    # 완독 5권 이상이지만 reading 카테고리는 대기열에 없었으므로 아직 판정하지 않는다
+    assert earned_codes(db, user.id) == ["rating.fairy_10", "review.poem_5"]
+    metric = db.get(UserBadgeMetric, user.id)
+    assert (metric.rating_count, metric.review_count, metric.completed_books) == (10, 6, 0)
+    assert metric.genre_counts == {"에세이": 6, "시": 4}
+
+    enqueue_badge_evaluation(db, user.id, "reading")
+    process_badge_evaluation_queue(db)
+    assert "reading.beginner_5" in earned_codes(db, user.id)
+
+
+def test_full_evaluation_awards_genre_lover_per_genre_and_is_idempotent(db, make_user):
+    user = make_user()
+    seed_rated_books(db, user, 10, "에세이")
+
+    assert evaluate_user_badges(db, user.id) == 2
+    assert earned_codes(db, user.id) == ["genre.lover_10:에세이", "rating.fairy_10"]
+    assert evaluate_user_badges(db, user.id) == 0
+
+
+def test_failed_user_is_requeued_and_rest_of_batch_is_evaluated(db, make_user, monkeypatch):
+    failing, healthy = make_user(), make_user()
+    seed_rated_books(db, healthy, 10, "에세이")
+    enqueue_badge_evaluation(db, failing.id, "rating", "review")
+    enqueue_badge_evaluation(db, healthy.id, "rating")
+
+    evaluate = badges_service.evaluate_user_badges
+
+    def flaky_evaluate(session, user_id, categories=None):
+        if user_id == failing.id:
+            raise RuntimeError("push failed")
+        return evaluate(session, user_id, categories)
+
+    monkeypatch.setattr(badges_service, "evaluate_user_badges", flaky_evaluate)
+    assert process_badge_evaluation_queue(db) == 1
+    assert "rating.fairy_10" in earned_codes(db, healthy.id)
+    remaining = db.query(BadgeEvaluationEvent).all()
+    assert sorted((event.user_id, event.category) for event in remaining) == [
+        (failing.id, "rating"),
+        (failing.id, "review"),
+    ]
+
+    monkeypatch.setattr(badges_service, "evaluate_user_badges", evaluate)
+    assert process_badge_evaluation_queue(db) == 1
+    assert db.query(BadgeEvaluationEvent).count() == 0
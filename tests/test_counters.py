@@ -0,0 +1,77 @@
+from datetime import datetime
+
+from app.models import (
+    Book,
+    BookReviewStats,
+    Collection,
+    CollectionLike,
+    Review,
+    ReviewComment,
+    ReviewLike,
+    UserBook,
+)
+from app.services.counters import add_unique_row, bump_counter, reconcile_counters
+
+
+def seed_review(db, author):
+    book = Book(title="CounterBook")
+    db.add(book)
+    db.flush()
+    user_book = UserBook(user_id=author.id, book_id=book.id)
+    db.add(user_book)
+    db.flush()
+    review = Review(user_book_id=user_book.id, user_id=author.id, book_id=book.id, rating=4.0)
+    db.add(review)
+    db.commit()
+    return review
+
+
+def test_add_unique_row_is_idempotent_and_counter_is_atomic(db, make_user):
+    review = seed_review(db, make_user())
+    fan = make_user()
+    db.commit()
+
+    assert add_unique_row(db, ReviewLike(review_id=review.id, user_id=fan.id))
+    bump_counter(db, Review, review.id, Review.like_count, 1)
+    db.commit()
+    assert not add_unique_row(db, ReviewLike(review_id=review.id, user_id=fan.id))
+    db.commit()
+
+    db.refresh(review)
+    assert review.like_count == 1
+    assert db.query(ReviewLike).count() == 1
+
+
+def test_reconcile_fixes_drifted_counters_only(db, make_user):
+    review = seed_review(db, make_user())
+    fans = [make_user() for _ in range(3)]
+    owner = make_user()
+    updated_at = datetime(2026, 1, 2, 3, 4, 5)
+    collection = Collection(user_id=owner.id, title="C", updated_at=updated_at)
+    db.add(collection)
+    db.flush()
+    for fan in fans:
+        db.add(ReviewLike(review_id=review.id, user_id=fan.id))
+        db.add(ReviewComment(review_id=review.id, user_id=fan.id, content="hi"))
+        db.add(CollectionLike(collection_id=collection.id, user_id=fan.id))
+    # 카운터를 일부러 어긋나게 둔다 (CASCADE 삭제 등으로 생기는 상황)
+    review.like_count = 7
+    review.comment_count = 3
+    db.add(BookReviewStats(book_id=review.book_id, comment_count=1))
+    collection.like_count = 0
+    db.commit()
+
+    fixed = reconcile_counters(db, batch_size=2)
+    assert fixed == {
+        "reviews.like_count": 1,
+        "book_review_stats.comment_count": 1,
+        "collections.like_count": 1,
+        "users.review_comment_count": 3,
+    }
+    db.expire_all()
+    assert (review.like_count, review.comment_count) == (3, 3)
+    assert db.get(BookReviewStats, review.book_id).comment_count == 3
+    assert collection.like_count == 3
+    assert collection.updated_at == updated_at
+    assert {fan.review_comment_count for fan in fans} == {1}
+    assert reconcile_counters(db) == {}
@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.engine import make_url
+
+from app.core.config import Settings
+from app.core.db_pool import InstrumentedQueuePool, engine_pool_kwargs, pool_report, pool_sizing
+
+
+def test_pool_sizing_splits_connection_budget_per_worker_and_engine():
+    assert pool_sizing(Settings(web_concurrency=1, web_threads=40, db_max_connections=150)) == (40, 35)
+    assert pool_sizing(Settings(web_concurrency=4, web_threads=40, db_max_connections=150)) == (18, 0)
+    assert pool_sizing(Settings(db_pool_size=5, db_max_overflow=2)) == (5, 2)
+
+    kwargs = engine_pool_kwargs(Settings(), make_url("mysql+pymysql://u:p@db/app"))
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_recycle"] == 1800
+    assert kwargs["poolclass"] is InstrumentedQueuePool
+    assert engine_pool_kwargs(Settings(), make_url("sqlite:///./dev.db")) == {}
+
+
+def test_instrumented_pool_records_wait_and_saturation(tmp_path):
+    InstrumentedQueuePool.metrics.reset()
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        report = pool_report(engine.pool)["pools"][0]
+        assert (report["checkedOut"], report["saturation"]) == (1, 1.0)
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    report = pool_report(engine.pool)["pools"][0]
+    assert report["checkouts"] == 1
+    assert report["timeouts"] == 1
+    assert report["saturatedCheckouts"] == 1
+    assert report["checkedOut"] == 0
+    assert report["waitMaxMs"] >= 50
+    engine.dispose()
@@ -0,0 +1,35 @@
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.etag import ConditionalGetMiddleware, compute_etag, etag_matches
+
+app = FastAPI()
+app.add_middleware(ConditionalGetMiddleware)
+ETAG = compute_etag("static", 1)
+
+
+@app.get("/tagged")
+def tagged():
+    # conditional_json을 쓰지 않고 ETag만 단 응답
+    return Response(content=b'{"big":"body"}', media_type="application/json", headers={"ETag": ETAG, "X-Debug": "1"})
+
+
+client = TestClient(app)
+
+
+def test_etag_matching_follows_weak_comparison():
+    assert compute_etag("book", 1, 2) == compute_etag("book", 1, 2)
+    assert compute_etag("book", 1, 2) != compute_etag("book", 1, 3)
+    assert etag_matches(f'"other", W/{ETAG}', ETAG)
+    assert etag_matches("*", ETAG)
+    assert not etag_matches(None, ETAG)
+
+
+def test_middleware_turns_matching_get_into_304_without_body():
+    assert client.get("/tagged").status_code == 200
+    res = client.get("/tagged", headers={"If-None-Match": ETAG})
+    assert res.status_code == 304
+    assert res.content == b""
+    assert res.headers["etag"] == ETAG
+    assert "x-debug" not in res.headers
+    assert client.get("/tagged", headers={"If-None-Match": '"stale"'}).status_code == 200
@@ -1,22 +1,30 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
+import datetime
 import uuid
 from app.core.config import get_settings
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Base
 
 # Shared in-memory SQLite for this test module
+# async 엔드포인트(get_async_db)도 같은 메모리 DB를 보도록 이름 있는 shared-cache DB를 쓴다
+DB_URI = f"file:{__name__}?mode=memory&cache=shared&uri=true"
 engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{DB_URI}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=create_async_engine(f"sqlite+aiosqlite:///{DB_URI}", poolclass=NullPool),
+    expire_on_commit=False,
+)
 Base.metadata.create_all(bind=engine)
 
 settings = get_settings()
@@ -34,6 +42,13 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = override_get_async_db
 client = TestClient(app)
 
 
@@ -156,3 +171,151 @@ def test_reading_sessions_status_summary_and_analytics(auth_headers):
     assert a1.status_code == 201
     a2 = client.post("/analytics/views", json={"book_id": book_id}, headers=auth_headers)
     assert a2.status_code == 201
+
+
+def test_current_page_tracked_on_user_book(auth_headers):
+    rb = client.post(
+        "/books",
+        json={"title": "Resume", "authors": [], "total_pages": 300},
+        headers=auth_headers,
+    )
+    book_id = rb.json()["id"]
+    client.post("/reading-status/update", json={"book_id": book_id, "status": "READING"}, headers=auth_headers)
+
+    rs = client.post("/reading/sessions", json={"book_id": book_id, "start_page": 5}, headers=auth_headers)
+    session_id = rs.json()["id"]
+    client.post(
+        f"/reading/sessions/{session_id}/events",
+        json={"event_type": "PAGE_TURN", "page": 42},
+        headers=auth_headers,
+    )
+    client.post(f"/reading/sessions/{session_id}/end", json={"total_seconds": 60}, headers=auth_headers)
+
+    # start_page 미제공 → 마지막으로 기록된 페이지에서 이어 읽기
+    rs2 = client.post("/reading/sessions", json={"book_id": book_id}, headers=auth_headers)
+    assert rs2.status_code == 200
+    assert rs2.json()["start_page"] == 42
+
+    lib = client.get("/library/", params={"shelf": "reading"}, headers=auth_headers)
+    assert lib.status_code == 200
+    item = next(i for i in lib.json()["items"] if i["book"]["id"] == book_id)
+    assert item["current_page"] == 42
+
+
+def test_session_on_unshelved_book_does_not_create_user_book(auth_headers):
+    rb = client.post(
+        "/books",
+        json={"title": "Browse", "authors": [], "total_pages": 300},
+        headers=auth_headers,
+    )
+    book_id = rb.json()["id"]
+
+    rs = client.post("/reading/sessions", json={"book_id": book_id}, headers=auth_headers)
+    assert rs.json()["start_page"] == 1
+    session_id = rs.json()["id"]
+    client.post(
+        f"/reading/sessions/{session_id}/events",
+        json={"event_type": "PAGE_TURN", "page": 30},
+        headers=auth_headers,
+    )
+    client.post(f"/reading/sessions/{session_id}/end", json={"total_seconds": 60}, headers=auth_headers)
+
+    # 서재 행은 만들지 않지만 최근 세션에 남은 페이지에서 이어 읽는다
+    rs2 = client.post("/reading/sessions", json={"book_id": book_id}, headers=auth_headers)
+    assert rs2.json()["start_page"] == 30
+    lib = client.get("/library/", headers=auth_headers)
+    assert all(i["book"]["id"] != book_id for i in lib.json()["items"])
+
+
+def test_session_end_auto_completes_book(auth_headers):
+    rb = client.post(
+        "/books",
+        json={"title": "Finish", "authors": [], "total_pages": 200},
+        headers=auth_headers,
+    )
+    book_id = rb.json()["id"]
+    client.post("/reading-status/update", json={"book_id": book_id, "status": "READING"}, headers=auth_headers)
+
+    rs = client.post("/reading/sessions", json={"book_id": book_id, "start_page": 150}, headers=auth_headers)
+    session_id = rs.json()["id"]
+    re = client.post(
+        f"/reading/sessions/{session_id}/end",
+        json={"end_page": 200, "total_seconds": 600},
+        headers=auth_headers,
+    )
+    assert re.status_code == 200
+
+    completed = client.get("/library/", params={"shelf": "completed"}, headers=auth_headers)
+    assert book_id in [i["book"]["id"] for i in completed.json()["items"]]
+    reading = client.get("/library/", params={"shelf": "reading"}, headers=auth_headers)
+    assert book_id not in [i["book"]["id"] for i in reading.json()["items"]]
+
+
+def test_group_detail_mission_progress(auth_headers):
+    isbn = f"979{uuid.uuid4().int % 10**10:010d}"
+    rb = client.post(
+        "/books",
+        json={"title": "Mission", "authors": ["Writer"], "total_pages": 200, "isbn": isbn},
+        headers=auth_headers,
+    )
+    book = rb.json()
+    group_id = f"g{uuid.uuid4().hex[:8]}"
+    client.post("/groups", json={"name": "Mission Group", "groupId": group_id, "maxMembers": 10}, headers=auth_headers)
+    r = client.patch(f"/groups/{group_id}/mission-book", json={"isbn": isbn}, headers=auth_headers)
+    assert r.status_code == 200
+
+    rs = client.post("/reading/sessions", json={"book_id": book["id"], "start_page": 1}, headers=auth_headers)
+    client.post(f"/reading/sessions/{rs.json()['id']}/end", json={"end_page": 50, "total_seconds": 60}, headers=auth_headers)
+
+    detail = client.get(f"/groups/{group_id}", headers=auth_headers).json()
+    assert detail["currentMissionBook"]["myProgressPercent"] == 25.0
+    assert detail["currentMissionBook"]["groupAverageProgressPercent"] == 25.0
+    assert detail["currentMissionBook"]["authors"] == ["Writer"]
+    assert detail["members"][0]["missionProgressPercent"] == 25.0
+
+
+def test_group_recommendations_use_member_counter(auth_headers):
+    group_id = f"r{uuid.uuid4().hex[:8]}"
+    client.post("/groups", json={"name": "Rec Group", "groupId": group_id, "maxMembers": 10}, headers=auth_headers)
+    client.post(f"/groups/{group_id}/posts", json={"type": "FREE", "content": "hi"}, headers=auth_headers)
+
+    r = client.get("/groups/recommendations", params={"limit": 50}, headers=auth_headers)
+    assert r.status_code == 200
+    item = next(g for g in r.json()["groups"] if g["groupId"] == group_id)
+    assert item["memberCount"] == 1
+
+
+def test_conditional_get_for_book_library_and_calendar(auth_headers):
+    rb = client.post("/books", json={"title": "ETag 북", "authors": ["작가"]}, headers=auth_headers)
+    book_id = rb.json()["id"]
+
+    first = client.get(f"/books/{book_id}")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    again = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+    library = client.get("/library/?shelf=rated", headers=auth_headers)
+    library_etag = library.headers["etag"]
+    assert library.headers["cache-control"] == "private, no-cache"
+    assert client.get("/library/?shelf=rated", headers={**auth_headers, "If-None-Match": library_etag}).status_code == 304
+    # 다른 쿼리는 다른 ETag
+    assert client.get("/library/?shelf=reading", headers=auth_headers).headers["etag"] != library_etag
+
+    today = datetime.date.today()
+    calendar_url = f"/analytics/calendar-month?year={today.year}&month={today.month}"
+    calendar_etag = client.get(calendar_url, headers=auth_headers).headers["etag"]
+
+    # 별점을 남기면 책 평점 버전과 서재 버전이 올라가 세 응답 모두 새로 내려간다
+    rr = client.post("/reviews/", json={"book_id": book_id, "rating": 4.0}, headers=auth_headers)
+    assert rr.status_code == 200
+    changed = client.get(f"/books/{book_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["review_count"] == 1
+    changed_library = client.get("/library/?shelf=rated", headers={**auth_headers, "If-None-Match": library_etag})
+    assert changed_library.status_code == 200
+    assert [item["book"]["id"] for item in changed_library.json()["items"]] == [book_id]
+    changed_calendar = client.get(calendar_url, headers={**auth_headers, "If-None-Match": calendar_etag})
+    assert changed_calendar.status_code == 200
+    assert changed_calendar.json()["total_read_count"] == 1
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from app.models import Group, GroupComment, GroupMember, GroupPost, GroupPostType
+from app.services.counters import COUNTERS, reconcile_counters
+from app.services.group_activity import MEMBER_WEIGHT, bump_group_counter, refresh_group_activity
+
+NOW = datetime(2026, 10, 1, 12, 0, 0)
+
+
+def seed_group(db, owner, name, posted_days_ago=None):
+    group = Group(name=name)
+    db.add(group)
+    db.flush()
+    db.add(GroupMember(group_id=group.id, user_id=owner.id))
+    bump_group_counter(db, group.id, Group.member_count, 1)
+    if posted_days_ago is not None:
+        post = GroupPost(
+            group_id=group.id,
+            user_id=owner.id,
+            post_type=GroupPostType.FREE,
+            content="hi",
+            created_at=NOW - timedelta(days=posted_days_ago),
+        )
+        db.add(post)
+        db.flush()
+        db.add(GroupComment(post_id=post.id, user_id=owner.id, content="c", created_at=post.created_at))
+        bump_group_counter(db, group.id, Group.post_count, 1)
+        bump_group_counter(db, group.id, Group.comment_count, 1)
+    db.commit()
+    return group
+
+
+def test_refresh_only_touches_recently_active_groups_and_keeps_counters(db, make_user):
+    owner = make_user()
+    active = seed_group(db, owner, "active", posted_days_ago=0)
+    stale = seed_group(db, owner, "stale", posted_days_ago=200)
+    quiet = seed_group(db, owner, "quiet")
+
+    assert refresh_group_activity(db, now=NOW, batch_size=1) == 1
+
+    db.expire_all()
+    # 오늘 글 1개(2.0) + 댓글 1개(1.0) + 멤버 1명
+    assert db.get(Group, active.id).activity_score == 4.0
+    assert db.get(Group, active.id).activity_score_updated_at == NOW
+    for group in (db.get(Group, stale.id), db.get(Group, quiet.id)):
+        assert group.activity_score == MEMBER_WEIGHT * 1
+        assert group.activity_score_updated_at is None
+        assert group.post_count == (1 if group.id == stale.id else 0)
+
+
+def test_member_bump_moves_score_and_refresh_reads_current_member_count(db, make_user):
+    owner = make_user()
+    active = seed_group(db, owner, "active", posted_days_ago=0)
+    quiet = seed_group(db, owner, "quiet")
+
+    joiner = make_user()
+    for group in (active, quiet):
+        db.add(GroupMember(group_id=group.id, user_id=joiner.id))
+        bump_group_counter(db, group.id, Group.member_count, 1)
+    db.commit()
+
+    refresh_group_activity(db, now=NOW)
+
+    db.expire_all()
+    assert db.get(Group, active.id).activity_score == 5.0
+    assert db.get(Group, quiet.id).activity_score == MEMBER_WEIGHT * 2
+
+
+def test_group_counters_are_repaired_by_reconcile_job(db, make_user):
+    owner = make_user()
+    group = seed_group(db, owner, "drifted", posted_days_ago=1)
+    db.query(Group).update({Group.member_count: 9, Group.post_count: 0, Group.comment_count: 5})
+    db.commit()
+
+    specs = [spec for spec in COUNTERS if spec.model is Group]
+    fixed = reconcile_counters(db, specs, batch_size=10)
+
+    assert fixed == {"groups.member_count": 1, "groups.post_count": 1, "groups.comment_count": 1}
+    db.expire_all()
+    refreshed = db.get(Group, group.id)
+    assert (refreshed.member_count, refreshed.post_count, refreshed.comment_count) == (1, 1, 1)
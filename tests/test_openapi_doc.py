@@ -0,0 +1,30 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.openapi_doc import install_openapi
+
+
+def test_openapi_document_is_built_once_and_revalidated_by_etag():
+    docs_app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    builds = []
+
+    @docs_app.get("/items")
+    def items():
+        return []
+
+    def counting_openapi():
+        builds.append(1)
+        return {"openapi": "3.1.0", "info": {"title": "t", "version": "1"}, "paths": {"/items": {}}}
+
+    docs_app.openapi = counting_openapi
+    install_openapi(docs_app)
+    docs_client = TestClient(docs_app)
+
+    first = docs_client.get("/openapi.json")
+    assert first.status_code == 200
+    assert first.json()["paths"] == {"/items": {}}
+    assert first.headers["cache-control"].startswith("public")
+    second = docs_client.get("/openapi.json", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert len(builds) == 1
+    assert "/openapi.json" in docs_client.get("/docs").text
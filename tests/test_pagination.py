@@ -1,20 +1,28 @@
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
 from app.core.config import get_settings
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Base
+from app.services.tag_catalog import ensure_system_tags
 
+# async 엔드포인트(get_async_db)도 같은 메모리 DB를 보도록 이름 있는 shared-cache DB를 쓴다
+DB_URI = f"file:{__name__}?mode=memory&cache=shared&uri=true"
 engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{DB_URI}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=create_async_engine(f"sqlite+aiosqlite:///{DB_URI}", poolclass=NullPool),
+    expire_on_commit=False,
+)
 Base.metadata.create_all(bind=engine)
 
 settings = get_settings()
@@ -32,6 +40,13 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = override_get_async_db
 client = TestClient(app)
 
 
@@ -113,3 +128,279 @@ def test_pagination_lists():
     b2 = client.get(f"/bookmarks/books/{book_id}?limit=4&offset=4", headers=headers)
     assert b2.status_code == 200
     assert slice_pages(b2.json()) == [5]
+
+
+def test_library_cursor_pagination():
+    headers = auth_headers()
+    book_ids = []
+    for i in range(5):
+        r = client.post(
+            "/books",
+            json={"title": f"LibBook{i}", "authors": [], "total_pages": 100},
+            headers=headers,
+        )
+        book_ids.append(r.json()["id"])
+        client.post("/reading-status/update", json={"book_id": book_ids[-1], "status": "READING"}, headers=headers)
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"shelf": "reading", "sort": "title", "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get("/library/", params=params, headers=headers)
+        assert r.status_code == 200
+        body = r.json()
+        assert body["total"] == 5
+        seen.extend(i["book"]["title"] for i in body["items"])
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [f"LibBook{i}" for i in range(5)]
+
+    latest = client.get("/library/", params={"shelf": "reading", "limit": 3}, headers=headers).json()
+    rest = client.get(
+        "/library/", params={"shelf": "reading", "limit": 3, "cursor": latest["next_cursor"]}, headers=headers
+    ).json()
+    ids = [i["book"]["id"] for i in latest["items"] + rest["items"]]
+    assert sorted(ids) == sorted(book_ids)
+
+    bad = client.get("/library/", params={"shelf": "reading", "cursor": "not-a-cursor"}, headers=headers)
+    assert bad.status_code == 400
+
+
+def test_review_list_cursor_sorts_and_comment_counters():
+    book_id = create_book(auth_headers())
+    users = [auth_headers() for _ in range(4)]
+    review_ids = []
+    for headers, rating in zip(users, [3.0, None, 5.0, 4.0]):
+        payload = {"book_id": book_id, "rating": rating, "content": "good"}
+        review_ids.append(client.post("/reviews/", json=payload, headers=headers).json()["id"])
+    client.post(f"/reviews/{review_ids[0]}/like", headers=users[1])
+    client.post(f"/reviews/{review_ids[0]}/like", headers=users[2])
+    client.post(f"/reviews/{review_ids[3]}/like", headers=users[0])
+    c1 = client.post(f"/reviews/{review_ids[0]}/comments", json={"content": "a"}, headers=users[1]).json()["id"]
+    client.post(f"/reviews/{review_ids[0]}/comments", json={"content": "b"}, headers=users[2])
+    client.post(f"/reviews/{review_ids[2]}/comments", json={"content": "c"}, headers=users[0])
+    assert client.delete(f"/reviews/comments/{c1}", headers=users[1]).status_code == 204
+
+    def walk(sort):
+        seen, cursor = [], None
+        for _ in range(5):
+            params = {"sort": sort, "limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            r = client.get(f"/reviews/books/{book_id}", params=params, headers=users[0])
+            assert r.status_code == 200
+            seen.extend(r.json())
+            cursor = r.headers.get("x-next-cursor")
+            if not cursor:
+                break
+        return seen
+
+    latest = walk("latest")
+    assert [rv["id"] for rv in latest] == review_ids[::-1]
+    assert {rv["id"]: rv["comment_count"] for rv in latest} == {review_ids[0]: 1, review_ids[1]: 0, review_ids[2]: 1, review_ids[3]: 0}
+    assert {rv["book_comment_count"] for rv in latest} == {2}
+    assert {rv["user_comment_count"] for rv in latest} == {1}
+    assert [rv["id"] for rv in walk("like")] == [review_ids[0], review_ids[3], review_ids[2], review_ids[1]]
+    assert [rv["id"] for rv in walk("rating")] == [review_ids[2], review_ids[3], review_ids[0], review_ids[1]]
+    assert client.get(f"/reviews/books/{book_id}", params={"sort": "x"}, headers=users[0]).status_code == 400
+
+    assert client.delete(f"/reviews/{review_ids[0]}", headers=users[0]).status_code == 204
+    detail = client.get(f"/reviews/{review_ids[2]}", headers=users[0]).json()
+    assert (detail["comment_count"], detail["book_comment_count"]) == (1, 1)
+    # 지워진 리뷰에 달렸던 댓글은 작성자의 댓글 수에서도 빠진다
+    after = client.get(f"/reviews/books/{book_id}", headers=users[2]).json()
+    assert {rv["user_comment_count"] for rv in after} == {0}
+
+
+def test_group_posts_cursor_pagination():
+    headers = auth_headers()
+    group_id = f"pg{uuid.uuid4().hex[:8]}"
+    r = client.post("/groups", json={"name": "PagGroup", "groupId": group_id, "maxMembers": 10}, headers=headers)
+    assert r.status_code == 201
+    post_ids = []
+    for i in range(5):
+        r = client.post(f"/groups/{group_id}/posts", json={"type": "FREE", "content": f"post{i}"}, headers=headers)
+        assert r.status_code == 200
+        post_ids.append(r.json()["postId"])
+    client.post(f"/groups/posts/{post_ids[0]}/like", headers=headers)
+    client.post(f"/groups/posts/{post_ids[0]}/comments", json={"content": "c"}, headers=headers)
+
+    seen = []
+    cursor = None
+    for _ in range(10):
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        r = client.get(f"/groups/{group_id}/posts", params=params, headers=headers)
+        assert r.status_code == 200
+        body = r.json()
+        assert len(body["posts"]) <= 2
+        seen.extend(body["posts"])
+        cursor = body["nextCursor"]
+        if not cursor:
+            break
+    assert cursor is None
+    assert [p["postId"] for p in seen] == sorted(post_ids, reverse=True)
+    first = next(p for p in seen if p["postId"] == post_ids[0])
+    assert first["likeCount"] == 1 and first["isLiked"] is True and first["commentCount"] == 1
+    assert all(p["authorName"] == "G" for p in seen)
+
+
+def test_group_comment_thread_pagination():
+    headers = auth_headers()
+    group_id = f"pc{uuid.uuid4().hex[:8]}"
+    client.post("/groups", json={"name": "CommentGroup", "groupId": group_id, "maxMembers": 10}, headers=headers)
+    post_id = client.post(
+        f"/groups/{group_id}/posts", json={"type": "FREE", "content": "thread"}, headers=headers
+    ).json()["postId"]
+    comment_ids = [
+        client.post(f"/groups/posts/{post_id}/comments", json={"content": f"c{i}"}, headers=headers).json()["commentId"]
+        for i in range(3)
+    ]
+    for i in range(4):
+        client.post(f"/groups/comments/{comment_ids[0]}/replies", json={"content": f"r{i}"}, headers=headers)
+    client.post(f"/groups/comments/{comment_ids[0]}/like", headers=headers)
+    client.post(f"/groups/comments/{comment_ids[0]}/like", headers=headers)
+
+    first = client.get(f"/groups/posts/{post_id}/comments", params={"limit": 2, "replyLimit": 2}, headers=headers).json()
+    assert [c["commentId"] for c in first["comments"]] == comment_ids[:2]
+    top = first["comments"][0]
+    assert top["likeCount"] == 1 and top["isLiked"] is True
+    assert top["replyCount"] == 4
+    assert [r["content"] for r in top["replies"]] == ["r0", "r1"]
+
+    second = client.get(
+        f"/groups/posts/{post_id}/comments", params={"limit": 2, "cursor": first["nextCursor"]}, headers=headers
+    ).json()
+    assert [c["commentId"] for c in second["comments"]] == comment_ids[2:]
+    assert second["nextCursor"] is None
+
+    replies = client.get(f"/groups/comments/{comment_ids[0]}/replies", params={"limit": 3}, headers=headers).json()
+    assert [r["content"] for r in replies["replies"]] == ["r0", "r1", "r2"]
+    rest = client.get(
+        f"/groups/comments/{comment_ids[0]}/replies", params={"cursor": replies["nextCursor"]}, headers=headers
+    ).json()
+    assert [r["content"] for r in rest["replies"]] == ["r3"]
+
+    client.delete(f"/groups/comments/{comment_ids[0]}/like", headers=headers)
+    after = client.get(f"/groups/posts/{post_id}/comments", params={"limit": 1}, headers=headers).json()
+    assert after["comments"][0]["likeCount"] == 0
+
+
+def test_group_search_pagination():
+    headers = auth_headers()
+    prefix = f"srch{uuid.uuid4().hex[:6]}"
+    for i in range(3):
+        client.post("/groups", json={"name": f"{prefix} club {i}", "groupId": f"{prefix}{i}", "maxMembers": 10}, headers=headers)
+
+    first = client.get("/groups/search", params={"query": prefix, "limit": 2}, headers=headers).json()
+    assert len(first["groups"]) == 2
+    assert all(g["memberCount"] == 1 for g in first["groups"])
+    second = client.get(
+        "/groups/search", params={"query": prefix, "limit": 2, "cursor": first["nextCursor"]}, headers=headers
+    ).json()
+    assert second["nextCursor"] is None
+    names = {g["name"] for g in first["groups"] + second["groups"]}
+    assert names == {f"{prefix} club {i}" for i in range(3)}
+
+
+def test_public_collections_filters_and_cursor():
+    headers = auth_headers()
+    other = auth_headers()
+    marker = f"col{uuid.uuid4().hex[:6]}"
+    book = client.post("/books", json={"title": f"{marker} inside", "authors": []}, headers=headers).json()["id"]
+    tag_a, tag_b = f"{marker}a", f"{marker}b"
+
+    def create(title, tags, book_ids=()):
+        r = client.post(
+            "/collections",
+            json={"title": title, "tags": [{"name": t} for t in tags], "bookIds": list(book_ids)},
+            headers=headers,
+        )
+        assert r.status_code == 201
+        return r.json()["collectionId"]
+
+    both = create(f"{marker} both", [tag_a, tag_b])
+    only_a = create(f"{marker} only a", [tag_a])
+    by_book = create("plain title", [], [book])
+    client.post(f"/collections/{only_a}/like", headers=other)
+
+    liked = client.get("/collections", params={"query": marker, "limit": 1}, headers=headers).json()
+    assert [c["collectionId"] for c in liked["collections"]] == [only_a]
+    assert liked["collections"][0]["likeCount"] == 1
+    seen = [only_a]
+    cursor = liked["nextCursor"]
+    for _ in range(5):
+        if not cursor:
+            break
+        page = client.get("/collections", params={"query": marker, "limit": 1, "cursor": cursor}, headers=headers).json()
+        seen.extend(c["collectionId"] for c in page["collections"])
+        cursor = page["nextCursor"]
+    assert cursor is None
+    assert sorted(seen) == sorted([both, only_a, by_book])
+    book_hit = next(c for c in client.get("/collections", params={"query": marker}, headers=headers).json()["collections"] if c["collectionId"] == by_book)
+    assert book_hit["bookCount"] == 1
+
+    tag_ids = {
+        t["name"]: t["tagId"]
+        for t in client.get("/tags", params={"query": marker}, headers=headers).json()["tags"]
+    }
+    r = client.get("/collections", params={"tagIds": f"{tag_ids[tag_a]},{tag_ids[tag_b]}"}, headers=headers).json()
+    assert [c["collectionId"] for c in r["collections"]] == [both]
+    r = client.get("/collections", params={"query": f"@{tag_a}", "sort": "latest"}, headers=headers).json()
+    assert [c["collectionId"] for c in r["collections"]] == [only_a, both]
+
+
+def test_tag_catalog_prefix_search_and_new_tags():
+    # 다른 테스트 모듈이 get_db 오버라이드를 덮어쓸 수 있으므로 현재 앱이 쓰는 세션으로 시드한다
+    sessions = app.dependency_overrides[get_db]()
+    ensure_system_tags(next(sessions))
+    sessions.close()
+    headers = auth_headers()
+    categories = client.get("/tags/categories", headers=headers).json()["categories"]
+    assert {"감정", "장르"} <= {c["name"] for c in categories}
+    genre = client.get("/tags", params={"category": "장르", "limit": 100}, headers=headers).json()["tags"]
+    assert len(genre) == 21 and all(t["isSystem"] and t["categoryName"] == "장르" for t in genre)
+
+    marker = f"tg{uuid.uuid4().hex[:6]}"
+    r = client.post(
+        "/collections",
+        json={"title": "tags", "tags": [{"name": f"x{marker}"}, {"name": f"{marker}z", "categoryName": "감정"}]},
+        headers=headers,
+    )
+    assert r.status_code == 201
+    names = [t["name"] for t in client.get("/tags", params={"query": marker}, headers=headers).json()["tags"]]
+    assert names == [f"{marker}z", f"x{marker}"]
+    created = client.get("/tags", params={"query": f"{marker}z", "category": "감정"}, headers=headers).json()["tags"]
+    assert [(t["isSystem"], t["usageCount"]) for t in created] == [(False, 1)]
+    # 검색어가 없으면 사용 횟수 순, 같으면 이름순이고 사용되지 않은 태그도 채운다
+    popular = client.get("/tags", params={"category": "감정", "limit": 100}, headers=headers).json()["tags"]
+    assert f"{marker}z" in {t["name"] for t in popular} and len(popular) >= 14
+    assert popular == sorted(popular, key=lambda t: (-t["usageCount"], t["name"]))
+    assert {t["categoryName"] for t in popular} == {"감정"}
+    assert len(client.get("/tags", params={"limit": 5}, headers=headers).json()["tags"]) == 5
+
+
+def test_my_collections_bulk_serialization():
+    headers = auth_headers()
+    book_ids = [
+        client.post(
+            "/books", json={"title": f"Cover{i}", "authors": [], "thumbnail": f"http://img/{i}.jpg"}, headers=headers
+        ).json()["id"]
+        for i in range(6)
+    ]
+    full = client.post("/collections", json={"title": "Full", "bookIds": book_ids, "tags": [{"name": "힐링"}]}, headers=headers).json()["collectionId"]
+    empty = client.post("/collections", json={"title": "Empty"}, headers=headers).json()["collectionId"]
+
+    r = client.get("/users/me/collections", params={"bookId": book_ids[0]}, headers=headers)
+    assert r.status_code == 200
+    items = {c["collectionId"]: c for c in r.json()["collections"]}
+    assert items[full]["thumbnailCovers"] == [f"http://img/{i}.jpg" for i in range(5)]
+    assert items[full]["bookCount"] == 6
+    assert items[full]["tags"] == ["힐링"]
+    assert items[full]["hasBook"] is True
+    assert items[empty]["hasBook"] is False
+    assert items[empty]["thumbnailCovers"] == []
@@ -1,20 +1,27 @@
 import uuid
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
 from app.core.config import get_settings
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Base
 
+# async 엔드포인트(get_async_db)도 같은 메모리 DB를 보도록 이름 있는 shared-cache DB를 쓴다
+DB_URI = f"file:{__name__}?mode=memory&cache=shared&uri=true"
 engine = create_engine(
-    "sqlite://",
+    f"sqlite:///{DB_URI}",
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+AsyncTestingSessionLocal = async_sessionmaker(
+    bind=create_async_engine(f"sqlite+aiosqlite:///{DB_URI}", poolclass=NullPool),
+    expire_on_commit=False,
+)
 Base.metadata.create_all(bind=engine)
 
 settings = get_settings()
@@ -32,6 +39,13 @@ def override_get_db():
         db.close()
 
 app.dependency_overrides[get_db] = override_get_db
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = override_get_async_db
 client = TestClient(app)
 
 
@@ -0,0 +1,119 @@
+import uuid
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import sessionmaker
+
+from app.models import (
+    Base,
+    Book,
+    ReadingEvent,
+    ReadingEventType,
+    ReadingSession,
+    User,
+    UserBook,
+    UserPage,
+)
+from app.services.reading_compaction import (
+    close_stale_sessions,
+    compact_closed_sessions,
+    purge_compacted_events,
+)
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+
+def fresh_db():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    return TestingSessionLocal()
+
+
+def seed_session(db, *, ended_days_ago: int, pages: list[int], ended: bool = True):
+    suffix = uuid.uuid4().hex[:8]
+    user = User(email=f"c_{suffix}@example.com", login_id=f"c_{suffix}", password_hash="x", name="C", nickname="C")
+    book = Book(title="CompactBook", total_pages=300)
+    db.add_all([user, book])
+    db.flush()
+    db.add(UserBook(user_id=user.id, book_id=book.id))
+    end_time = datetime.utcnow() - timedelta(days=ended_days_ago)
+    start_time = end_time - timedelta(minutes=30)
+    session = ReadingSession(
+        user_id=user.id,
+        book_id=book.id,
+        start_time=start_time,
+        end_time=end_time if ended else None,
+        start_page=pages[0],
+        end_page=pages[-1] if ended else None,
+        total_seconds=1800 if ended else None,
+    )
+    db.add(session)
+    db.flush()
+    db.add(ReadingEvent(session_id=session.id, event_type=ReadingEventType.START, page=pages[0], occurred_at=start_time))
+    for idx, page in enumerate(pages[1:], start=1):
+        db.add(ReadingEvent(
+            session_id=session.id,
+            event_type=ReadingEventType.PAGE_TURN,
+            page=page,
+            occurred_at=start_time + timedelta(minutes=idx),
+        ))
+    db.commit()
+    return session
+
+
+def test_compaction_folds_page_turns_and_purges_after_retention():
+    db = fresh_db()
+    try:
+        old = seed_session(db, ended_days_ago=60, pages=[10, 11, 12, 15])
+        recent = seed_session(db, ended_days_ago=1, pages=[1, 2, 3])
+
+        assert compact_closed_sessions(db) == 2
+        db.refresh(old)
+        assert old.page_turn_count == 3
+        assert old.max_page == 15
+        assert old.last_page == 15
+        assert old.events_compacted_at is not None
+
+        ub = db.query(UserBook).filter(UserBook.user_id == old.user_id).one()
+        page = db.query(UserPage).filter(UserPage.user_book_id == ub.id).one()
+        assert (page.start_page, page.end_page, page.reading_seconds) == (10, 15, 1800)
+
+        # 이미 압축된 세션은 다시 접지 않는다
+        assert compact_closed_sessions(db) == 0
+
+        purge_compacted_events(db, retention_days=30)
+        assert db.query(ReadingEvent).filter(ReadingEvent.session_id == old.id).count() == 0
+        assert db.query(ReadingEvent).filter(ReadingEvent.session_id == recent.id).count() == 3
+    finally:
+        db.close()
+
+
+def test_stale_open_sessions_are_closed_compacted_and_purged():
+    db = fresh_db()
+    try:
+        stale = seed_session(db, ended_days_ago=60, pages=[5, 6, 9], ended=False)
+        active = seed_session(db, ended_days_ago=1, pages=[1, 2], ended=False)
+
+        assert close_stale_sessions(db, retention_days=30) == 1
+        db.refresh(stale)
+        db.refresh(active)
+        assert stale.end_page == 9
+        assert stale.end_time == stale.start_time + timedelta(minutes=2)
+        assert active.end_time is None
+
+        assert compact_closed_sessions(db) == 1
+        db.refresh(stale)
+        assert stale.last_page == 9
+        assert stale.events_compacted_at is not None
+
+        assert purge_compacted_events(db, retention_days=30, batch_size=2) == 3
+        assert db.query(ReadingEvent).filter(ReadingEvent.session_id == stale.id).count() == 0
+        assert db.query(ReadingEvent).filter(ReadingEvent.session_id == active.id).count() == 2
+    finally:
+        db.close()
@@ -0,0 +1,84 @@
+import json
+
+from app.api.review import get_book_rating_summary
+from app.core.response_cache import MemoryBackend, RedisBackend, ResponseCache, set_response_cache
+from app.models import Book, Review, UserBook
+
+
+def test_shared_backend_invalidates_other_process_copies():
+    backend = MemoryBackend()
+    api_a = ResponseCache(100, 60, backend)
+    api_b = ResponseCache(100, 60, backend)
+    calls = []
+
+    def produce():
+        calls.append(1)
+        return {"items": [{"id": 7}], "n": len(calls)}
+
+    def extra(value):
+        return [f"book:{item['id']}" for item in value["items"]]
+
+    body, hit = api_a.get_or_set("bestseller", ["booklist:bestseller_all"], produce, extra_tags=extra)
+    assert (json.loads(body)["n"], hit) == (1, False)
+    # 다른 프로세스는 공유 백엔드의 항목을 그대로 쓴다
+    assert api_b.get_or_set("bestseller", ["booklist:bestseller_all"], produce, extra_tags=extra)[1] is True
+    assert len(calls) == 1
+
+    # 결과에 담긴 책 태그로도 무효화된다 (worker에서 무효화 -> 두 API 프로세스 모두 재계산)
+    ResponseCache(100, 60, backend).invalidate("book:7")
+    body, hit = api_a.get_or_set("bestseller", ["booklist:bestseller_all"], produce, extra_tags=extra)
+    assert (json.loads(body)["n"], hit) == (2, False)
+    assert api_b.get_or_set("bestseller", ["booklist:bestseller_all"], produce, extra_tags=extra)[1] is True
+
+
+def test_unreachable_redis_serves_uncached_and_commits_succeed(db):
+    # 아무것도 듣지 않는 포트: 연결이 즉시 거부된다
+    cache = ResponseCache(100, 60, RedisBackend("redis://127.0.0.1:1/0"))
+    calls = []
+
+    def produce():
+        calls.append(1)
+        return {"n": len(calls)}
+
+    assert cache.get_or_set("k", ["booklist:new_all"], produce) == (b'{"n":1}', False)
+    assert cache.get_or_set("k", ["booklist:new_all"], produce) == (b'{"n":2}', False)
+    cache.invalidate("booklist:new_all")
+
+    set_response_cache(cache)
+    try:
+        db.add(Book(title="WrittenWhileRedisDown"))
+        db.commit()
+        assert db.query(Book).filter(Book.title == "WrittenWhileRedisDown").count() == 1
+    finally:
+        set_response_cache(None)
+
+
+def test_review_commit_invalidates_book_summary(db, make_user):
+    set_response_cache(ResponseCache(100, 60))
+    try:
+        user = make_user()
+        book = Book(title="CachedBook")
+        db.add(book)
+        db.flush()
+        user_book = UserBook(user_id=user.id, book_id=book.id)
+        db.add(user_book)
+        db.commit()
+
+        first = get_book_rating_summary(book.id, db)
+        assert first.headers["X-Cache"] == "MISS"
+        assert json.loads(first.body)["review_count"] == 0
+        assert get_book_rating_summary(book.id, db).headers["X-Cache"] == "HIT"
+
+        db.add(Review(user_book_id=user_book.id, user_id=user.id, book_id=book.id, rating=4.5))
+        db.commit()
+        after = get_book_rating_summary(book.id, db)
+        assert after.headers["X-Cache"] == "MISS"
+        assert json.loads(after.body) == {"book_id": book.id, "average_rating": 4.5, "review_count": 1}
+
+        # 롤백된 변경은 무효화하지 않는다
+        db.add(Review(user_book_id=user_book.id, user_id=user.id, book_id=book.id, rating=1.0))
+        db.flush()
+        db.rollback()
+        assert get_book_rating_summary(book.id, db).headers["X-Cache"] == "HIT"
+    finally:
+        set_response_cache(None)
@@ -0,0 +1,35 @@
+import asyncio
+import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import FastJSONResponse, model_response
+from app.schemas.collection import CollectionListItem, CollectionListResponse
+
+
+def _payload() -> CollectionListResponse:
+    item = CollectionListItem(
+        collectionId=1,
+        title="한글 제목",
+        userName="독자",
+        thumbnailCovers=["https://example.com/a.jpg"],
+        bookCount=3,
+        likeCount=0,
+        tags=["소설"],
+        isLiked=False,
+        updatedAt=datetime.datetime(2024, 1, 2, 3, 4, 5, 678000),
+    )
+    return CollectionListResponse(totalCount=1, collections=[item])
+
+
+def test_fast_paths_render_same_bytes_as_fastapi_default():
+    payload = _payload()
+    field = create_model_field(name="Response", type_=CollectionListResponse, mode="serialization")
+    content = asyncio.run(serialize_response(field=field, response_content=payload, is_coroutine=True))
+    expected = JSONResponse(content=content).body
+
+    assert FastJSONResponse(content=content).body == expected
+    assert model_response(payload).body == expected
+    assert model_response(payload).headers["content-type"] == "application/json"
@@ -5,11 +5,20 @@ from time import sleep
 from datetime import datetime, timedelta, timezone
 from sqlalchemy.orm import Session
 
+from app.core.config import get_settings
 from app.database import SessionLocal
 from app.models import AIJob, AIJobStatus, AIJobType, Book, FCMToken, Group, GroupMember, GroupPost, NotificationType, ReadingSession, ReadingStatus, ReadingSummaryStatus, User, UserBook
 from app.services.notify import create_notification
 from app.services.aladin_recommend_sync import sync_aladin_recommendation_lists
+from app.services.badges import process_badge_evaluation_queue
+from app.services.counters import reconcile_counters
+from app.services.group_activity import refresh_group_activity
 from app.services.openai_summary import generate_reading_summary
+from app.services.reading_compaction import (
+    close_stale_sessions,
+    compact_closed_sessions,
+    purge_compacted_events,
+)
 from app.services.reading_summary import (
     SUMMARY_TARGET_TYPE,
     collect_summary_inputs,
@@ -347,6 +356,41 @@ def process_aladin_recommendation_lists(db: Session):
         print(f"[worker] synced Aladin recommendation lists: {result}")
 
 
+def process_reading_event_compaction(db: Session):
+    closed = close_stale_sessions(db)
+    compacted = compact_closed_sessions(db)
+    purged = purge_compacted_events(db)
+    if closed or compacted or purged:
+        print(f"[worker] closed stale sessions={closed} compacted reading sessions={compacted} purged events={purged}")
+
+
+def process_badge_evaluations(db: Session):
+    users = process_badge_evaluation_queue(db)
+    if users:
+        print(f"[worker] evaluated badges users={users}")
+
+
+def process_group_activity(db: Session):
+    refreshed = refresh_group_activity(db)
+    if refreshed:
+        print(f"[worker] refreshed group activity groups={refreshed}")
+
+
+_last_counter_reconcile_at: datetime | None = None
+
+
+def process_counter_reconciliation(db: Session):
+    global _last_counter_reconcile_at
+    now = datetime.now(timezone.utc)
+    interval = timedelta(minutes=get_settings().counter_reconcile_interval_minutes)
+    if _last_counter_reconcile_at and now - _last_counter_reconcile_at < interval:
+        return
+    fixed = reconcile_counters(db)
+    _last_counter_reconcile_at = now
+    if fixed:
+        print(f"[worker] reconciled counters: {fixed}")
+
+
 def main_loop():
     while True:
         db = SessionLocal()
@@ -354,7 +398,11 @@ def main_loop():
             process_aladin_recommendation_lists(db)
             process_summary_auto_queue(db)
             process_ai_jobs(db)
+            process_reading_event_compaction(db)
+            process_badge_evaluations(db)
             process_group_discussion_deadlines(db)
+            process_group_activity(db)
+            process_counter_reconciliation(db)
             process_reading_reports(db)
             slump_notified_users = process_reading_slumps(db)
             process_reading_reminders(db, skip_user_ids=slump_notified_users)